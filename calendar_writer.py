@@ -0,0 +1,342 @@
+# calendar_writer.py
+"""학습 일정 -> 캘린더 일괄 반영 (결정적 이벤트 ID, 차이만 전송, 배치 요청)
+
+- 일정 전체를 메모리에서 이벤트로 만든 뒤, 캘린더에 있는 같은 계획(plan_id)의 이벤트와 비교해
+  새로 만들/바꿀/지울 이벤트만 보냄. 같은 입력으로 다시 실행하면 아무 요청도 보내지 않음
+- 이벤트 ID는 (plan_id, 날짜)의 해시라서 재실행해도 같은 날짜는 같은 이벤트를 가리킴
+  (Google Calendar 이벤트 ID 규칙: base32hex 소문자)
+- 변경은 batch_size개씩 묶어 한 번의 배치 요청으로 보내고, 속도 제한/일시 오류는
+  지터를 넣은 지수 백오프로 재시도
+- 백엔드: Google Calendar API, 로컬 SQLite (테스트/벤치마크용 대역)
+
+이벤트 형식:
+    {'id': '...', 'summary': '영어 학습', 'description': '...',
+     'start': '2024-03-04T18:00', 'end': '2024-03-04T18:20', 'status': 'confirmed'}
+"""
+import base64
+import hashlib
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from googleapiclient.errors import HttpError
+
+from src.utils.rate_limiter import TokenBucketRateLimiter
+
+# 비교에 쓰는 이벤트 필드
+EVENT_FIELDS = ('summary', 'description', 'start', 'end', 'status')
+# 재시도할 HTTP 상태 (속도 제한 / 서버 오류, 403은 속도 제한일 때만)
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# (동작, 이벤트) - 동작은 insert / update / delete
+Operation = Tuple[str, Dict[str, Any]]
+
+
+def plan_key(family_id: str, child_id: str, plan_name: str = 'default') -> str:
+    """가족/아이/계획 이름 -> 캘린더 계획 ID ('family-1/child-1/default')
+
+    같은 캘린더를 여러 가족이 함께 쓰므로 이벤트 ID와 조회 범위가 가족/아이마다 갈라지도록
+    계획 ID에 항상 가족과 아이를 넣는다.
+    """
+    parts = (family_id, child_id, plan_name)
+    if any(not part or '/' in part for part in parts):
+        raise ValueError(f"family_id, child_id, plan_name은 비어 있거나 '/'를 포함할 수 없습니다: {parts}")
+    return '/'.join(parts)
+
+
+def event_id(plan_id: str, day: str) -> str:
+    """(계획, 날짜) -> 결정적 이벤트 ID"""
+    digest = hashlib.sha1(f"{plan_id}:{day}".encode('utf-8')).digest()
+    return base64.b32hexencode(digest).decode('ascii').lower().rstrip('=')
+
+
+def build_events(plan_id: str, sessions: List[Dict[str, Any]], summary: str = '영어 학습',
+                 description: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """최적화 결과의 sessions(date, start, end, energy_score) -> {이벤트 ID: 이벤트}"""
+    events = {}
+    for session in sessions:
+        identifier = event_id(plan_id, session['date'])
+        events[identifier] = {
+            'id': identifier,
+            'summary': summary,
+            'description': description or f"에너지 점수 {session['energy_score']}",
+            'start': f"{session['date']}T{session['start']}",
+            'end': f"{session['date']}T{session['end']}",
+            'status': 'confirmed'
+        }
+    return events
+
+
+class SQLiteCalendarBackend:
+    """Google Calendar 대신 쓰는 SQLite 캘린더
+
+    Google처럼 지운 이벤트는 'cancelled' 상태로 남는다. request_latency를 주면
+    요청(목록 조회 / 배치)마다 그만큼 기다려 네트워크 왕복을 흉내 낸다.
+    """
+
+    def __init__(self, db_path: str, request_latency: float = 0.0):
+        self.db_path = db_path
+        self.request_latency = request_latency
+        self.requests = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS events (
+                calendar_id TEXT NOT NULL,
+                event_id TEXT NOT NULL,
+                plan_id TEXT NOT NULL,
+                summary TEXT,
+                description TEXT,
+                start TEXT NOT NULL,
+                end TEXT NOT NULL,
+                status TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (calendar_id, event_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_events_plan ON events (calendar_id, plan_id, start);
+            """
+        )
+        self._conn.commit()
+
+    def _request(self):
+        self.requests += 1
+        if self.request_latency:
+            time.sleep(self.request_latency)
+
+    def list_events(self, calendar_id: str, plan_id: str, time_min: str) -> Dict[str, Dict[str, Any]]:
+        """time_min 이후에 시작하는 계획의 이벤트 (취소된 이벤트 포함)"""
+        self._request()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT event_id, summary, description, start, end, status FROM events "
+                "WHERE calendar_id = ? AND plan_id = ? AND start >= ?",
+                (calendar_id, plan_id, time_min)
+            ).fetchall()
+        return {row[0]: dict(zip(('id',) + EVENT_FIELDS, row)) for row in rows}
+
+    def execute_batch(self, calendar_id: str, plan_id: str, operations: List[Operation]) -> List[Operation]:
+        """배치 요청 1번 -> 실패한 작업 (SQLite에서는 없음)"""
+        self._request()
+        now = time.time()
+        with self._lock:
+            for action, event in operations:
+                if action == 'delete':
+                    self._conn.execute(
+                        "UPDATE events SET status = 'cancelled', updated_at = ? WHERE calendar_id = ? AND event_id = ?",
+                        (now, calendar_id, event['id'])
+                    )
+                else:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO events "
+                        "(calendar_id, event_id, plan_id, summary, description, start, end, status, updated_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (calendar_id, event['id'], plan_id, *(event[field] for field in EVENT_FIELDS), now)
+                    )
+            self._conn.commit()
+        return []
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class GoogleCalendarBackend:
+    """Google Calendar API v3 백엔드 (배치 요청, 계획 ID는 비공개 확장 속성으로 저장)
+
+    service는 googleapiclient.discovery.build('calendar', 'v3', ...) 결과.
+    httplib2 기반 클라이언트는 스레드 안전하지 않아 요청을 잠금으로 직렬화한다.
+    """
+
+    def __init__(self, service, time_zone: str = 'Asia/Seoul',
+                 rate_limiter: Optional[TokenBucketRateLimiter] = None):
+        self.service = service
+        self.time_zone = time_zone
+        self.rate_limiter = rate_limiter
+        self.requests = 0
+        self.logger = logging.getLogger(__name__)
+        self._zone = ZoneInfo(time_zone)
+        self._lock = threading.Lock()
+
+    def _local_time(self, value: Dict[str, str]) -> str:
+        """API의 시각(오프셋 포함) -> 캘린더 시간대의 'YYYY-MM-DDTHH:MM'"""
+        if 'dateTime' not in value:
+            return value.get('date', '')
+        moment = datetime.fromisoformat(value['dateTime'].replace('Z', '+00:00'))
+        if moment.tzinfo is not None:
+            moment = moment.astimezone(self._zone).replace(tzinfo=None)
+        return moment.isoformat(timespec='minutes')
+
+    def list_events(self, calendar_id: str, plan_id: str, time_min: str) -> Dict[str, Dict[str, Any]]:
+        events = {}
+        page_token = None
+        time_min = datetime.fromisoformat(time_min).replace(tzinfo=self._zone).isoformat()
+        with self._lock:
+            while True:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+                response = self.service.events().list(
+                    calendarId=calendar_id, timeMin=time_min, showDeleted=True, singleEvents=True,
+                    privateExtendedProperty=f"plan_id={plan_id}", maxResults=2500, pageToken=page_token
+                ).execute()
+                self.requests += 1
+                for item in response.get('items', []):
+                    events[item['id']] = {
+                        'id': item['id'],
+                        'summary': item.get('summary'),
+                        'description': item.get('description'),
+                        'start': self._local_time(item.get('start', {})),
+                        'end': self._local_time(item.get('end', {})),
+                        'status': item.get('status', 'confirmed')
+                    }
+                page_token = response.get('nextPageToken')
+                if not page_token:
+                    return events
+
+    def _body(self, plan_id: str, event: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'id': event['id'],
+            'summary': event['summary'],
+            'description': event['description'],
+            'start': {'dateTime': f"{event['start']}:00", 'timeZone': self.time_zone},
+            'end': {'dateTime': f"{event['end']}:00", 'timeZone': self.time_zone},
+            'status': event['status'],
+            'extendedProperties': {'private': {'plan_id': plan_id}}
+        }
+
+    @staticmethod
+    def _is_rate_limited(error: HttpError) -> bool:
+        """403 rateLimitExceeded / userRateLimitExceeded 응답인지 확인"""
+        if error.resp.status != 403:
+            return False
+        content = error.content.decode('utf-8', 'ignore') if isinstance(error.content, bytes) else str(error.content)
+        return 'RateLimitExceeded' in content or 'rateLimitExceeded' in content
+
+    def execute_batch(self, calendar_id: str, plan_id: str, operations: List[Operation]) -> List[Operation]:
+        """배치 요청 1번 -> 실패한 작업 (재시도할 수 있는 것만, 나머지는 로그로 남김)"""
+        failed: List[Operation] = []
+
+        def callback(request_id: str, response: Any, exception: Optional[HttpError]):
+            if exception is None:
+                return
+            action, event = operations[int(request_id)]
+            status = exception.resp.status
+            if action == 'insert' and status == 409:
+                # 지웠던(cancelled) 이벤트의 ID는 다시 insert할 수 없어 update로 복원
+                failed.append(('update', event))
+            elif status in _RETRYABLE_STATUS or self._is_rate_limited(exception):
+                failed.append((action, event))
+            elif action == 'delete' and status == 410:
+                pass  # 이미 지워짐
+            else:
+                self.logger.error(f"❌ 캘린더 {action} 실패 ({event['id']}): {exception}")
+
+        events = self.service.events()
+        batch = self.service.new_batch_http_request(callback=callback)
+        for index, (action, event) in enumerate(operations):
+            if action == 'insert':
+                request = events.insert(calendarId=calendar_id, body=self._body(plan_id, event))
+            elif action == 'update':
+                request = events.update(calendarId=calendar_id, eventId=event['id'], body=self._body(plan_id, event))
+            else:
+                request = events.delete(calendarId=calendar_id, eventId=event['id'])
+            batch.add(request, request_id=str(index))
+
+        with self._lock:
+            if self.rate_limiter is not None:
+                # 배치 안의 요청도 각각 할당량에 잡히므로 작업 수만큼, 버킷 용량 단위로 나눠 받음
+                remaining = len(operations)
+                while remaining:
+                    tokens = min(remaining, self.rate_limiter.capacity)
+                    self.rate_limiter.acquire(tokens)
+                    remaining -= tokens
+            batch.execute()
+            self.requests += 1
+        return failed
+
+    def close(self):
+        pass
+
+
+class CalendarWriter:
+    """원하는 이벤트 목록과 캘린더의 차이만 배치로 반영
+
+    사용 예:
+        writer = CalendarWriter(SQLiteCalendarBackend('data/calendar.sqlite3'))
+        plan_id = plan_key('family-1', 'child-1')
+        events = build_events(plan_id, result['sessions'])
+        writer.sync('primary', plan_id, events, time_min='2024-03-04T00:00')
+    """
+
+    def __init__(self, backend, batch_size: int = 50, max_retries: int = 5, base_delay: float = 1.0,
+                 max_delay: float = 32.0):
+        self.backend = backend
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def diff(desired: Dict[str, Dict[str, Any]], existing: Dict[str, Dict[str, Any]]) -> List[Operation]:
+        """만들/바꿀/지울 작업 목록 (이미 같은 이벤트와 이미 취소된 이벤트는 건너뜀)"""
+        operations: List[Operation] = []
+        for identifier, event in desired.items():
+            current = existing.get(identifier)
+            if current is None:
+                operations.append(('insert', event))
+            elif any(current.get(field) != event[field] for field in EVENT_FIELDS):
+                operations.append(('update', event))
+        for identifier, current in existing.items():
+            if identifier not in desired and current.get('status') != 'cancelled':
+                operations.append(('delete', current))
+        return operations
+
+    def sync(self, calendar_id: str, plan_id: str, events: Dict[str, Dict[str, Any]],
+             time_min: str) -> Dict[str, int]:
+        """time_min 이후의 계획 이벤트를 events와 같게 맞춤 -> 작업 건수 통계
+
+        time_min 이전의 이벤트(지난 학습)는 건드리지 않는다.
+        """
+        requests_before = self.backend.requests
+        existing = self.backend.list_events(calendar_id, plan_id, time_min)
+        operations = self.diff(events, existing)
+        stats = {
+            'inserted': sum(1 for action, _ in operations if action == 'insert'),
+            'updated': sum(1 for action, _ in operations if action == 'update'),
+            'deleted': sum(1 for action, _ in operations if action == 'delete'),
+            'unchanged': len(events) - sum(1 for action, _ in operations if action != 'delete'),
+            'failed': 0
+        }
+
+        attempt = 0
+        while operations:
+            failed: List[Operation] = []
+            for start in range(0, len(operations), self.batch_size):
+                failed.extend(self.backend.execute_batch(calendar_id, plan_id,
+                                                         operations[start:start + self.batch_size]))
+            if not failed:
+                break
+            attempt += 1
+            if attempt > self.max_retries:
+                stats['failed'] = len(failed)
+                self.logger.error(f"❌ 캘린더 반영 실패 {len(failed)}건 ({plan_id}, {attempt}회 시도)")
+                break
+            time.sleep(random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1))))
+            operations = failed
+
+        stats['requests'] = self.backend.requests - requests_before
+        self.logger.info(f"📅 캘린더 반영 ({plan_id}): 추가 {stats['inserted']} / 변경 {stats['updated']} / "
+                         f"삭제 {stats['deleted']} / 유지 {stats['unchanged']} (요청 {stats['requests']}번)")
+        return stats
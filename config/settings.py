@@ -11,12 +11,60 @@ class Settings:
     MAX_VIDEOS_PER_KEYWORD = int(os.getenv('MAX_VIDEOS_PER_KEYWORD', 25))
     MAX_CHANNELS_TO_ANALYZE = int(os.getenv('MAX_CHANNELS_TO_ANALYZE', 10))
     MIN_QUALITY_SCORE = int(os.getenv('MIN_QUALITY_SCORE', 50))
+    # 유사 중복(재업로드) 판정 기준 Jaccard 유사도, 0이면 사용 안 함
+    NEAR_DUPLICATE_THRESHOLD = float(os.getenv('NEAR_DUPLICATE_THRESHOLD', 0.6))
+    
+    # 동시성 / 속도 제한 설정
+    MAX_WORKERS = int(os.getenv('MAX_WORKERS', 4))
+    API_REQUESTS_PER_SECOND = float(os.getenv('API_REQUESTS_PER_SECOND', 5))
+    API_BURST = int(os.getenv('API_BURST', 5))
     
     # 디렉토리 설정
     DATA_DIR = "data"
     RAW_DATA_DIR = f"{DATA_DIR}/raw"
     PROCESSED_DATA_DIR = f"{DATA_DIR}/processed"
     EXPORTS_DIR = f"{DATA_DIR}/exports"
+    CACHE_DIR = f"{DATA_DIR}/cache"
+    
+    # API 응답 캐시 설정
+    API_CACHE_ENABLED = os.getenv('API_CACHE_ENABLED', 'true').lower() == 'true'
+    API_CACHE_PATH = os.getenv('API_CACHE_PATH', f"{CACHE_DIR}/api_cache.sqlite3")
+    
+    # 영상 데이터 저장 방식 (files / sqlite / both)
+    STORAGE_BACKEND = os.getenv('STORAGE_BACKEND', 'files')
+    CATALOG_DB_PATH = os.getenv('CATALOG_DB_PATH', f"{DATA_DIR}/catalog.sqlite3")
+    
+    # 증분 수집 상태 (본 영상 ID / 키워드·채널별 워터마크)
+    COLLECTION_STATE_PATH = os.getenv('COLLECTION_STATE_PATH', f"{DATA_DIR}/collection_state.sqlite3")
+    
+    # 쿼터 설정 (YouTube Data API 기본 일일 한도 10,000 units)
+    QUOTA_DAILY_LIMIT = int(os.getenv('QUOTA_DAILY_LIMIT', 10000))
+    QUOTA_LEDGER_PATH = os.getenv('QUOTA_LEDGER_PATH', f"{DATA_DIR}/quota_ledger.json")
+    SEARCH_PHASE_QUOTA = int(os.getenv('SEARCH_PHASE_QUOTA', 3000))
+    CHANNEL_PHASE_QUOTA = int(os.getenv('CHANNEL_PHASE_QUOTA', 500))
+    
+    # 학습 일정 결과 캐시 (경로를 비우면 메모리에만 보관)
+    SOLUTION_CACHE_SIZE = int(os.getenv('SOLUTION_CACHE_SIZE', 10000))
+    SOLUTION_CACHE_PATH = os.getenv('SOLUTION_CACHE_PATH', f"{CACHE_DIR}/solution_cache.sqlite3")
+    
+    # 학습 알림 예약 저장소 / 발송 주기 (초)
+    REMINDER_DB_PATH = os.getenv('REMINDER_DB_PATH', f"{DATA_DIR}/reminders.sqlite3")
+    REMINDER_TICK_SECONDS = float(os.getenv('REMINDER_TICK_SECONDS', 1))
+    
+    # 알림 채널 (비워 두면 해당 채널을 쓰지 않음, log 채널은 항상 사용 가능)
+    NOTIFICATION_WEBHOOK_URL = os.getenv('NOTIFICATION_WEBHOOK_URL')
+    SMTP_HOST = os.getenv('SMTP_HOST')
+    SMTP_PORT = int(os.getenv('SMTP_PORT', 25))
+    SMTP_USERNAME = os.getenv('SMTP_USERNAME')
+    SMTP_PASSWORD = os.getenv('SMTP_PASSWORD')
+    SMTP_USE_TLS = os.getenv('SMTP_USE_TLS', 'false').lower() == 'true'
+    SMTP_SENDER = os.getenv('SMTP_SENDER', 'noreply@localhost')
+    
+    # 학습 일정 캘린더 (Google 인증 토큰이 없으면 로컬 SQLite 캘린더 사용)
+    GOOGLE_CALENDAR_TOKEN_PATH = os.getenv('GOOGLE_CALENDAR_TOKEN_PATH', 'config/google_token.json')
+    CALENDAR_ID = os.getenv('CALENDAR_ID', 'primary')
+    CALENDAR_TIMEZONE = os.getenv('CALENDAR_TIMEZONE', 'Asia/Seoul')
+    CALENDAR_DB_PATH = os.getenv('CALENDAR_DB_PATH', f"{DATA_DIR}/calendar.sqlite3")
     
     # 로깅 설정
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
@@ -0,0 +1,146 @@
+# mcp_content_server.py
+"""수집한 콘텐츠를 메모리에 올려 두고 제공하는 서버
+
+최신 MCP 내보내기(또는 SQLite 카탈로그)를 시작할 때 한 번 로드하고,
+/admin/reload 또는 주기적 확인으로 새 데이터가 생기면 스냅샷을 통째로 교체한다.
+
+실행: python mcp_content_server.py --port 8080 [--source sqlite] [--watch-interval 60]
+"""
+import argparse
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import uvicorn
+from fastapi import FastAPI, Header, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response
+
+from config.settings import settings
+from src.utils.content_catalog import ContentCatalog, ContentSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더(여러 값, W/ 약한 비교, *)가 ETag와 일치하는지"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*' or candidate.removeprefix('W/') == etag:
+            return True
+    return False
+
+
+def _require_snapshot(catalog: ContentCatalog) -> ContentSnapshot:
+    snapshot = catalog.snapshot
+    if snapshot is None:
+        raise HTTPException(status_code=503, detail="콘텐츠가 아직 로드되지 않았습니다")
+    return snapshot
+
+
+def create_app(catalog: ContentCatalog, watch_interval: float = 0) -> FastAPI:
+    """콘텐츠 서버 앱 (watch_interval > 0이면 그 간격으로 새 데이터 확인)"""
+
+    async def watch():
+        while True:
+            await asyncio.sleep(watch_interval)
+            try:
+                await run_in_threadpool(catalog.load_latest)
+            except Exception as e:
+                logger.error(f"❌ 콘텐츠 재로드 실패: {e}")
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        if catalog.snapshot is None:
+            await run_in_threadpool(catalog.load_latest)
+        watcher = asyncio.create_task(watch()) if watch_interval > 0 else None
+        yield
+        if watcher is not None:
+            watcher.cancel()
+
+    app = FastAPI(title="Kids English Content Server", lifespan=lifespan)
+
+    # 캐시된 페이지와 항목 조회는 이벤트 루프에서 바로 응답하고, 검색은 스레드풀에서 실행해
+    # 느린 검색어가 다른 요청을 막지 않게 한다. 각 요청은 시작할 때 읽은 스냅샷 하나로만 응답한다
+    @app.get("/content")
+    async def list_content(
+        q: str = '',
+        page: int = Query(1, ge=1),
+        page_size: int = Query(20, ge=1, le=100),
+        min_duration: Optional[float] = None,
+        max_duration: Optional[float] = None,
+        min_quality: Optional[float] = None,
+        level1_only: bool = False,
+        if_none_match: Optional[str] = Header(None)
+    ):
+        """검색어/조건으로 거른 콘텐츠 페이지 (검색어가 없으면 품질 점수순)"""
+        snapshot = _require_snapshot(catalog)
+        key = snapshot.page_key(q, page, page_size, min_duration, max_duration, min_quality, level1_only)
+        etag = snapshot.page_etag(key)
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+        body = snapshot.cached_page(key)
+        if body is None:
+            body = await run_in_threadpool(snapshot.render_page, key)
+        return Response(body, media_type='application/json', headers=headers)
+
+    @app.get("/content/{content_id}")
+    async def get_content(content_id: str, if_none_match: Optional[str] = Header(None)):
+        snapshot = _require_snapshot(catalog)
+        item = snapshot.items_by_id.get(content_id)
+        if item is None:
+            raise HTTPException(status_code=404, detail=f"콘텐츠를 찾을 수 없습니다: {content_id}")
+        etag = snapshot.item_etag(content_id)
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+        return JSONResponse(item, headers=headers)
+
+    @app.get("/health")
+    async def health():
+        snapshot = catalog.snapshot
+        if snapshot is None:
+            return JSONResponse({'status': 'loading'}, status_code=503)
+        return {
+            'status': 'ok',
+            'version': snapshot.version,
+            'source': snapshot.source,
+            'content_count': len(snapshot),
+            'loaded_at': snapshot.loaded_at
+        }
+
+    @app.post("/admin/reload")
+    async def reload(force: bool = False):
+        """최신 데이터로 스냅샷 교체 (로드 중에도 기존 스냅샷으로 계속 응답)"""
+        reloaded = await run_in_threadpool(catalog.load_latest, force)
+        snapshot = _require_snapshot(catalog)
+        return {'reloaded': reloaded, 'version': snapshot.version, 'content_count': len(snapshot)}
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MCP 콘텐츠 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--source', choices=['exports', 'sqlite'], default='exports',
+                        help="exports: 최신 mcp_content_*.json, sqlite: 카탈로그 DB")
+    parser.add_argument('--exports-dir', default=settings.EXPORTS_DIR, help="MCP 내보내기 디렉토리")
+    parser.add_argument('--watch-interval', type=float, default=0,
+                        help="새 데이터 확인 간격(초), 0이면 /admin/reload 호출 시에만 교체")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=getattr(logging, settings.LOG_LEVEL),
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    catalog = ContentCatalog(source=args.source, exports_dir=args.exports_dir, db_path=settings.CATALOG_DB_PATH)
+    uvicorn.run(create_app(catalog, args.watch_interval), host=args.host, port=args.port,
+                log_level=settings.LOG_LEVEL.lower(), access_log=False)
+
+
+if __name__ == "__main__":
+    main()
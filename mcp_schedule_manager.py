@@ -1,10 +1,95 @@
 # mcp_schedule_manager.py
-from mcp import Server
+try:
+    from mcp.server.fastmcp import FastMCP
+except ImportError:  # mcp 2.x에서는 MCPServer로 이름이 바뀜
+    from mcp.server.mcpserver import MCPServer as FastMCP
+import asyncio
 import datetime
+import os
+from contextlib import asynccontextmanager
+from typing import Optional
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 
-app = FastMCP("Kids English Study Planning")
+from calendar_writer import CalendarWriter, GoogleCalendarBackend, SQLiteCalendarBackend, build_events, plan_key
+from config.settings import settings
+from notification_fanout import LogSink, NotificationFanout, SmtpSink, WebhookSink
+from reminder_dispatcher import ReminderDispatcher
+from schedule_optimizer import LearningScheduleOptimizer
+from solution_cache import SolutionCache
+from time_slot_engine import TimeSlotEngine
+
+
+
+def _notification_sinks() -> dict:
+    """설정된 알림 채널 (log는 항상 사용 가능)"""
+    sinks = {'log': LogSink()}
+    if settings.NOTIFICATION_WEBHOOK_URL:
+        sinks['webhook'] = WebhookSink(settings.NOTIFICATION_WEBHOOK_URL)
+    if settings.SMTP_HOST:
+        sinks['email'] = SmtpSink(settings.SMTP_HOST, settings.SMTP_PORT, settings.SMTP_SENDER,
+                                  settings.SMTP_USERNAME, settings.SMTP_PASSWORD, settings.SMTP_USE_TLS)
+    return sinks
+
+
+def _calendar_backend():
+    """Google 인증 토큰이 있으면 Google Calendar, 없으면 로컬 SQLite 캘린더"""
+    token_path = settings.GOOGLE_CALENDAR_TOKEN_PATH
+    if token_path and os.path.exists(token_path):
+        credentials = Credentials.from_authorized_user_file(
+            token_path, ['https://www.googleapis.com/auth/calendar.events']
+        )
+        service = build('calendar', 'v3', credentials=credentials, cache_discovery=False)
+        return GoogleCalendarBackend(service, settings.CALENDAR_TIMEZONE)
+    return SQLiteCalendarBackend(settings.CALENDAR_DB_PATH)
+
+
+# 서버가 시작할 때 lifespan에서 만듦 (모듈을 import만 해도 SQLite 파일이 생기지 않도록)
+reminder_dispatcher: Optional[ReminderDispatcher] = None
+notification_fanout: Optional[NotificationFanout] = None
+solution_cache: Optional[SolutionCache] = None
+time_slot_engine: Optional[TimeSlotEngine] = None
+schedule_optimizer: Optional[LearningScheduleOptimizer] = None
+calendar_writer: Optional[CalendarWriter] = None
+
+
+def _build_services():
+    """알림 저장소, 결과 캐시, 캘린더를 열고 최적화기를 만듦"""
+    global reminder_dispatcher, notification_fanout, solution_cache, time_slot_engine
+    global schedule_optimizer, calendar_writer
+
+    reminder_dispatcher = ReminderDispatcher(settings.REMINDER_DB_PATH, tick_seconds=settings.REMINDER_TICK_SECONDS,
+                                             deferred_results=True)
+    # 채널별 발송기가 알림마다 최종 결과(보냄/버림)를 알림 저장소에 기록
+    notification_fanout = NotificationFanout(_notification_sinks(), on_result=reminder_dispatcher.report)
+    reminder_dispatcher.sender = notification_fanout.submit_threadsafe
+
+    # 비슷한 일정을 보내는 가족이 많아 정규화한 요청 단위로 결과를 재사용
+    solution_cache = SolutionCache(settings.SOLUTION_CACHE_SIZE, settings.SOLUTION_CACHE_PATH or None)
+    time_slot_engine = TimeSlotEngine(cache=solution_cache)
+    schedule_optimizer = LearningScheduleOptimizer(engine=time_slot_engine, cache=solution_cache)
+    calendar_writer = CalendarWriter(_calendar_backend())
+
+
+@asynccontextmanager
+async def lifespan(server):
+    """서버가 떠 있는 동안 예약한 알림을 채널별 발송기로 넘김"""
+    _build_services()
+    await notification_fanout.start()
+    reminder_dispatcher.start()
+    try:
+        yield {}
+    finally:
+        # 진행 중인 tick은 이 이벤트 루프에 알림을 넣으므로 루프를 막지 않고 끝나기를 기다림
+        await asyncio.to_thread(reminder_dispatcher.shutdown)
+        # 남은 알림의 최종 결과까지 기록한 뒤 저장소를 닫음
+        await notification_fanout.close()
+        reminder_dispatcher.close()
+        solution_cache.close()
+        calendar_writer.backend.close()
+
+
+app = FastMCP("Kids English Study Planning", lifespan=lifespan)
 
 @app.tool()
 async def find_optimal_learning_time(
@@ -12,26 +97,89 @@ async def find_optimal_learning_time(
     child_energy_pattern: dict,
     learning_duration: int = 20
 ) -> dict:
-    """가족 일정과 아이의 컨디션을 고려한 최적 학습 시간 추천"""
-    # 일정 최적화 알고리즘
-    pass
+    """가족 일정과 아이의 컨디션을 고려한 최적 학습 시간 추천
+
+    입력 형식은 time_slot_engine 모듈 설명 참고. 요일별 최적 시간대와
+    에너지 점수가 높은 순의 추천 목록을 반환한다.
+    """
+    return time_slot_engine.recommend(family_schedule, child_energy_pattern, learning_duration)
+
+@app.resource("metrics://solution-cache")
+def solution_cache_metrics() -> dict:
+    """학습 일정 결과 캐시 적중률 등 통계"""
+    return solution_cache.get_stats()
 
 @app.tool()
 async def create_learning_schedule(
     start_date: str,
     duration_weeks: int,
-    daily_session_length: int
+    daily_session_length: int,
+    family_id: str,
+    child_id: str,
+    family_schedule: dict = None,
+    child_energy_pattern: dict = None,
+    plan_name: str = "default",
+    sessions_per_week: int = 7,
+    calendar_id: str = ""
 ) -> dict:
-    """체계적인 학습 일정 생성 및 캘린더 등록"""
-    # Google Calendar API 연동
-    pass
+    """체계적인 학습 일정 생성 및 캘린더 등록
+
+    start_date부터 duration_weeks주 동안 주 sessions_per_week회까지 학습 시간을 골라
+    캘린더에 반영한다. 계획은 (family_id, child_id, plan_name)으로 구분하며, 같은 계획을
+    다시 실행하면 바뀐 날짜만 추가/변경/삭제한다. 다른 가족/아이의 이벤트는 건드리지 않는다.
+    """
+    plan_id = plan_key(family_id, child_id, plan_name)
+    constraints = {
+        'family_schedule': family_schedule or {},
+        'child_energy_pattern': child_energy_pattern,
+        'session_minutes': daily_session_length,
+        'weeks': duration_weeks,
+        'start_date': start_date,
+        'max_sessions_per_week': sessions_per_week
+    }
+
+    def plan_and_write():
+        plan = schedule_optimizer.optimize_weekly_schedule(constraints)
+        if plan['status'] not in ('optimal', 'feasible'):
+            # 일정이 없거나(infeasible) 풀지 못했으면(timeout/error) 빈 일정으로 동기화해
+            # 기존 이벤트를 지우지 않도록 캘린더는 그대로 둠
+            return plan, None
+        events = build_events(plan_id, plan['sessions'])
+        calendar = calendar_writer.sync(calendar_id or settings.CALENDAR_ID, plan_id, events,
+                                        time_min=f"{start_date}T00:00")
+        return plan, calendar
+
+    # 최적화와 캘린더 요청은 블로킹이라 스레드에서 실행
+    plan, calendar = await asyncio.to_thread(plan_and_write)
+    return {
+        'plan_id': plan_id,
+        'status': plan['status'],
+        'sessions': plan['sessions'],
+        'weekly_sessions': plan['weekly_sessions'],
+        'calendar': calendar
+    }
 
 @app.tool()
 async def send_learning_reminder(
     reminder_time: str,
     message: str,
-    notification_type: str
+    notification_type: str,
+    recipient: str = ""
 ) -> bool:
-    """학습 시간 알림 발송"""
-    # 다중 채널 알림 시스템
-    pass
+    """학습 시간 알림 발송
+
+    reminder_time(ISO 형식, 예: '2024-03-04T18:00')에 발송하도록 예약한다.
+    예약은 저장소에 남으므로 서버를 다시 시작해도 발송되며, 같은 알림을 두 번 보내지 않는다.
+    notification_type은 log, webhook(설정 시), email(설정 시) 중 하나이고
+    recipient는 채널별 수신자 (웹훅 수신자 ID, 메일 주소)
+    """
+    if notification_type not in notification_fanout.channels:
+        raise ValueError(f"지원하지 않는 알림 채널: {notification_type} "
+                         f"(가능: {', '.join(notification_fanout.channels)})")
+    reminder_dispatcher.schedule(reminder_time, message, notification_type, recipient or None)
+    return True
+
+@app.resource("metrics://notifications")
+def notification_metrics() -> dict:
+    """알림 발송 통계 (발송/병합/재시도/포기 건수, 채널별 대기 건수)"""
+    return notification_fanout.get_stats()
@@ -0,0 +1,336 @@
+# reminder_dispatcher.py
+"""학습 알림 예약/발송 (SQLite 작업 저장소 + 가까운 구간만 담는 최소 힙)
+
+- 모든 알림은 SQLite에 저장하고, 메모리 힙에는 window_seconds 안에 발송할 (시각, ID)만 올린다.
+  수십만 건을 예약해도 시작할 때는 가까운 구간만 읽고, 발송은 힙에서 꺼내는 O(log n)
+- 구간이 절반 이상 지나면 다음 구간을 부분 인덱스(status = 'pending')로 이어서 읽음
+- 발송 전에 status를 'claimed'로 바꿔 커밋한 뒤 보내고, 보낸 뒤 'sent'로 기록.
+  보내는 도중 프로세스가 죽으면 재시작할 때 'claimed' 상태의 알림을 다시 보내지 않고
+  'failed'로 정리한다 (최대 한 번 발송)
+- deferred_results이면 sender는 알림을 넘겨받기만 하고('queued'), 최종 결과('sent'/'failed')는
+  나중에 report()로 알려 준다 (notification_fanout처럼 배치로 보내는 발송기). 결과를 받기 전에
+  프로세스가 죽으면 'queued' 상태도 재시작할 때 'failed'로 정리
+- sender가 SenderUnavailable을 던지면 (발송기가 멈췄거나 대기열이 가득 참) 그 알림부터는
+  'pending'으로 되돌리고 다음 tick에 다시 보냄
+- 테이블은 (due_at, id)로 클러스터링(WITHOUT ROWID)해서 같은 tick에 발송하는 알림의
+  상태 변경이 몇 페이지 안에 모이도록 함
+- 취소한 알림은 힙에서 지우지 않고, 선점(claim) 단계에서 건너뜀
+- 저장소 하나에는 발송기 프로세스 하나만 붙인다 (ID 발급과 중단 알림 정리를 프로세스 안에서 함)
+- start()는 APScheduler BackgroundScheduler로 tick()을 주기적으로 실행
+"""
+import heapq
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from apscheduler.schedulers.background import BackgroundScheduler
+
+# SQLite 바인딩 변수 한도 안에서 한 번에 선점/기록할 알림 수
+_CLAIM_CHUNK = 500
+
+
+class SenderUnavailable(Exception):
+    """sender가 지금은 알림을 받을 수 없음 (알림은 대기 상태로 남아 다음 tick에 다시 시도)"""
+
+
+def to_timestamp(value: Any) -> float:
+    """ISO 문자열/datetime/epoch 초 -> epoch 초 (시간대가 없으면 로컬 시각으로 해석)"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.timestamp()
+
+
+class ReminderDispatcher:
+    """예약한 학습 알림을 정해진 시각에 sender로 넘기는 발송기
+
+    사용 예:
+        dispatcher = ReminderDispatcher('data/reminders.sqlite3', sender=notify)
+        dispatcher.start()
+        dispatcher.schedule('2024-03-04T18:00', '오늘의 파닉스 시간이에요!', 'push')
+
+    sender(reminder)는 {'id', 'due_at', 'message', 'notification_type', 'recipient'}를 받아
+    예외 없이 끝나면 발송 성공으로 기록한다. deferred_results이면 'queued'로 기록하고
+    최종 결과는 report()로 받는다.
+    """
+
+    def __init__(self, db_path: str, sender: Optional[Callable[[Dict[str, Any]], Any]] = None,
+                 window_seconds: float = 3600.0, tick_seconds: float = 1.0,
+                 misfire_grace_seconds: Optional[float] = None, retention_days: int = 30,
+                 clock: Callable[[], float] = time.time, deferred_results: bool = False):
+        self.db_path = db_path
+        self.sender = sender or self._log_sender
+        self.deferred_results = deferred_results
+        self.window_seconds = window_seconds
+        self.tick_seconds = tick_seconds
+        self.misfire_grace_seconds = misfire_grace_seconds
+        self.retention_days = retention_days
+        self.clock = clock
+        self.logger = logging.getLogger(__name__)
+
+        self._heap: List[Tuple[float, int]] = []
+        self._horizon = float('-inf')  # 이 시각 전의 대기 알림은 모두 힙에 있음
+        self._lock = threading.Lock()
+        self._tick_lock = threading.Lock()
+        self._scheduler: Optional[BackgroundScheduler] = None
+        self.stats = {'scheduled': 0, 'queued': 0, 'sent': 0, 'failed': 0, 'expired': 0, 'requeued': 0,
+                      'recovered': 0}
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA cache_size=-65536")  # 예약 시각이 제각각인 삽입이 트리 곳곳을 건드림
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS reminders (
+                due_at REAL NOT NULL,
+                id INTEGER NOT NULL,
+                message TEXT NOT NULL,
+                notification_type TEXT NOT NULL,
+                recipient TEXT,
+                status TEXT NOT NULL DEFAULT 'pending',
+                created_at REAL NOT NULL,
+                claimed_at REAL,
+                finished_at REAL,
+                error TEXT,
+                PRIMARY KEY (due_at, id)
+            ) WITHOUT ROWID;
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_reminders_id ON reminders (id);
+            CREATE INDEX IF NOT EXISTS idx_reminders_pending ON reminders (due_at) WHERE status = 'pending';
+            """
+        )
+        self._conn.commit()
+        self._next_id = self._conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM reminders").fetchone()[0]
+        self._recover()
+
+    def _recover(self):
+        """발송 도중 중단된 알림 정리 후 가까운 구간을 힙에 적재"""
+        now = self.clock()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE reminders SET status = 'failed', finished_at = ?, error = 'interrupted' "
+                "WHERE status IN ('claimed', 'queued')", (now,)
+            )
+            self._conn.commit()
+        if cursor.rowcount:
+            self.stats['recovered'] += cursor.rowcount
+            self.logger.warning(f"⚠️ 발송 중 중단된 알림 {cursor.rowcount}건은 중복 발송을 막기 위해 실패로 기록")
+        self._refill(now)
+        self.logger.info(f"⏰ 알림 {len(self._heap)}건 적재 (~{datetime.fromtimestamp(self._horizon):%Y-%m-%d %H:%M})")
+
+    def _refill(self, now: float):
+        """[이전 구간 끝, now + window_seconds) 의 대기 알림을 힙에 추가"""
+        with self._lock:
+            horizon = now + self.window_seconds
+            rows = self._conn.execute(
+                "SELECT due_at, id FROM reminders WHERE status = 'pending' AND due_at >= ? AND due_at < ?",
+                (self._horizon, horizon)
+            ).fetchall()
+            if self._heap:
+                for row in rows:
+                    heapq.heappush(self._heap, row)
+            else:
+                self._heap = rows
+                heapq.heapify(self._heap)
+            self._horizon = horizon
+
+    def schedule(self, due_at: Any, message: str, notification_type: str = 'push',
+                 recipient: Optional[str] = None) -> int:
+        """알림 1건 예약 -> 알림 ID"""
+        return self.schedule_many([(due_at, message, notification_type, recipient)])[0]
+
+    def schedule_many(self, reminders: Iterable[Tuple[Any, str, str, Optional[str]]]) -> List[int]:
+        """(due_at, message, notification_type, recipient) 여러 건을 한 트랜잭션으로 예약 -> 알림 ID 목록"""
+        now = self.clock()
+        rows = [(to_timestamp(due_at), message, notification_type, recipient, now)
+                for due_at, message, notification_type, recipient in reminders]
+        if not rows:
+            return []
+        with self._lock:
+            ids = list(range(self._next_id, self._next_id + len(rows)))
+            # 발송 시각순으로 넣어 클러스터 인덱스의 같은 페이지 삽입을 모음
+            self._conn.executemany(
+                "INSERT INTO reminders (id, due_at, message, notification_type, recipient, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                sorted(((reminder_id, *row) for reminder_id, row in zip(ids, rows)), key=lambda row: row[1])
+            )
+            self._conn.commit()
+            self._next_id += len(rows)
+            for reminder_id, row in zip(ids, rows):
+                if row[0] < self._horizon:
+                    heapq.heappush(self._heap, (row[0], reminder_id))
+        self.stats['scheduled'] += len(rows)
+        return ids
+
+    def cancel(self, reminder_id: int) -> bool:
+        """아직 발송하지 않은 알림 취소"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE reminders SET status = 'cancelled', finished_at = ? WHERE id = ? AND status = 'pending'",
+                (self.clock(), reminder_id)
+            )
+            self._conn.commit()
+        return cursor.rowcount > 0
+
+    def tick(self, now: Optional[float] = None) -> int:
+        """시각이 된 알림 발송 -> sender에 넘긴 건수 (deferred_results가 아니면 발송 성공 건수)"""
+        now = self.clock() if now is None else now
+        with self._tick_lock:
+            if now + self.window_seconds / 2 >= self._horizon:
+                self._refill(now)
+
+            due: List[Tuple[float, int]] = []
+            with self._lock:
+                while self._heap and self._heap[0][0] <= now:
+                    due.append(heapq.heappop(self._heap))
+
+            sent = 0
+            for start in range(0, len(due), _CLAIM_CHUNK):
+                chunk = [reminder_id for _, reminder_id in due[start:start + _CLAIM_CHUNK]]
+                count, unavailable = self._dispatch(chunk, now)
+                sent += count
+                if unavailable:
+                    # 남은 알림은 다음 tick에 다시 (선점하지 않았으므로 힙에만 되돌림)
+                    with self._lock:
+                        for entry in due[start + _CLAIM_CHUNK:]:
+                            heapq.heappush(self._heap, entry)
+                    break
+            return sent
+
+    def _dispatch(self, ids: List[int], now: float) -> Tuple[int, bool]:
+        """선점한 알림 발송 -> (sender에 넘긴 건수, sender가 SenderUnavailable로 멈췄는지)"""
+        # 선점을 커밋한 뒤에 발송해야 재시작해도 두 번 보내지 않음
+        # (SQLite 3.40의 WITHOUT ROWID 테이블은 RETURNING에서 정수 열을 실수로 돌려줘 CAST)
+        with self._lock:
+            claimed = self._conn.execute(
+                f"UPDATE reminders SET status = 'claimed', claimed_at = ? "
+                f"WHERE status = 'pending' AND id IN ({','.join('?' * len(ids))}) "
+                f"RETURNING CAST(id AS INTEGER), due_at, message, notification_type, recipient",
+                (now, *ids)
+            ).fetchall()
+            self._conn.commit()
+
+        handed_off = 'queued' if self.deferred_results else 'sent'
+        finished: Dict[str, List[int]] = {handed_off: [], 'failed': [], 'expired': []}
+        errors: List[Tuple[str, int]] = []
+        requeue: List[Tuple[float, int]] = []
+        for index, (reminder_id, due_at, message, notification_type, recipient) in enumerate(claimed):
+            if self.misfire_grace_seconds is not None and now - due_at > self.misfire_grace_seconds:
+                finished['expired'].append(reminder_id)
+                continue
+            try:
+                self.sender({
+                    'id': reminder_id,
+                    'due_at': due_at,
+                    'message': message,
+                    'notification_type': notification_type,
+                    'recipient': recipient
+                })
+                finished[handed_off].append(reminder_id)
+            except SenderUnavailable as e:
+                self.logger.warning(f"⏸️ 발송기를 쓸 수 없어 알림 {len(claimed) - index}건을 다음 tick으로 미룸: {e}")
+                requeue = [(row[1], row[0]) for row in claimed[index:]]
+                break
+            except Exception as e:
+                self.logger.error(f"❌ 알림 발송 실패 (ID {reminder_id}): {e}")
+                finished['failed'].append(reminder_id)
+                errors.append((str(e), reminder_id))
+
+        with self._lock:
+            for status, finished_ids in finished.items():
+                if finished_ids:
+                    # report()가 먼저 기록한 최종 결과는 덮어쓰지 않음
+                    self._conn.execute(
+                        f"UPDATE reminders SET status = ?, finished_at = ? "
+                        f"WHERE status = 'claimed' AND id IN ({','.join('?' * len(finished_ids))})",
+                        (status, now, *finished_ids)
+                    )
+                    self.stats[status] += len(finished_ids)
+            if errors:
+                self._conn.executemany("UPDATE reminders SET error = ? WHERE id = ? AND status = 'failed'", errors)
+            if requeue:
+                self._conn.execute(
+                    f"UPDATE reminders SET status = 'pending', claimed_at = NULL "
+                    f"WHERE id IN ({','.join('?' * len(requeue))})",
+                    [reminder_id for _, reminder_id in requeue]
+                )
+                for entry in requeue:
+                    heapq.heappush(self._heap, entry)
+                self.stats['requeued'] += len(requeue)
+            self._conn.commit()
+        return len(finished[handed_off]), bool(requeue)
+
+    def report(self, results: Iterable[Tuple[Optional[int], str, Optional[str]]]):
+        """deferred_results일 때 sender가 알려 주는 최종 결과 (알림 ID, 'sent' 또는 'failed', 오류)
+
+        이미 'failed'로 기록한 알림도 나중에 'sent'가 오면 고쳐 쓴다 (넘기는 도중 시간 초과 등).
+        결과가 tick이 'queued'를 기록하기 전에 올 수도 있어 'claimed' 상태도 갱신한다.
+        """
+        now = self.clock()
+        rows = [(status, now, error, reminder_id) for reminder_id, status, error in results
+                if reminder_id is not None]
+        if not rows:
+            return
+        with self._lock:
+            for row in rows:
+                cursor = self._conn.execute(
+                    "UPDATE reminders SET status = ?, finished_at = ?, error = ? "
+                    "WHERE id = ? AND status IN ('claimed', 'queued', 'failed')", row
+                )
+                if cursor.rowcount:
+                    self.stats[row[0]] += 1
+            self._conn.commit()
+
+    def purge(self, older_than_days: Optional[int] = None) -> int:
+        """발송/실패/만료/취소 후 보관 기간이 지난 알림 삭제 -> 삭제 건수"""
+        cutoff = self.clock() - (older_than_days if older_than_days is not None else self.retention_days) * 86400
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM reminders WHERE due_at < ? AND finished_at < ? "
+                "AND status IN ('sent', 'failed', 'expired', 'cancelled')", (cutoff, cutoff)
+            )
+            self._conn.commit()
+        if cursor.rowcount:
+            self.logger.info(f"🧹 지난 알림 {cursor.rowcount}건 삭제")
+        return cursor.rowcount
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM reminders WHERE status = 'pending'").fetchone()[0]
+
+    def start(self):
+        """백그라운드에서 tick_seconds마다 발송, 하루마다 지난 알림 정리"""
+        if self._scheduler is not None:
+            return
+        # tick마다 남는 APScheduler 실행 로그는 숨김
+        logging.getLogger('apscheduler.executors.default').setLevel(logging.WARNING)
+        self._scheduler = BackgroundScheduler()
+        self._scheduler.add_job(self.tick, 'interval', seconds=self.tick_seconds, id='reminder_tick',
+                                max_instances=1, coalesce=True)
+        self._scheduler.add_job(self.purge, 'interval', days=1, id='reminder_purge',
+                                max_instances=1, coalesce=True)
+        self._scheduler.start()
+        self.logger.info(f"🚀 알림 발송기 시작 ({self.tick_seconds}초 간격)")
+
+    def shutdown(self):
+        """백그라운드 발송 중지 (진행 중인 tick은 끝날 때까지 기다림)"""
+        if self._scheduler is not None:
+            self._scheduler.shutdown(wait=True)
+            self._scheduler = None
+            self.logger.info("🛑 알림 발송기 중지")
+
+    def close(self):
+        self.shutdown()
+        with self._lock:
+            self._conn.close()
+
+    def _log_sender(self, reminder: Dict[str, Any]):
+        self.logger.info(f"🔔 [{reminder['notification_type']}] {reminder['message']}")
@@ -1,15 +1,308 @@
 # schedule_optimizer.py
+import threading
+import time
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
 from ortools.linear_solver import pywraplp
-import pandas as pd
+
+from time_slot_engine import TimeSlotEngine, DAYS
+
+if TYPE_CHECKING:
+    from solution_cache import SolutionCache
+
+_EPSILON = 1e-6
+
 
 class LearningScheduleOptimizer:
-    def __init__(self):
-        self.solver = pywraplp.Solver.CreateSolver('SCIP')
-    
-    def optimize_weekly_schedule(self, constraints):
-        """제약 조건을 고려한 주간 학습 일정 최적화"""
-        # - 아이의 집중력이 높은 시간대
-        # - 부모의 가용 시간
-        # - 기존 가족 일정과의 충돌 방지
-        # - 학습 연속성 고려
-        pass
+    """여러 주에 걸친 학습 일정 최적화
+
+    날마다 time_slot_engine으로 구한 요일별 최적 시간대의 에너지 점수를
+    그날 학습의 가치로 두고, 주별 학습 횟수/연속 학습 일수/연속 휴식 일수
+    제약 안에서 가치 합이 최대가 되는 날들을 고른다.
+
+    - 주별 상위 k일 선택(탐욕)은 연속 제약을 뺀 완화 문제의 최적해이므로
+      그 값이 상한이 된다. 연속 제약을 만족하면 바로 최적해로 반환
+    - 어기면 같은 주 안의 교환으로 보정하고, 보정한 해가 상한과 같으면 최적
+    - 그래도 최적을 증명하지 못할 때만 MIP를 풀며, 보정한 해를 힌트로 넘김
+    - MIP 솔버는 처음 필요할 때 만들고 이후 Clear()로 재사용 (잠금으로 직렬화)
+    - cache(SolutionCache)를 주면 정규화한 제약이 같은 요청은 풀지 않고 저장된 결과를 반환
+    """
+
+    def __init__(self, solver_name: str = 'SCIP', time_limit_seconds: float = 10.0,
+                 engine: Optional[TimeSlotEngine] = None, cache: Optional['SolutionCache'] = None):
+        self.solver_name = solver_name
+        self.time_limit_seconds = time_limit_seconds
+        self.engine = engine or TimeSlotEngine(cache=cache)
+        self.cache = cache
+        self._solver: Optional[pywraplp.Solver] = None
+        self._solver_lock = threading.Lock()
+        self.stats = {'heuristic': 0, 'mip': 0, 'infeasible': 0, 'timeout': 0, 'error': 0, 'cache': 0}
+
+    def _get_solver(self) -> pywraplp.Solver:
+        if self._solver is None:
+            self._solver = pywraplp.Solver.CreateSolver(self.solver_name)
+            if self._solver is None:
+                raise RuntimeError(f"MIP 솔버를 만들 수 없습니다: {self.solver_name}")
+        else:
+            self._solver.Clear()
+        return self._solver
+
+    def optimize_weekly_schedule(self, constraints: Dict[str, Any]) -> Dict[str, Any]:
+        """제약 조건을 고려한 주간 학습 일정 최적화
+
+        constraints 예:
+            {
+                'family_schedule': {...}, 'child_energy_pattern': {...},  # time_slot_engine 형식
+                'session_minutes': 20, 'weeks': 4, 'start_date': '2024-03-04',
+                'min_sessions_per_week': 3, 'max_sessions_per_week': 5,
+                'max_consecutive_days': 3,  # 연속 학습 일수 상한 (없으면 제한 없음)
+                'max_rest_days': 2,         # 학습 없이 쉬는 연속 일수 상한 (학습 연속성)
+                'blocked_dates': ['2024-03-09'], 'min_energy': 0.3
+            }
+
+        반환: status(optimal/feasible/infeasible/timeout/error), solved_by(heuristic/mip), objective,
+              upper_bound, sessions(날짜별 시간대), weekly_sessions, solve_time_ms,
+              cached(캐시에서 가져온 결과인지)
+              MIP가 시간 제한(timeout)이나 솔버 오류(error)로 끝나도 보정한 해가 제약을 만족하면
+              그 해를 feasible로 반환한다. 최적이 증명되지 않은 결과는 캐시하지 않는다.
+        """
+        started = time.perf_counter()
+        weeks = int(constraints.get('weeks') or 1)
+        min_per_week = int(constraints.get('min_sessions_per_week') or 0)
+        max_per_week = int(constraints.get('max_sessions_per_week') or 7)
+        max_consecutive = constraints.get('max_consecutive_days')
+        max_rest = constraints.get('max_rest_days')
+        if weeks <= 0 or not 0 <= min_per_week <= max_per_week <= 7:
+            raise ValueError("weeks는 1 이상, 0 <= min_sessions_per_week <= max_sessions_per_week <= 7 이어야 합니다")
+
+        start_date = date.fromisoformat(constraints['start_date']) if constraints.get('start_date') else date.today()
+        dates = [start_date + timedelta(days=offset) for offset in range(weeks * 7)]
+
+        key = None
+        if self.cache is not None:
+            key = self.cache.schedule_key(constraints, dates, self.engine.earliest_time, self.engine.latest_time)
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.stats['cache'] += 1
+                return dict(cached, cached=True, solve_time_ms=round((time.perf_counter() - started) * 1000, 3))
+
+        result = self._solve(constraints, dates, weeks, min_per_week, max_per_week, max_consecutive, max_rest,
+                             started)
+        if self.cache is not None and result['status'] in ('optimal', 'infeasible'):
+            self.cache.put(key, result)
+        return dict(result, cached=False)
+
+    def _solve(self, constraints: Dict[str, Any], dates: List[date], weeks: int, min_per_week: int,
+               max_per_week: int, max_consecutive: Optional[int], max_rest: Optional[int],
+               started: float) -> Dict[str, Any]:
+        slots = self._daily_slots(constraints, dates)
+        values = [slot['energy_score'] if slot else None for slot in slots]
+
+        selected = self._greedy(values, weeks, min_per_week, max_per_week)
+        if selected is None:
+            # 어떤 주의 가능한 날이 최소 학습 횟수보다 적음
+            self.stats['infeasible'] += 1
+            return self._result('infeasible', 'heuristic', None, None, None, dates, slots, started)
+
+        upper_bound = self._total(selected, values)
+        solved_by = 'heuristic'
+        status = 'optimal'
+        if self._violations(selected, max_consecutive, max_rest):
+            selected = self._repair(selected, values, weeks, min_per_week, max_per_week, max_consecutive, max_rest)
+            if (self._violations(selected, max_consecutive, max_rest)
+                    or self._total(selected, values) < upper_bound - _EPSILON):
+                repaired = selected
+                solved_by = 'mip'
+                status, selected = self._solve_mip(selected, values, weeks, min_per_week, max_per_week,
+                                                   max_consecutive, max_rest)
+                if status in ('timeout', 'error'):
+                    self.stats[status] += 1
+                    if not self._violations(repaired, max_consecutive, max_rest):
+                        # 최적은 증명하지 못했지만 보정한 해는 제약을 만족함
+                        return self._result('feasible', 'heuristic', self._total(repaired, values), upper_bound,
+                                            repaired, dates, slots, started)
+                    return self._result(status, solved_by, None, upper_bound, None, dates, slots, started)
+
+        self.stats[solved_by if status != 'infeasible' else 'infeasible'] += 1
+        if status == 'infeasible':
+            return self._result(status, solved_by, None, upper_bound, None, dates, slots, started)
+        return self._result(status, solved_by, self._total(selected, values), upper_bound,
+                            selected, dates, slots, started)
+
+    def _daily_slots(self, constraints: Dict[str, Any], dates: List[date]) -> List[Optional[Dict[str, Any]]]:
+        """날짜별 학습 시간대 (학습할 수 없는 날은 None)"""
+        weekly = self.engine.recommend(
+            constraints.get('family_schedule') or {},
+            constraints.get('child_energy_pattern'),
+            int(constraints.get('session_minutes') or 20),
+            top_n=0
+        )['daily_best']
+        blocked = {date.fromisoformat(value) if isinstance(value, str) else value
+                   for value in constraints.get('blocked_dates') or []}
+        min_energy = float(constraints.get('min_energy') or 0)
+
+        slots = []
+        for day in dates:
+            slot = weekly[DAYS[day.weekday()]]
+            usable = slot is not None and day not in blocked and slot['energy_score'] >= min_energy
+            slots.append(slot if usable else None)
+        return slots
+
+    @staticmethod
+    def _total(selected: List[bool], values: List[Optional[float]]) -> float:
+        return sum(value for chosen, value in zip(selected, values) if chosen)
+
+    @staticmethod
+    def _greedy(values: List[Optional[float]], weeks: int, min_per_week: int,
+                max_per_week: int) -> Optional[List[bool]]:
+        """주마다 가치가 높은 날부터 최대 횟수만큼 선택 (연속 제약 무시)"""
+        selected = [False] * len(values)
+        for week in range(weeks):
+            days = [day for day in range(week * 7, week * 7 + 7) if values[day] is not None]
+            if len(days) < min_per_week:
+                return None
+            days.sort(key=lambda day: -values[day])
+            for day in days[:max_per_week]:
+                selected[day] = True
+        return selected
+
+    @staticmethod
+    def _window_rules(max_consecutive: Optional[int], max_rest: Optional[int]):
+        """(구간 크기, 최소 학습일, 최대 학습일) 목록
+
+        (max_consecutive + 1)일 구간마다 학습일 <= max_consecutive,
+        (max_rest + 1)일 구간마다 학습일 >= 1
+        """
+        rules = []
+        if max_consecutive is not None:
+            rules.append((int(max_consecutive) + 1, 0, int(max_consecutive)))
+        if max_rest is not None:
+            rules.append((int(max_rest) + 1, 1, int(max_rest) + 1))
+        return rules
+
+    def _violating_windows(self, selected: List[bool], max_consecutive: Optional[int],
+                           max_rest: Optional[int], days: Optional[List[int]] = None) -> List[tuple]:
+        """연속 제약을 어긴 (시작일, 구간 크기) 목록 (days가 있으면 그 날을 포함한 구간만 검사)"""
+        violating = []
+        for size, low, high in self._window_rules(max_consecutive, max_rest):
+            last_start = len(selected) - size
+            if days is None:
+                starts = range(last_start + 1)
+            else:
+                starts = sorted({start for day in days
+                                 for start in range(max(0, day - size + 1), min(day, last_start) + 1)})
+            for start in starts:
+                total = sum(selected[start:start + size])
+                if total < low or total > high:
+                    violating.append((start, size))
+        return violating
+
+    def _violations(self, selected: List[bool], max_consecutive: Optional[int], max_rest: Optional[int]) -> int:
+        return len(self._violating_windows(selected, max_consecutive, max_rest))
+
+    def _repair(self, selected: List[bool], values: List[Optional[float]], weeks: int, min_per_week: int,
+                max_per_week: int, max_consecutive: Optional[int], max_rest: Optional[int]) -> List[bool]:
+        """위반 구간 수를 줄이는 주 단위 교환/추가/제거를 반복 (같으면 가치가 큰 쪽)
+
+        첫 위반 구간이 걸친 주와 그 앞뒤 주에서만 이동을 찾고, 이동의 효과는
+        바뀐 날을 포함한 구간만 다시 검사해서 계산한다.
+        """
+        selected = list(selected)
+        violating = self._violating_windows(selected, max_consecutive, max_rest)
+        current = len(violating)
+        for _ in range(4 * weeks):
+            if not current:
+                break
+            start, size = violating[0]
+            first_week = max(start // 7 - 1, 0)
+            last_week = min((start + size - 1) // 7 + 1, weeks - 1)
+
+            best = None
+            for week in range(first_week, last_week + 1):
+                week_days = range(week * 7, week * 7 + 7)
+                chosen = [day for day in week_days if selected[day]]
+                unchosen = [day for day in week_days if not selected[day] and values[day] is not None]
+                moves = [(day, None) for day in chosen if len(chosen) > min_per_week]
+                moves += [(None, day) for day in unchosen if len(chosen) < max_per_week]
+                moves += [(drop, add) for drop in chosen for add in unchosen]
+                for drop, add in moves:
+                    changed = [day for day in (drop, add) if day is not None]
+                    before = len(self._violating_windows(selected, max_consecutive, max_rest, changed))
+                    for day in changed:
+                        selected[day] = not selected[day]
+                    after = len(self._violating_windows(selected, max_consecutive, max_rest, changed))
+                    for day in changed:
+                        selected[day] = not selected[day]
+                    gain = (values[add] if add is not None else 0) - (values[drop] if drop is not None else 0)
+                    key = (current - before + after, -gain)
+                    if key[0] < current and (best is None or key < best[0]):
+                        best = (key, changed)
+            if best is None:
+                break
+            for day in best[1]:
+                selected[day] = not selected[day]
+            violating = self._violating_windows(selected, max_consecutive, max_rest)
+            current = len(violating)
+        return selected
+
+    def _solve_mip(self, hint: List[bool], values: List[Optional[float]], weeks: int, min_per_week: int,
+                   max_per_week: int, max_consecutive: Optional[int], max_rest: Optional[int]):
+        """(상태, 선택) - 탐욕/보정 해를 힌트로 넘겨 MIP로 최적해 탐색
+
+        상태: optimal / feasible(시간 제한 전 찾은 해) / infeasible / timeout(해 없이 시간 제한) / error
+        """
+        with self._solver_lock:
+            solver = self._get_solver()
+            variables = [solver.BoolVar(f"day_{day}") if value is not None else None
+                         for day, value in enumerate(values)]
+
+            def window_sum(start: int, size: int):
+                return solver.Sum([var for var in variables[start:start + size] if var is not None])
+
+            for week in range(weeks):
+                total = window_sum(week * 7, 7)
+                solver.Add(total >= min_per_week)
+                solver.Add(total <= max_per_week)
+            if max_consecutive is not None:
+                for start in range(len(values) - int(max_consecutive)):
+                    solver.Add(window_sum(start, int(max_consecutive) + 1) <= int(max_consecutive))
+            if max_rest is not None:
+                for start in range(len(values) - int(max_rest)):
+                    solver.Add(window_sum(start, int(max_rest) + 1) >= 1)
+
+            solver.Maximize(solver.Sum([value * var for var, value in zip(variables, values) if var is not None]))
+            used = [(var, chosen) for var, chosen in zip(variables, hint) if var is not None]
+            solver.SetHint([var for var, _ in used], [1.0 if chosen else 0.0 for _, chosen in used])
+            solver.SetTimeLimit(int(self.time_limit_seconds * 1000))
+
+            status = solver.Solve()
+            if status == pywraplp.Solver.INFEASIBLE:
+                return 'infeasible', None
+            if status == pywraplp.Solver.NOT_SOLVED:
+                return 'timeout', None
+            if status not in (pywraplp.Solver.OPTIMAL, pywraplp.Solver.FEASIBLE):
+                return 'error', None
+            selected = [var is not None and var.solution_value() > 0.5 for var in variables]
+            return ('optimal' if status == pywraplp.Solver.OPTIMAL else 'feasible'), selected
+
+    @staticmethod
+    def _result(status: str, solved_by: str, objective: Optional[float], upper_bound: Optional[float],
+                selected: Optional[List[bool]], dates: List[date], slots: List[Optional[Dict[str, Any]]],
+                started: float) -> Dict[str, Any]:
+        sessions = []
+        weekly_sessions = []
+        if selected is not None:
+            for day, chosen in enumerate(selected):
+                if chosen:
+                    sessions.append(dict(slots[day], date=dates[day].isoformat()))
+            weekly_sessions = [sum(selected[week:week + 7]) for week in range(0, len(selected), 7)]
+        return {
+            'status': status,
+            'solved_by': solved_by,
+            'objective': round(objective, 3) if objective is not None else None,
+            'upper_bound': round(upper_bound, 3) if upper_bound is not None else None,
+            'sessions': sessions,
+            'weekly_sessions': weekly_sessions,
+            'solve_time_ms': round((time.perf_counter() - started) * 1000, 3)
+        }
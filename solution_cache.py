@@ -0,0 +1,250 @@
+# solution_cache.py
+"""일정 최적화 결과 캐시 (정규화한 제약 조건 -> 결과)
+
+가족마다 표현은 달라도 내용이 같은 제약(같은 시간대를 'weekdays' 또는 요일별로 적은 경우,
+'9:00'과 '09:00', 구간 순서/겹침 등)을 같은 키로 모으고, 에너지 패턴은 energy_step 단위로
+양자화해 거의 같은 곡선끼리 결과를 공유한다.
+
+- 메모리: OrderedDict LRU (max_entries 초과 시 가장 오래 쓰지 않은 항목 제거)
+- 디스크: db_path를 주면 SQLite에 함께 저장하고, 메모리에 없을 때 읽어 옴
+- 메모리에는 결과를 pickle로 직렬화해 두고 get()마다 새 객체로 풀어 준다
+  (한 호출자가 결과를 고쳐도 같은 키를 쓰는 다른 가족의 결과는 그대로)
+- 적중/실패는 종류(kind)별로 센다. 주간 일정 캐시 미스는 안에서 시간 추천 캐시를 다시
+  조회하므로 종류를 합친 적중률은 요청 단위 적중률이 아니다
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from functools import lru_cache
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from time_slot_engine import SLOT_MINUTES, energy_profile, interval_segments, time_to_slot, _hashable
+
+# 결과 형식이나 알고리즘이 바뀌면 올려서 기존 디스크 캐시를 무효화
+CACHE_VERSION = 3
+DEFAULT_ENERGY_STEP = 0.05
+
+
+def _merge_segments(segments: List[Tuple[int, int, int]]) -> Tuple[Tuple[int, int, int], ...]:
+    """(요일, 시작, 끝) 조각을 요일별로 정렬하고 겹치거나 맞닿은 조각을 합침"""
+    merged: List[List[int]] = []
+    for day, start, end in sorted(segments):
+        if merged and merged[-1][0] == day and start <= merged[-1][2]:
+            merged[-1][2] = max(merged[-1][2], end)
+        else:
+            merged.append([day, start, end])
+    return tuple(tuple(segment) for segment in merged)
+
+
+def canonical_family_schedule(family_schedule: Optional[Dict[str, Any]], earliest_time: str = '07:00',
+                              latest_time: str = '20:00') -> Tuple:
+    """가족 일정의 정규형 (여유 시간을 반영한 바쁜 구간, 부모 가능 구간, 하루 시작/끝 슬롯)"""
+    schedule = family_schedule or {}
+    buffer_slots = -(-int(schedule.get('buffer_minutes') or 0) // SLOT_MINUTES)
+
+    busy: List[Tuple[int, int, int]] = []
+    for interval in schedule.get('busy_times') or []:
+        busy.extend(interval_segments(interval.get('day', 'daily'), interval['start'], interval['end'], buffer_slots))
+    available: List[Tuple[int, int, int]] = []
+    for interval in schedule.get('parent_available') or []:
+        available.extend(interval_segments(interval.get('day', 'daily'), interval['start'], interval['end'],
+                                           inner=True))
+
+    return (
+        _merge_segments(busy),
+        # 부모 가능 구간을 지정했지만 모두 비어 버렸으면 (학습할 수 없음) 지정하지 않은 경우와 구분
+        _merge_segments(available) if schedule.get('parent_available') else None,
+        time_to_slot(schedule.get('earliest_time') or earliest_time, round_up=True),
+        time_to_slot(schedule.get('latest_time') or latest_time)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _quantized_energy(pattern: Hashable, step: float) -> Tuple[Tuple[int, int], ...]:
+    levels = np.rint(energy_profile(dict(pattern) if pattern else None) / step).astype(np.int64)
+    changes = np.flatnonzero(np.diff(levels)) + 1
+    starts = np.concatenate(([0], changes))
+    return tuple(zip(starts.tolist(), levels[starts].tolist()))
+
+
+def canonical_energy_pattern(child_energy_pattern: Optional[Dict[str, Any]],
+                             step: float = DEFAULT_ENERGY_STEP) -> Tuple[Tuple[int, int], ...]:
+    """슬롯별 에너지를 step 단위로 양자화한 (시작 슬롯, 단계) 목록"""
+    return _quantized_energy(_hashable(child_energy_pattern or {}), step)
+
+
+class SolutionCache:
+    """정규화한 요청 키로 최적화 결과를 재사용하는 LRU 캐시 (선택적 SQLite 영속화)
+
+    사용 예:
+        cache = SolutionCache(max_entries=10000, db_path='data/cache/solution_cache.sqlite3')
+        key = cache.make_key('time_slots', canonical_request)
+        result = cache.get(key)
+        if result is None:
+            result = solve(...)
+            cache.put(key, result)
+    """
+
+    def __init__(self, max_entries: int = 10000, db_path: Optional[str] = None,
+                 energy_step: float = DEFAULT_ENERGY_STEP):
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self.energy_step = energy_step
+        self.logger = logging.getLogger(__name__)
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # 종류별 [적중, 디스크 적중, 실패]
+        self._kind_counts: Dict[str, List[int]] = {}
+
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[Hashable, bytes]' = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path:
+            directory = os.path.dirname(db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS solutions (
+                    cache_key TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    stored_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(kind: str, canonical: Tuple) -> Tuple:
+        """메모리 캐시 키 (종류, 버전, 정규형)"""
+        return (kind, CACHE_VERSION, canonical)
+
+    def recommendation_key(self, request: Dict[str, Any], top_n: int, earliest_time: str,
+                           latest_time: str) -> Tuple:
+        """TimeSlotEngine 요청 1건의 키"""
+        return self.make_key('time_slots', (
+            canonical_family_schedule(request.get('family_schedule'), earliest_time, latest_time),
+            canonical_energy_pattern(request.get('child_energy_pattern'), self.energy_step),
+            int(request.get('learning_duration') or 20),
+            top_n
+        ))
+
+    def schedule_key(self, constraints: Dict[str, Any], dates: List[date], earliest_time: str,
+                     latest_time: str) -> Tuple:
+        """LearningScheduleOptimizer 요청의 키 (기간 밖의 blocked_dates는 결과에 영향이 없어 제외)"""
+        blocked = {value if isinstance(value, str) else value.isoformat()
+                   for value in constraints.get('blocked_dates') or []}
+        return self.make_key('weekly_schedule', (
+            canonical_family_schedule(constraints.get('family_schedule'), earliest_time, latest_time),
+            canonical_energy_pattern(constraints.get('child_energy_pattern'), self.energy_step),
+            int(constraints.get('session_minutes') or 20),
+            dates[0].isoformat(),
+            len(dates) // 7,
+            int(constraints.get('min_sessions_per_week') or 0),
+            int(constraints.get('max_sessions_per_week') or 7),
+            constraints.get('max_consecutive_days'),
+            constraints.get('max_rest_days'),
+            tuple(sorted(blocked.intersection(day.isoformat() for day in dates))),
+            float(constraints.get('min_energy') or 0)
+        ))
+
+    @staticmethod
+    def _disk_key(key: Tuple) -> str:
+        payload = json.dumps(key, separators=(',', ':'), default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """저장된 결과의 사본 (메모리 -> 디스크 순으로 조회, 없으면 None)"""
+        with self._lock:
+            counts = self._kind_counts.setdefault(key[0], [0, 0, 0])
+            frozen = self._entries.get(key)
+            if frozen is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                counts[0] += 1
+                return pickle.loads(frozen)
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT result FROM solutions WHERE cache_key = ?", (self._disk_key(key),)
+                ).fetchone()
+                if row is not None:
+                    result = json.loads(row[0])
+                    self._remember(key, result)
+                    self.disk_hits += 1
+                    counts[1] += 1
+                    return result
+
+            self.misses += 1
+            counts[2] += 1
+            return None
+
+    def put(self, key: Tuple, result: Any):
+        with self._lock:
+            self._remember(key, result)
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO solutions (cache_key, kind, result, stored_at) VALUES (?, ?, ?, ?)",
+                    (self._disk_key(key), key[0], json.dumps(result, ensure_ascii=False), time.time())
+                )
+                self._conn.commit()
+
+    def _remember(self, key: Tuple, result: Any):
+        self._entries[key] = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        """메모리와 디스크의 모든 항목 삭제"""
+        with self._lock:
+            self._entries.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM solutions")
+                self._conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 적중/실패 통계 (디스크 적중도 적중으로 계산, 적중률은 종류별)"""
+        with self._lock:
+            by_kind = {}
+            for kind, (hits, disk_hits, misses) in self._kind_counts.items():
+                total = hits + disk_hits + misses
+                by_kind[kind] = {
+                    'hits': hits,
+                    'disk_hits': disk_hits,
+                    'misses': misses,
+                    'hit_rate': round((hits + disk_hits) / total, 3) if total else 0.0
+                }
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'by_kind': by_kind
+            }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -1,13 +1,65 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Optional, Set, NamedTuple, Any
+from datetime import datetime, timezone
 import re
+import numpy as np
+import pandas as pd
 from ..models.video_model import VideoData
 from ..models.channel_model import ChannelData
+from ..utils.keyword_matcher import KeywordMatcher
 from config.keywords import (
     POSITIVE_KEYWORDS, NEGATIVE_KEYWORDS,
     TRUSTED_CHANNEL_INDICATORS, MIN_VIDEO_DURATION, MAX_VIDEO_DURATION
 )
 
+# 제목/설명 분석에 쓰이는 키워드 그룹
+TEXT_KEYWORD_GROUPS = {
+    'ort_title': ['oxford reading tree'],
+    'oxford': ['oxford'],
+    'reading': ['reading'],
+    'level1_marker': ['level 1', 'stage 1'],
+    'characters': ['biff', 'chip', 'kipper', 'floppy'],
+    'core_characters': ['biff', 'chip', 'kipper'],
+    'educational': ['phonics', 'learn', 'reading', 'education', 'children'],
+    'negative': NEGATIVE_KEYWORDS,
+    # Level 1 특징적 키워드들
+    'level1_keywords': [
+        'first words', 'wordless', 'getting ready to read',
+        'i see', 'up you go', 'get on', 'six in a bed'
+    ],
+    # 너무 어려운 내용
+    'advanced_keywords': ['level 2', 'level 3', 'chapter', 'advanced', 'complex'],
+}
+
+# 학습 목표별 키워드
+OBJECTIVE_KEYWORDS = {
+    'alphabet': ['alphabet', 'abc', 'letters'],
+    'phonics': ['phonics', 'sounds', 'letter sounds'],
+    'first_words': ['first words', 'simple words', 'basic words'],
+    'reading_readiness': ['getting ready', 'pre-reading', 'reading readiness'],
+    'story_comprehension': ['story', 'comprehension', 'understanding'],
+    'vocabulary': ['vocabulary', 'word recognition', 'sight words']
+}
+
+# 채널명 분석에 쓰이는 키워드 그룹
+CHANNEL_KEYWORD_GROUPS = {
+    'trusted': TRUSTED_CHANNEL_INDICATORS,
+    'education_indicators': ['education', 'learning', 'school', 'teacher', 'kids'],
+}
+
+class AnalysisResult(NamedTuple):
+    """영상 1개에 대한 분석 결과"""
+    quality_score: int
+    is_level1_content: bool
+    learning_objectives: List[str]
+
 class ContentAnalyzer:
+    # 모든 키워드 그룹을 한 번의 스캔으로 찾는 매처 (클래스 로드 시 1회 컴파일)
+    text_matcher = KeywordMatcher({
+        **TEXT_KEYWORD_GROUPS,
+        **{f"objective:{name}": keywords for name, keywords in OBJECTIVE_KEYWORDS.items()}
+    })
+    channel_matcher = KeywordMatcher(CHANNEL_KEYWORD_GROUPS)
+    
     def __init__(self):
         self.ort_keywords = [
             'oxford reading tree', 'biff', 'chip', 'kipper', 
@@ -15,43 +67,67 @@ class ContentAnalyzer:
         ]
         self.trusted_channels = []  # 신뢰할 수 있는 채널 목록
     
-    def calculate_quality_score(self, video: VideoData) -> int:
-        """영상의 교육적 품질 점수 계산"""
+    def analyze(self, video: VideoData) -> AnalysisResult:
+        """품질 점수, Level 1 여부, 학습 목표를 한 번에 계산
+        
+        제목+설명을 한 번만 소문자로 정규화하고 한 번만 스캔한다.
+        제목 점수는 제목 구간 안에서 끝나는 일치만 사용한다.
+        """
+        title_lower = video.title.lower()
+        content = f"{title_lower} {video.description.lower()}"
+        found = self.text_matcher.find_all(content)
+        
+        title_length = len(title_lower)
+        title_matches = self.text_matcher.categorize(
+            (start, keyword) for start, keyword in found if start + len(keyword) <= title_length
+        )
+        content_matches = self.text_matcher.categorize(found)
+        
         score = 0
         
         # 제목 분석
-        score += self._analyze_title(video.title)
+        score += self._score_title_matches(title_matches)
         
         # 채널 신뢰도
-        score += self._analyze_channel(video.channel_title)
+        score += self._analyze_channel_trustworthiness(video.channel_title)
         
         # 조회수/좋아요 분석
         score += self._analyze_engagement(video.view_count, video.like_count)
         
         # 영상 길이 분석
-        score += self._analyze_duration(video.duration)
+        score += self._analyze_duration(video.duration_seconds)
         
-        return min(score, 100)
+        return AnalysisResult(
+            quality_score=min(score, 100),
+            is_level1_content=self._is_level1_matches(content_matches),
+            learning_objectives=self._objectives_from_matches(content_matches)
+        )
+    
+    def calculate_quality_score(self, video: VideoData) -> int:
+        """영상의 교육적 품질 점수 계산"""
+        return self.analyze(video).quality_score
     
 
     def _analyze_title(self, title: str) -> int:
         """제목 분석 (최대 30점)"""
+        return self._score_title_matches(self.text_matcher.match(title.lower()))
+    
+    def _score_title_matches(self, matches: Dict[str, Set[str]]) -> int:
+        """제목 키워드 일치 결과로 점수 계산"""
         score = 0
-        title_lower = title.lower()
         
         # Oxford Reading Tree 명시 (+15점)
-        if 'oxford reading tree' in title_lower:
+        if matches['ort_title']:
             score += 15
-        elif 'oxford' in title_lower and 'reading' in title_lower:
+        elif matches['oxford'] and matches['reading']:
             score += 10
         
         # Level 1 명시 (+10점)
-        if 'level 1' in title_lower or 'stage 1' in title_lower:
+        if matches['level1_marker']:
             score += 10
         
         # 캐릭터 이름 (+5점)
-        characters = ['biff', 'chip', 'kipper', 'floppy']
-        if any(char in title_lower for char in characters):
+        if matches['characters']:
             score += 5
         
         return score
@@ -60,11 +136,10 @@ class ContentAnalyzer:
     def _analyze_description(self, description: str) -> int:
         """설명 분석 (최대 15점)"""
         score = 0
-        desc_lower = description.lower()
+        matches = self.text_matcher.match(description.lower())
         
         # 교육적 키워드 존재 (+10점)
-        educational_keywords = ['phonics', 'learn', 'reading', 'education', 'children']
-        keyword_count = sum(1 for keyword in educational_keywords if keyword in desc_lower)
+        keyword_count = len(matches['educational'])
         score += min(keyword_count * 2, 10)
         
         # 적절한 설명 길이 (+5점)
@@ -76,18 +151,14 @@ class ContentAnalyzer:
     def _analyze_channel_trustworthiness(self, channel_title: str) -> int:
         """채널 신뢰도 분석 (최대 25점)"""
         score = 0
-        channel_lower = channel_title.lower()
+        matches = self.channel_matcher.match(channel_title.lower())
         
         # 공식/신뢰할 수 있는 채널 (+25점)
-        for indicator in TRUSTED_CHANNEL_INDICATORS:
-            if indicator in channel_lower:
-                score += 25
-                break
-        else:
-            # 교육 관련 키워드 (+10점)
-            education_indicators = ['education', 'learning', 'school', 'teacher', 'kids']
-            if any(indicator in channel_lower for indicator in education_indicators):
-                score += 10
+        if matches['trusted']:
+            score += 25
+        # 교육 관련 키워드 (+10점)
+        elif matches['education_indicators']:
+            score += 10
         
         return score
     
@@ -128,14 +199,10 @@ class ContentAnalyzer:
     
     def _check_inappropriate_content(self, title: str, description: str) -> int:
         """부적절한 콘텐츠 체크 (감점)"""
-        content = f"{title} {description}".lower()
+        matches = self.text_matcher.match(f"{title} {description}".lower())
         
-        penalty = 0
-        for negative_keyword in NEGATIVE_KEYWORDS:
-            if negative_keyword in content:
-                penalty += 20  # 부적절한 키워드당 20점 감점
-        
-        return penalty
+        # 부적절한 키워드당 20점 감점
+        return len(matches['negative']) * 20
     
     def _calculate_recency_bonus(self, published_at) -> int:
         """최근성 보너스 (최대 5점)"""
@@ -155,54 +222,125 @@ class ContentAnalyzer:
     
     def is_level1_content(self, video: VideoData) -> bool:
         """Level 1 콘텐츠인지 판단"""
-        content = f"{video.title} {video.description}".lower()
-        
+        return self.analyze(video).is_level1_content
+    
+    def _is_level1_matches(self, matches: Dict[str, Set[str]]) -> bool:
+        """제목+설명 키워드 일치 결과로 Level 1 여부 판단"""
         # Level 1 직접 언급
-        if 'level 1' in content or 'stage 1' in content:
+        if matches['level1_marker']:
             return True
         
         # Level 1 특징적 키워드들
-        level1_keywords = [
-            'first words', 'wordless', 'getting ready to read',
-            'i see', 'up you go', 'get on', 'six in a bed'
-        ]
-        
-        if any(keyword in content for keyword in level1_keywords):
+        if matches['level1_keywords']:
             return True
         
         # 너무 어려운 내용은 제외
-        advanced_keywords = [
-            'level 2', 'level 3', 'chapter', 'advanced', 'complex'
-        ]
-        
-        if any(keyword in content for keyword in advanced_keywords):
+        if matches['advanced_keywords']:
             return False
         
         # Oxford Reading Tree + 기본 캐릭터 = 높은 확률로 Level 1
-        has_ort = 'oxford' in content and 'reading' in content
-        has_characters = any(char in content for char in ['biff', 'chip', 'kipper'])
+        has_ort = bool(matches['oxford']) and bool(matches['reading'])
+        has_characters = bool(matches['core_characters'])
         
         return has_ort and has_characters
     
     def extract_learning_objectives(self, video: VideoData) -> List[str]:
         """학습 목표 추출"""
-        objectives = []
-        content = f"{video.title} {video.description}".lower()
-        
-        objective_mapping = {
-            'alphabet': ['alphabet', 'abc', 'letters'],
-            'phonics': ['phonics', 'sounds', 'letter sounds'],
-            'first_words': ['first words', 'simple words', 'basic words'],
-            'reading_readiness': ['getting ready', 'pre-reading', 'reading readiness'],
-            'story_comprehension': ['story', 'comprehension', 'understanding'],
-            'vocabulary': ['vocabulary', 'word recognition', 'sight words']
+        return self.analyze(video).learning_objectives
+    
+    def _objectives_from_matches(self, matches: Dict[str, Set[str]]) -> List[str]:
+        """키워드 일치 결과에서 학습 목표 목록 추출 (OBJECTIVE_KEYWORDS 순서 유지)"""
+        return [objective for objective in OBJECTIVE_KEYWORDS if matches[f"objective:{objective}"]]
+    
+    def score_batch(self, table: Any, now: Optional[datetime] = None) -> Dict[str, np.ndarray]:
+        """컬럼형 테이블의 품질 점수를 벡터 연산으로 일괄 계산
+        
+        table: pandas DataFrame 또는 컬럼명 -> 배열 매핑. 필요한 컬럼은
+        title, channel_title, view_count, like_count, duration_seconds, published_at.
+        반환되는 quality_score는 calculate_quality_score와 동일하며, 구성 요소별
+        점수와 최근성 보너스(_calculate_recency_bonus와 동일)도 함께 반환한다.
+        """
+        df = table if isinstance(table, pd.DataFrame) else pd.DataFrame(table)
+        
+        title_score = self._score_titles_batch(df['title'])
+        channel_score = self._score_channels_batch(df['channel_title'])
+        engagement_score = self._score_engagement_batch(
+            df['view_count'].to_numpy(dtype=np.int64),
+            df['like_count'].to_numpy(dtype=np.int64)
+        )
+        duration_score = self._score_duration_batch(
+            pd.to_numeric(df['duration_seconds'], errors='coerce').fillna(0).to_numpy(dtype=np.int64)
+        )
+        
+        result = {
+            'quality_score': np.minimum(title_score + channel_score + engagement_score + duration_score, 100),
+            'title_score': title_score,
+            'channel_score': channel_score,
+            'engagement_score': engagement_score,
+            'duration_score': duration_score,
         }
-        
-        for objective, keywords in objective_mapping.items():
-            if any(keyword in content for keyword in keywords):
-                objectives.append(objective)
-        
-        return objectives
+        if 'published_at' in df:
+            result['recency_bonus'] = self._recency_bonus_batch(df['published_at'], now)
+        return result
+    
+    @staticmethod
+    def _contains_any(texts: pd.Series, keywords: List[str]) -> np.ndarray:
+        """각 행에 키워드 중 하나라도 포함되어 있는지 (부분 문자열 기준)"""
+        pattern = '|'.join(re.escape(keyword) for keyword in keywords)
+        return texts.str.contains(pattern, regex=True).to_numpy(dtype=bool)
+    
+    def _score_titles_batch(self, titles: pd.Series) -> np.ndarray:
+        """_score_title_matches의 벡터 버전"""
+        titles = titles.fillna('').astype(str).str.lower()
+        groups = TEXT_KEYWORD_GROUPS
+        
+        has_ort_title = self._contains_any(titles, groups['ort_title'])
+        has_oxford_reading = (self._contains_any(titles, groups['oxford'])
+                              & self._contains_any(titles, groups['reading']))
+        
+        score = np.where(has_ort_title, 15, np.where(has_oxford_reading, 10, 0))
+        score += np.where(self._contains_any(titles, groups['level1_marker']), 10, 0)
+        score += np.where(self._contains_any(titles, groups['characters']), 5, 0)
+        return score.astype(np.int64)
+    
+    def _score_channels_batch(self, channel_titles: pd.Series) -> np.ndarray:
+        """_analyze_channel_trustworthiness의 벡터 버전"""
+        channel_titles = channel_titles.fillna('').astype(str).str.lower()
+        trusted = self._contains_any(channel_titles, CHANNEL_KEYWORD_GROUPS['trusted'])
+        educational = self._contains_any(channel_titles, CHANNEL_KEYWORD_GROUPS['education_indicators'])
+        return np.where(trusted, 25, np.where(educational, 10, 0)).astype(np.int64)
+    
+    @staticmethod
+    def _score_engagement_batch(view_count: np.ndarray, like_count: np.ndarray) -> np.ndarray:
+        """_analyze_engagement의 벡터 버전"""
+        score = np.where((view_count >= 1000) & (view_count <= 500000), 10,
+                         np.where((view_count >= 500) & (view_count < 1000), 5, 0))
+        
+        has_likes = (view_count > 0) & (like_count > 0)
+        like_ratio = like_count / np.where(view_count > 0, view_count, 1)
+        score += np.where(has_likes & (like_ratio >= 0.02), 5,
+                          np.where(has_likes & (like_ratio >= 0.01), 3, 0))
+        return score.astype(np.int64)
+    
+    @staticmethod
+    def _score_duration_batch(duration_seconds: np.ndarray) -> np.ndarray:
+        """_analyze_duration의 벡터 버전 (0 또는 누락 값은 0점)"""
+        in_range = (duration_seconds >= MIN_VIDEO_DURATION) & (duration_seconds <= MAX_VIDEO_DURATION)
+        ideal = (duration_seconds >= 300) & (duration_seconds <= 600)
+        return np.where(in_range, np.where(ideal, 10, 7), 0).astype(np.int64)
+    
+    @staticmethod
+    def _recency_bonus_batch(published_at: pd.Series, now: Optional[datetime] = None) -> np.ndarray:
+        """_calculate_recency_bonus의 벡터 버전 (시간대가 없는 now는 UTC로 간주)"""
+        now = pd.Timestamp(now or datetime.now(timezone.utc))
+        if now.tzinfo is None:
+            now = now.tz_localize(timezone.utc)
+        days_old = (now - pd.to_datetime(published_at, utc=True)).dt.days.to_numpy()
+        return np.select(
+            [days_old <= 30, days_old <= 365, days_old <= 1095],
+            [5, 3, 1],
+            default=0
+        ).astype(np.int64)
     
     def analyze_channel_quality(self, channel: ChannelData, videos: List[VideoData]) -> Tuple[int, float]:
         """채널 전체 품질 분석"""
@@ -1,29 +1,80 @@
 """메인 수집 orchestrator"""
 
 import logging
-import time
-from typing import List, Dict, Set
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Set, Optional, Callable
+from datetime import datetime, timezone
 
-from .youtube_collector import YouTubeCollector
+from .youtube_collector import YouTubeCollector, VideoDetailsBuffer
 from .content_analyzer import ContentAnalyzer
 from ..models.video_model import VideoData
-from ..models.channel_model import ChannelData
+from ..models.channel_model import ChannelData, ChannelAggregate
+from ..storage.api_cache import APICache
+from ..storage.collection_state import CollectionState
+from ..utils.rate_limiter import TokenBucketRateLimiter
+from ..utils.quota_ledger import QuotaLedger, QuotaExceededError
+from ..utils.report_accumulator import ReportAccumulator
+from ..utils.near_duplicate import NearDuplicateDetector
 from config.keywords import SEARCH_KEYWORDS
 
 class MainCollector:
-    def __init__(self, api_key: str, min_quality_score: int = 50):
-        self.youtube_collector = YouTubeCollector(api_key)
+    def __init__(self, api_key: str, min_quality_score: int = 50,
+                 max_workers: int = 1, requests_per_second: float = 1.0, burst: int = 1,
+                 api_cache: Optional[APICache] = None, quota_ledger: Optional[QuotaLedger] = None,
+                 phase_budgets: Optional[Dict[str, int]] = None,
+                 max_videos_per_keyword: int = 25, max_videos_per_channel: int = 15,
+                 collection_state: Optional[CollectionState] = None,
+                 on_video_accepted: Optional[Callable[[VideoData], None]] = None,
+                 on_video_discarded: Optional[Callable[[VideoData], None]] = None,
+                 near_duplicate_threshold: Optional[float] = 0.6,
+                 existing_videos: Optional[List[VideoData]] = None):
+        # 모든 워커가 하나의 토큰 버킷을 공유하여 API 호출 속도 제한
+        self.rate_limiter = TokenBucketRateLimiter(requests_per_second, burst)
+        self.api_cache = api_cache
+        self.quota_ledger = quota_ledger
+        # 단계별 쿼터 예산 ('search', 'channel_expansion'), 없으면 일일 한도만 적용
+        self.phase_budgets = phase_budgets or {}
+        self.youtube_collector = YouTubeCollector(
+            api_key, rate_limiter=self.rate_limiter, cache=api_cache, quota_ledger=quota_ledger
+        )
         self.content_analyzer = ContentAnalyzer()
         self.min_quality_score = min_quality_score
+        self.max_workers = max(1, max_workers)
+        # 50개를 넘으면 nextPageToken을 따라 여러 페이지를 조회
+        self.max_videos_per_keyword = max_videos_per_keyword
+        self.max_videos_per_channel = max_videos_per_channel
+        # 상태 저장소가 있으면 증분 수집 (이전 실행 이후의 새 영상만)
+        self.collection_state = collection_state
+        # 품질 기준을 통과한 영상마다 즉시 호출 (예: JSONL 파일에 바로 추가)
+        self.on_video_accepted = on_video_accepted
+        # on_video_accepted로 넘긴 뒤 3단계에서 유사 중복으로 빠진 영상마다 호출
+        self.on_video_discarded = on_video_discarded
+        # 재업로드 등 유사 중복 탐지 (None이면 video_id 기준 중복 제거만 수행)
+        self.near_duplicate_detector = (
+            NearDuplicateDetector(threshold=near_duplicate_threshold) if near_duplicate_threshold is not None else None
+        )
+        # 증분 수집 시 병합할 기존 데이터셋 (새 영상의 유사 중복 비교와 채널 통계에 포함)
+        self.existing_videos = existing_videos or []
         self.logger = logging.getLogger(__name__)
         
+        # 여러 검색/채널의 새 영상 ID를 모아 50개 단위로 상세 조회
+        self.detail_buffer = VideoDetailsBuffer()
+        
+        # 채택된 영상의 리포트 통계 (수집 중에도 snapshot()으로 진행 상황 확인 가능)
+        self.report_accumulator = ReportAccumulator()
+        
+        # 키워드별 수집 통계 (발견 / 분석 / 채택)
+        self.keyword_stats: Dict[str, Dict[str, int]] = {}
+        
         # 수집 통계
         self.stats = {
             'total_searched': 0,
             'total_analyzed': 0,
             'high_quality_videos': 0,
-            'channels_discovered': 0
+            'channels_discovered': 0,
+            'detail_requests': 0,  # videos.list 요청 수
+            'near_duplicates_removed': 0,
+            'quota_exhausted': None  # 'phase' / 'daily' (쿼터 소진으로 중단된 경우)
         }
     
     def collect_oxford_reading_tree_level1(self) -> Dict[str, any]:
@@ -33,67 +84,138 @@ class MainCollector:
         start_time = datetime.now()
         
         all_videos = []
-        channel_stats = {}
+        channel_stats: Dict[str, ChannelAggregate] = {}
+        
+        # 증분 수집: 이전에 분석한 영상은 건너뛰고, 키워드/채널별 마지막 수집 시각 이후만 조회
+        run_started_at = datetime.now(timezone.utc)
+        keyword_watermarks = {}
+        if self.collection_state:
+            seen_ids = self.collection_state.load_seen_ids()
+            self.youtube_collector.known_video_ids = seen_ids
+            self.youtube_collector.collected_video_ids.update(seen_ids)
+            keyword_watermarks = {
+                keyword: self.collection_state.get_watermark('keyword', keyword)
+                for keyword in SEARCH_KEYWORDS
+            }
+            self.logger.info(f"🔁 증분 수집 모드: 기존 영상 {len(seen_ids)}개 제외")
         
         # 1단계: 키워드 기반 영상 검색
-        self.logger.info("📋 1단계: 키워드 기반 영상 검색")
+        self.logger.info(f"📋 1단계: 키워드 기반 영상 검색 (동시 작업 {self.max_workers}개)")
+        self._start_quota_phase('search')
         
-        for i, keyword in enumerate(SEARCH_KEYWORDS, 1):
-            self.logger.info(f"  ({i}/{len(SEARCH_KEYWORDS)}) 검색: '{keyword}'")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # 검색은 워커에서 병렬 실행하고, 새 ID는 스테이징 버퍼에 모아
+            # 키워드와 무관하게 50개씩 꽉 찬 videos.list 요청으로 조회
+            search_results = self._run_tasks(
+                executor,
+                lambda keyword: self.youtube_collector.search_video_ids(
+                    keyword, max_results=self.max_videos_per_keyword,
+                    published_after=keyword_watermarks.get(keyword)
+                ),
+                SEARCH_KEYWORDS
+            )
             
-            videos = self.youtube_collector.search_videos(keyword, max_results=25)
-            self.stats['total_searched'] += len(videos)
+            detail_futures = []
+            for i, (keyword, video_ids) in enumerate(search_results, 1):
+                self.logger.info(f"  ({i}/{len(SEARCH_KEYWORDS)}) 검색: '{keyword}' → 새 영상 {len(video_ids)}개")
+                self.keyword_stats[keyword] = {'found': len(video_ids), 'analyzed': 0, 'accepted': 0}
+                self.detail_buffer.stage(video_ids, keyword)
+                detail_futures.extend(self._submit_detail_batches(executor, self.detail_buffer.take_full_batches()))
             
-            # 각 영상 품질 분석
-            for video in videos:
-                quality_score = self.content_analyzer.calculate_quality_score(video)
-                video.quality_score = quality_score
-                video.is_level1_content = self.content_analyzer.is_level1_content(video)
-                video.learning_objectives = self.content_analyzer.extract_learning_objectives(video)
-                
-                self.stats['total_analyzed'] += 1
-                
-                # 고품질 영상만 수집
-                if quality_score >= self.min_quality_score:
-                    all_videos.append(video)
-                    self.stats['high_quality_videos'] += 1
-                    
-                    # 채널 통계 업데이트
-                    self._update_channel_stats(channel_stats, video)
+            # 1단계 종료 시 남은 ID flush (채널 통계가 2단계 입력이므로)
+            detail_futures.extend(self._submit_detail_batches(executor, self.detail_buffer.take_all()))
             
-            # API 제한 준수
-            time.sleep(1)
+            # 분석/통계 갱신은 현재 스레드에서 처리하여 공유 상태를 단일 스레드로 유지
+            for _, videos_by_keyword in self._iter_results(detail_futures):
+                self._mark_seen(videos_by_keyword)
+                for keyword, videos in videos_by_keyword.items():
+                    self.stats['total_searched'] += len(videos)
+                    keyword_stats = self.keyword_stats[keyword]
+                    
+                    # 각 영상 품질 분석
+                    for video in videos:
+                        quality_score = self._apply_analysis(video)
+                        
+                        self.stats['total_analyzed'] += 1
+                        keyword_stats['analyzed'] += 1
+                        
+                        # 고품질 영상만 수집
+                        if quality_score >= self.min_quality_score:
+                            all_videos.append(video)
+                            self.stats['high_quality_videos'] += 1
+                            self._emit_accepted(video)
+                            keyword_stats['accepted'] += 1
+                            
+                            # 채널 통계 업데이트
+                            self._update_channel_stats(channel_stats, video)
+        
+        self._advance_watermarks('keyword', self.keyword_stats.keys(), run_started_at)
+        self._log_progress()
         
         # 2단계: 고품질 채널에서 추가 수집
         self.logger.info("🏆 2단계: 고품질 채널에서 추가 수집")
         
         high_quality_channels = self._identify_high_quality_channels(channel_stats)
+        if self.stats['quota_exhausted'] == 'daily':
+            self.logger.warning("  일일 쿼터가 소진되어 채널 추가 수집을 건너뜁니다")
+            high_quality_channels = {}
+        self._start_quota_phase('channel_expansion')
         
-        for channel_id, channel_info in high_quality_channels.items():
-            self.logger.info(f"  추가 수집: {channel_info['name']}")
+        channel_watermarks = {}
+        if self.collection_state:
+            channel_watermarks = {
+                channel_id: self.collection_state.get_watermark('channel', channel_id)
+                for channel_id in high_quality_channels
+            }
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            channel_results = self._run_tasks(
+                executor,
+                lambda channel_id: self.youtube_collector.get_channel_video_ids(
+                    channel_id, max_results=self.max_videos_per_channel,
+                    published_after=channel_watermarks.get(channel_id)
+                ),
+                list(high_quality_channels.keys())
+            )
             
-            additional_videos = self.youtube_collector.get_channel_videos(channel_id, max_results=15)
+            detail_futures = []
+            expanded_channels = []
+            for channel_id, video_ids in channel_results:
+                expanded_channels.append(channel_id)
+                self.logger.info(f"  추가 수집: {high_quality_channels[channel_id].name} → 새 영상 {len(video_ids)}개")
+                self.detail_buffer.stage(video_ids, channel_id)
+                detail_futures.extend(self._submit_detail_batches(executor, self.detail_buffer.take_full_batches()))
             
-            for video in additional_videos:
-                quality_score = self.content_analyzer.calculate_quality_score(video)
-                video.quality_score = quality_score
-                video.is_level1_content = self.content_analyzer.is_level1_content(video)
-                video.learning_objectives = self.content_analyzer.extract_learning_objectives(video)
-                
-                if quality_score >= self.min_quality_score:
-                    all_videos.append(video)
-                    self.stats['high_quality_videos'] += 1
+            # 수집 종료 시 버퍼에 남은 ID flush
+            detail_futures.extend(self._submit_detail_batches(executor, self.detail_buffer.take_all()))
             
-            time.sleep(2)  # 채널별 대기
+            for _, videos_by_channel in self._iter_results(detail_futures):
+                self._mark_seen(videos_by_channel)
+                for additional_videos in videos_by_channel.values():
+                    for video in additional_videos:
+                        quality_score = self._apply_analysis(video)
+                        
+                        if quality_score >= self.min_quality_score:
+                            all_videos.append(video)
+                            self.stats['high_quality_videos'] += 1
+                            self._emit_accepted(video)
+        
+        self._advance_watermarks('channel', expanded_channels, run_started_at)
         
         # 3단계: 데이터 정제 및 정렬
         self.logger.info("🔧 3단계: 데이터 정제 및 정렬")
         
-        # 중복 제거
+        # 중복 제거 (같은 video_id → 유사 중복/재업로드, 기존 데이터셋에 이미 있는 재업로드 포함)
         unique_videos = self._remove_duplicates(all_videos)
+        unique_videos = self._remove_near_duplicates(unique_videos)
+        
+        # 빠진 영상을 제외하고 병합될 데이터셋 기준으로 채널 통계를 다시 집계
+        channel_stats = self._rebuild_channel_stats(unique_videos)
         
         # 품질 점수로 정렬
         sorted_videos = sorted(unique_videos, key=lambda x: x.quality_score, reverse=True)
+        if not self.report_accumulator.top_complete:
+            self.report_accumulator.rebuild_top(sorted_videos)
         
         # 최종 통계
         end_time = datetime.now()
@@ -105,35 +227,128 @@ class MainCollector:
         self.logger.info(f"  - 분석된 영상: {self.stats['total_analyzed']}개") 
         self.logger.info(f"  - 고품질 영상: {len(sorted_videos)}개")
         self.logger.info(f"  - 발견된 채널: {len(channel_stats)}개")
+        self.logger.info(f"  - 상세 조회 요청: {self.stats['detail_requests']}회")
+        if self.api_cache:
+            cache_stats = self.api_cache.get_stats()
+            self.logger.info(f"  - API 캐시: 적중 {cache_stats['hits']}회 / 실패 {cache_stats['misses']}회 "
+                             f"/ 재검증 {cache_stats['revalidated']}회")
+        if self.quota_ledger:
+            quota = self.quota_ledger.get_summary()
+            self.logger.info(f"  - 쿼터 사용: {quota['spent']}/{quota['daily_limit']} units")
+        if self.stats['quota_exhausted']:
+            self.logger.warning("  ⚠️ 쿼터 소진으로 일부 작업이 중단되어 부분 결과만 저장됩니다")
         
         return {
             'videos': sorted_videos,
             'channel_stats': channel_stats,
             'collection_stats': self.stats,
+            'keyword_stats': self.keyword_stats,
+            'report_summary': self.report_accumulator.snapshot(),
+            'incremental': self.collection_state is not None,
+            'api_cache_stats': self.api_cache.get_stats() if self.api_cache else None,
+            'quota_usage': self.quota_ledger.get_summary() if self.quota_ledger else None,
             'collection_time': duration,
             'timestamp': end_time
         }
     
-    def _update_channel_stats(self, channel_stats: Dict, video: VideoData):
-        """채널 통계 업데이트"""
+    def _start_quota_phase(self, phase: str):
+        """쿼터 장부에 현재 수집 단계와 예산 등록"""
+        if self.quota_ledger is None:
+            return
+        budget = self.phase_budgets.get(phase)
+        self.quota_ledger.start_phase(phase, budget)
+        if budget is not None:
+            self.logger.info(f"  쿼터 예산: {budget} units (남은 일일 쿼터 {self.quota_ledger.remaining()} units)")
+    
+    def _run_tasks(self, executor: ThreadPoolExecutor, func, items: List):
+        """작업을 병렬 실행하고 입력 순서대로 (item, 결과)를 반환"""
+        futures = [(item, executor.submit(func, item)) for item in items]
+        return self._iter_results(futures)
+    
+    def _submit_detail_batches(self, executor: ThreadPoolExecutor, batches: List) -> List:
+        """스테이징 버퍼에서 꺼낸 배치의 videos.list 조회를 워커에 제출"""
+        futures = []
+        for batch in batches:
+            self.stats['detail_requests'] += 1
+            futures.append((batch, executor.submit(self.youtube_collector.fetch_staged_batch, batch)))
+        return futures
+    
+    def _iter_results(self, futures: List):
+        """(item, future) 목록을 순서대로 기다려 (item, 결과)를 반환
+        
+        쿼터가 소진되면 대기 중인 작업을 취소하고, 이미 끝난 작업의 결과만 돌려준다.
+        """
+        for item, future in futures:
+            if future.cancelled():
+                continue
+            try:
+                result = future.result()
+            except QuotaExceededError as e:
+                if self.stats['quota_exhausted'] != 'daily':
+                    self.stats['quota_exhausted'] = e.scope
+                    self.logger.warning(f"  ⛔ {e} - 남은 작업을 중단합니다")
+                for _, pending in futures:
+                    pending.cancel()
+                continue
+            yield item, result
+    
+    def _apply_analysis(self, video: VideoData) -> int:
+        """영상 분석 결과(품질 점수, Level 1 여부, 학습 목표)를 영상에 기록하고 점수 반환"""
+        analysis = self.content_analyzer.analyze(video)
+        video.quality_score = analysis.quality_score
+        video.is_level1_content = analysis.is_level1_content
+        video.learning_objectives = analysis.learning_objectives
+        return analysis.quality_score
+    
+    def _log_progress(self):
+        """누적 중인 리포트 통계로 중간 진행 상황 출력"""
+        progress = self.report_accumulator.snapshot()
+        self.logger.info(f"📈 진행 상황: 채택 {progress['total_videos']}개 "
+                         f"(평균 {progress['avg_quality_score']:.1f}점, Level 1 {progress['level1_videos']}개, "
+                         f"채널 {progress['channel_count']}개)")
+    
+    def _emit_accepted(self, video: VideoData):
+        self.report_accumulator.add(video)
+        if self.on_video_accepted is not None:
+            self.on_video_accepted(video)
+    
+    def _mark_seen(self, videos_by_source: Dict[str, List[VideoData]]):
+        """상세 조회한 영상을 상태 저장소에 기록 (다음 실행에서 다시 분석하지 않음)"""
+        if self.collection_state is None:
+            return
+        self.collection_state.add_seen_ids(
+            video.video_id for videos in videos_by_source.values() for video in videos
+        )
+    
+    def _advance_watermarks(self, scope: str, keys, run_started_at: datetime):
+        """수집이 끝난 키워드/채널의 워터마크를 이번 실행 시작 시각으로 갱신
+        
+        쿼터 소진으로 중단된 경우에는 누락을 막기 위해 갱신하지 않는다.
+        검색이 실패했거나 결과 상한에 걸려 구간 일부만 읽은 키는 이전 워터마크를 유지해
+        다음 실행에서 같은 구간을 다시 검색한다 (이미 본 영상은 seen ID로 걸러짐).
+        """
+        if self.collection_state is None or self.stats['quota_exhausted']:
+            return
+        incomplete = self.youtube_collector.incomplete_sources
+        kept = 0
+        for key in keys:
+            if (scope, key) in incomplete:
+                kept += 1
+                continue
+            self.collection_state.set_watermark(scope, key, run_started_at)
+        if kept:
+            self.logger.info(f"  ↩️ {scope} {kept}개는 구간을 다 읽지 못해 워터마크를 유지합니다")
+    
+    def _update_channel_stats(self, channel_stats: Dict[str, ChannelAggregate], video: VideoData):
+        """채널 통계 업데이트 (영상 객체는 보관하지 않음)"""
         channel_id = video.channel_id
         
         if channel_id not in channel_stats:
-            channel_stats[channel_id] = {
-                'name': video.channel_title,
-                'video_count': 0,
-                'total_quality_score': 0,
-                'videos': [],
-                'avg_quality_score': 0
-            }
+            channel_stats[channel_id] = ChannelAggregate(channel_id, video.channel_title)
         
-        stats = channel_stats[channel_id]
-        stats['video_count'] += 1
-        stats['total_quality_score'] += video.quality_score
-        stats['avg_quality_score'] = stats['total_quality_score'] / stats['video_count']
-        stats['videos'].append(video)
+        channel_stats[channel_id].add(video.video_id, video.quality_score)
     
-    def _identify_high_quality_channels(self, channel_stats: Dict) -> Dict:
+    def _identify_high_quality_channels(self, channel_stats: Dict[str, ChannelAggregate]) -> Dict[str, ChannelAggregate]:
         """고품질 채널 식별"""
         high_quality_channels = {}
         
@@ -141,20 +356,51 @@ class MainCollector:
             # 고품질 채널 기준:
             # 1. 2개 이상의 고품질 영상
             # 2. 평균 품질 점수 70점 이상
-            if (stats['video_count'] >= 2 and 
-                stats['avg_quality_score'] >= 70):
+            if (stats.video_count >= 2 and 
+                stats.avg_quality_score >= 70):
                 
                 high_quality_channels[channel_id] = stats
         
         # 상위 5개 채널만 추가 수집
         sorted_channels = sorted(
             high_quality_channels.items(),
-            key=lambda x: x[1]['avg_quality_score'],
+            key=lambda x: x[1].avg_quality_score,
             reverse=True
         )
         
         return dict(sorted_channels[:5])
     
+    def _rebuild_channel_stats(self, videos: List[VideoData]) -> Dict[str, ChannelAggregate]:
+        """기존 데이터셋(같은 video_id는 새 결과로 교체)과 최종 영상으로 채널 통계 집계"""
+        merged = {video.video_id: video for video in self.existing_videos}
+        for video in videos:
+            merged[video.video_id] = video
+        
+        channel_stats: Dict[str, ChannelAggregate] = {}
+        for video in merged.values():
+            self._update_channel_stats(channel_stats, video)
+        return channel_stats
+    
+    def _remove_near_duplicates(self, videos: List[VideoData]) -> List[VideoData]:
+        """유사 중복 군집마다 품질 점수가 가장 높은 영상만 남김 (기존 데이터셋과 겹치는 새 영상은 제거)"""
+        if self.near_duplicate_detector is None:
+            return videos
+        
+        # 다시 수집한 영상은 기존 항목을 교체하므로 비교 대상에서 뺌
+        new_ids = {video.video_id for video in videos}
+        existing = [video for video in self.existing_videos if video.video_id not in new_ids]
+        kept_videos, removed_videos = self.near_duplicate_detector.deduplicate(videos, existing)
+        for video in removed_videos:
+            self.report_accumulator.discard(video)
+            if self.on_video_discarded is not None:
+                self.on_video_discarded(video)
+        
+        self.stats['near_duplicates_removed'] = len(removed_videos)
+        if removed_videos:
+            self.logger.info(f"  유사 중복 제거: {len(removed_videos)}개 영상")
+        
+        return kept_videos
+    
     def _remove_duplicates(self, videos: List[VideoData]) -> List[VideoData]:
         """중복 영상 제거"""
         seen_ids = set()
@@ -164,6 +410,8 @@ class MainCollector:
             if video.video_id not in seen_ids:
                 seen_ids.add(video.video_id)
                 unique_videos.append(video)
+            else:
+                self.report_accumulator.discard(video)
         
         removed_count = len(videos) - len(unique_videos)
         if removed_count > 0:
@@ -1,68 +1,327 @@
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from typing import List, Dict, Optional
-import time
+from typing import Callable, List, Dict, Optional, Tuple, Iterator
+import threading
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from ..models.video_model import VideoData
 from ..models.channel_model import ChannelData
+from ..storage.api_cache import APICache
+from ..utils.rate_limiter import TokenBucketRateLimiter
+from ..utils.quota_ledger import QuotaLedger, QuotaExceededError
+from ..utils.prefetch import prefetch
+
+class VideoDetailsBuffer:
+    """videos.list 상세 조회를 위한 영상 ID 스테이징 버퍼
+    
+    여러 검색/채널에서 발견한 새 ID를 모아 한 번에 최대 50개씩 조회하도록
+    배치를 만든다. 각 ID의 출처(키워드 또는 채널)를 함께 보관한다.
+    """
+    
+    BATCH_SIZE = 50  # videos.list 요청당 최대 ID 수
+    
+    def __init__(self, batch_size: int = BATCH_SIZE):
+        self.batch_size = batch_size
+        self._pending: List[Tuple[str, str]] = []
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+    
+    def stage(self, video_ids: List[str], source: str):
+        """조회 대기열에 ID 추가"""
+        with self._lock:
+            self._pending.extend((video_id, source) for video_id in video_ids)
+    
+    def take_full_batches(self) -> List[List[Tuple[str, str]]]:
+        """가득 찬 배치만 꺼냄 (나머지는 다음 flush까지 대기)"""
+        with self._lock:
+            full_count = len(self._pending) // self.batch_size * self.batch_size
+            ready, self._pending = self._pending[:full_count], self._pending[full_count:]
+        return [ready[i:i + self.batch_size] for i in range(0, len(ready), self.batch_size)]
+    
+    def take_all(self) -> List[List[Tuple[str, str]]]:
+        """남은 ID를 모두 꺼냄 (마지막 배치는 50개 미만일 수 있음)"""
+        with self._lock:
+            ready, self._pending = self._pending, []
+        return [ready[i:i + self.batch_size] for i in range(0, len(ready), self.batch_size)]
+
 
 class YouTubeCollector:
-    def __init__(self, api_key: str):
-        self.youtube = build('youtube', 'v3', developerKey=api_key)
+    def __init__(self, api_key: str, rate_limiter: Optional[TokenBucketRateLimiter] = None,
+                 cache: Optional[APICache] = None, quota_ledger: Optional[QuotaLedger] = None):
+        self.api_key = api_key
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.quota_ledger = quota_ledger
         self.logger = logging.getLogger(__name__)
         self.collected_video_ids = set()
-    
+        # 이전 실행에서 이미 분석한 영상 ID (증분 수집 시 채널 업로드 목록 조기 종료 기준)
+        self.known_video_ids = set()
+        # 검색이 실패했거나 결과 상한에 걸려 일부만 읽은 (scope, 키워드/채널 ID)
+        # 이런 출처의 워터마크를 옮기면 읽지 못한 구간을 다시 검색하지 않게 된다
+        self.incomplete_sources = set()
+
+        # httplib2 기반 클라이언트는 스레드 안전하지 않으므로 스레드별로 생성
+        self._local = threading.local()
+        self._ids_lock = threading.Lock()
+
+    @property
+    def youtube(self):
+        """현재 스레드 전용 YouTube API 클라이언트"""
+        service = getattr(self._local, 'youtube', None)
+        if service is None:
+            service = build('youtube', 'v3', developerKey=self.api_key, cache_discovery=False)
+            self._local.youtube = service
+        return service
+
+    def _execute(self, request) -> Dict:
+        """속도 제한을 적용하여 API 요청 실행"""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return request.execute()
+
+    def _call(self, endpoint: str, **params) -> Dict:
+        """`<endpoint>().list(**params)` 호출 (캐시 적용)
+
+        신선한 캐시 항목은 네트워크와 쿼터를 쓰지 않고 바로 반환하고,
+        만료된 항목은 ETag(If-None-Match)로 재검증한다.
+        네트워크 호출 전에는 쿼터 장부에 비용을 예약하며, 예산이 없으면
+        QuotaExceededError가 발생한다.
+        """
+        cached, etag = None, None
+        if self.cache is not None:
+            params = self.cache.normalize_params(params)
+            cached, etag, is_fresh = self.cache.lookup(endpoint, params)
+            if cached is not None and is_fresh:
+                self.cache.record_hit()
+                return cached
+
+        request = getattr(self.youtube, endpoint)().list(**params)
+        if cached is not None and etag:
+            request.headers['If-None-Match'] = etag
+
+        if self.quota_ledger is not None:
+            self.quota_ledger.charge(endpoint)
+
+        try:
+            response = self._execute(request)
+        except HttpError as e:
+            if cached is not None and e.resp.status == 304:
+                self.cache.record_revalidated()
+                self.cache.touch(endpoint, params)
+                return cached
+            if self._is_quota_error(e):
+                if self.quota_ledger is not None:
+                    self.quota_ledger.mark_exhausted()
+                raise QuotaExceededError(f"YouTube API 쿼터 초과: {endpoint}") from e
+            raise
+
+        if self.cache is not None:
+            self.cache.record_miss()
+            self.cache.store(endpoint, params, response)
+        return response
+
+    @staticmethod
+    def _is_quota_error(error: HttpError) -> bool:
+        """403 quotaExceeded / dailyLimitExceeded 응답인지 확인"""
+        if error.resp.status != 403:
+            return False
+        content = error.content.decode('utf-8', 'ignore') if isinstance(error.content, bytes) else str(error.content)
+        return 'quotaExceeded' in content or 'dailyLimitExceeded' in content
+
+    def _claim_new_ids(self, video_ids: List[str]) -> List[str]:
+        """아직 수집되지 않은 ID만 골라 수집 목록에 등록 (스레드 안전)"""
+        with self._ids_lock:
+            new_ids = []
+            for vid in video_ids:
+                if vid not in self.collected_video_ids:
+                    self.collected_video_ids.add(vid)
+                    new_ids.append(vid)
+            return new_ids
+
+    def _mark_complete(self, scope: str, key: str, complete: bool):
+        """출처의 이번 검색이 구간 전체를 읽었는지 기록 (스레드 안전)"""
+        with self._ids_lock:
+            if complete:
+                self.incomplete_sources.discard((scope, key))
+            else:
+                self.incomplete_sources.add((scope, key))
+
+    @staticmethod
+    def _to_rfc3339(value: datetime) -> str:
+        """API의 publishedAfter 형식 (UTC, 예: 2024-12-02T14:30:22Z)"""
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.strftime('%Y-%m-%dT%H:%M:%SZ')
+
     def search_videos(self, query: str, max_results: int = 25) -> List[Dict]:
         """키워드로 영상 검색"""
+        new_video_ids = self.search_video_ids(query, max_results)
+        if not new_video_ids:
+            return []
+        
+        # 영상 상세 정보 가져오기
+        videos = self._get_videos_details(new_video_ids)
+        self.logger.info(f"수집 완료: {len(videos)}개 영상 (중복 제거 후)")
+        return videos
+    
+    def search_video_ids(self, query: str, max_results: int = 25,
+                         published_after: Optional[datetime] = None) -> List[str]:
+        """키워드로 검색하여 새로 발견한 영상 ID만 반환 (상세 조회는 호출자가 처리)
+        
+        published_after를 주면 그 이후 게시된 영상만 검색한다 (증분 수집).
+        오류로 중단되었거나 결과가 max_results개에 닿아 뒤쪽 결과를 읽지 못한 검색은
+        incomplete_sources에 ('keyword', query)로 남는다.
+        """
+        complete = False
         try:
-            self.logger.info(f"검색 시작: '{query}' (최대 {max_results}개)")
-            
-            search_response = self.youtube.search().list(
-                q=query,
-                part='id,snippet',
-                maxResults=max_results,
-                type='video',
-                order='relevance',
-                videoDuration='medium',  # 4-20분 영상
-                videoDefinition='any',
-                regionCode='US'  # 영어 콘텐츠 우선
-            ).execute()
-            
-            videos = []
-            video_ids = [item['id']['videoId'] for item in search_response['items']]
-            
-            # 중복 제거
-            new_video_ids = [vid for vid in video_ids if vid not in self.collected_video_ids]
-            self.collected_video_ids.update(new_video_ids)
+            since = f", {published_after.isoformat()} 이후" if published_after else ""
+            self.logger.info(f"검색 시작: '{query}' (최대 {max_results}개{since})")
             
-            if new_video_ids:
-                # 영상 상세 정보 가져오기
-                video_details = self._get_videos_details(new_video_ids)
-                videos.extend(video_details)
+            # 페이지를 처리하는 동안 다음 페이지를 미리 가져옴
+            new_video_ids = []
+            fetched = 0
+            pages = self.iter_search_pages(query, max_items=max_results, published_after=published_after)
+            for page in prefetch(pages):
+                video_ids = [item['id']['videoId'] for item in page]
+                fetched += len(video_ids)
+                
+                # 중복 제거
+                new_video_ids.extend(self._claim_new_ids(video_ids))
             
-            self.logger.info(f"수집 완료: {len(videos)}개 영상 (중복 제거 후)")
-            return videos
+            # 관련도순 검색이라 상한에 닿으면 남은 새 영상이 있을 수 있음
+            complete = fetched < max_results
+            self.logger.info(f"검색 완료: '{query}' 새 영상 {len(new_video_ids)}개 (중복 제거 후)")
+            return new_video_ids
             
+        except QuotaExceededError:
+            # 쿼터 소진은 빈 결과로 삼키지 않고 호출자에게 전달
+            raise
         except HttpError as e:
             self.logger.error(f"YouTube API 오류: {e}")
             return []
         except Exception as e:
             self.logger.error(f"예상치 못한 오류: {e}")
             return []
+        finally:
+            self._mark_complete('keyword', query, complete)
+    
+    def iter_search_pages(self, query: str, max_items: Optional[int] = 50,
+                          max_quota: Optional[int] = None,
+                          published_after: Optional[datetime] = None) -> Iterator[List[Dict]]:
+        """검색 결과를 nextPageToken을 따라 페이지 단위로 순회
+        
+        max_items(결과 수) 또는 max_quota(사용할 쿼터 units)에 도달하면 멈춘다.
+        한 번에 한 페이지만 메모리에 유지한다.
+        """
+        params = {
+            'q': query,
+            'part': 'id,snippet',
+            'type': 'video',
+            'order': 'relevance',
+            'videoDuration': 'medium',  # 4-20분 영상
+            'videoDefinition': 'any',
+            'regionCode': 'US'  # 영어 콘텐츠 우선
+        }
+        if published_after is not None:
+            params['publishedAfter'] = self._to_rfc3339(published_after)
+        yield from self._iter_pages('search', params, max_items, max_quota)
+    
+    def iter_search_results(self, query: str, max_items: Optional[int] = 50,
+                            max_quota: Optional[int] = None,
+                            published_after: Optional[datetime] = None) -> Iterator[Dict]:
+        """검색 결과 항목 스트리밍 (다음 페이지는 백그라운드에서 미리 조회)"""
+        for page in prefetch(self.iter_search_pages(query, max_items, max_quota, published_after)):
+            yield from page
+    
+    def iter_playlist_pages(self, playlist_id: str, max_items: Optional[int] = 50,
+                            max_quota: Optional[int] = None,
+                            stop_at: Optional[Callable[[Dict], bool]] = None) -> Iterator[List[Dict]]:
+        """플레이리스트 항목을 nextPageToken을 따라 페이지 단위로 순회
+        
+        stop_at을 만족하는 항목이 있는 페이지를 마지막으로 다음 페이지는 요청하지 않는다.
+        """
+        params = {'part': 'snippet', 'playlistId': playlist_id}
+        yield from self._iter_pages('playlistItems', params, max_items, max_quota, stop_at)
+    
+    def iter_playlist_items(self, playlist_id: str, max_items: Optional[int] = 50,
+                            max_quota: Optional[int] = None,
+                            stop_at: Optional[Callable[[Dict], bool]] = None) -> Iterator[Dict]:
+        """플레이리스트 항목 스트리밍 (다음 페이지는 백그라운드에서 미리 조회)
+        
+        stop_at을 주면 그 항목 바로 앞에서 멈추고, 멈출 페이지 다음은 미리 조회하지도 않는다.
+        """
+        for page in prefetch(self.iter_playlist_pages(playlist_id, max_items, max_quota, stop_at)):
+            for item in page:
+                if stop_at is not None and stop_at(item):
+                    return
+                yield item
+    
+    def _iter_pages(self, endpoint: str, params: Dict, max_items: Optional[int],
+                    max_quota: Optional[int],
+                    stop_at: Optional[Callable[[Dict], bool]] = None) -> Iterator[List[Dict]]:
+        """페이지네이션 공통 처리 (stop_at을 만족하는 항목이 있으면 그 페이지에서 끝냄)"""
+        page_cost = QuotaLedger.UNIT_COSTS.get(endpoint, 1)
+        page_token = None
+        fetched = 0
+        spent = 0
+        
+        while max_items is None or fetched < max_items:
+            if max_quota is not None and spent + page_cost > max_quota:
+                break
+            
+            page_size = 50 if max_items is None else min(50, max_items - fetched)
+            page_params = dict(params, maxResults=page_size)
+            if page_token:
+                page_params['pageToken'] = page_token
+            
+            response = self._call(endpoint, **page_params)
+            spent += page_cost
+            
+            items = response.get('items', [])[:page_size]
+            fetched += len(items)
+            if items:
+                yield items
+            
+            # 선행 조회 중에도 멈출 지점이 나온 페이지 뒤로는 쿼터를 쓰지 않음
+            if stop_at is not None and any(stop_at(item) for item in items):
+                break
+            
+            page_token = response.get('nextPageToken')
+            if not page_token or not items:
+                break
     
     def get_video_details(self, video_id: str) -> Optional[VideoData]:
         """영상 상세 정보 가져오기"""
+        videos = self._get_videos_details([video_id])
+        return videos[0] if videos else None
+
+    def fetch_staged_batch(self, batch: List[Tuple[str, str]]) -> Dict[str, List[VideoData]]:
+        """스테이징 버퍼에서 꺼낸 (video_id, source) 배치를 한 번에 조회하여 출처별로 반환"""
+        source_by_id = dict(batch)
+        videos_by_source: Dict[str, List[VideoData]] = {}
+        
+        for video in self._get_videos_details(list(source_by_id)):
+            source = source_by_id.get(video.video_id)
+            videos_by_source.setdefault(source, []).append(video)
+        
+        return videos_by_source
+
+    def _get_videos_details(self, video_ids: List[str]) -> List[VideoData]:
+        """여러 영상의 상세 정보 가져오기"""
         try:
             # 한 번에 최대 50개씩 처리
             videos = []
             for i in range(0, len(video_ids), 50):
                 batch_ids = video_ids[i:i+50]
-                
-                response = self.youtube.videos().list(
+
+                response = self._call(
+                    'videos',
                     part='snippet,statistics,contentDetails',
                     id=','.join(batch_ids)
-                ).execute()
+                )
                 
                 for item in response['items']:
                     try:
@@ -82,10 +341,11 @@ class YouTubeCollector:
     def get_channel_info(self, channel_id: str) -> Optional[ChannelData]:
         """채널 정보 가져오기"""
         try:
-            response = self.youtube.channels().list(
+            response = self._call(
+                'channels',
                 part='snippet,statistics',
                 id=channel_id
-            ).execute()
+            )
             
             if not response['items']:
                 return None
@@ -110,47 +370,82 @@ class YouTubeCollector:
     
     def get_channel_videos(self, channel_id: str, max_results: int = 25) -> List[Dict]:
         """채널의 영상 목록 가져오기"""
+        relevant_video_ids = self.get_channel_video_ids(channel_id, max_results)
+        if relevant_video_ids:
+            return self._get_videos_details(relevant_video_ids)
+        return []
+    
+    def get_channel_video_ids(self, channel_id: str, max_results: int = 25,
+                              published_after: Optional[datetime] = None) -> List[str]:
+        """채널 업로드 목록에서 새로 발견한 ORT 관련 영상 ID만 반환
+        
+        업로드 목록은 최신순이므로, 이전 실행에서 본 영상이나 published_after
+        이전 항목을 만나면 나머지 페이지는 읽지 않는다 (증분 수집).
+        그 전에 max_results개에 닿았거나 오류로 중단되면 incomplete_sources에 ('channel', channel_id)로 남는다.
+        """
+        complete = False
         try:
             # 채널의 업로드 플레이리스트 ID 가져오기
-            channel_response = self.youtube.channels().list(
+            channel_response = self._call(
+                'channels',
                 part='contentDetails',
                 id=channel_id
-            ).execute()
+            )
             
             if not channel_response['items']:
                 self.logger.warning(f"채널을 찾을 수 없음: {channel_id}")
+                complete = True
                 return []
             
             uploads_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
             
-            # 플레이리스트에서 영상 목록 가져오기
-            playlist_response = self.youtube.playlistItems().list(
-                part='snippet',
-                playlistId=uploads_playlist_id,
-                maxResults=max_results
-            ).execute()
-            
+            # 플레이리스트에서 영상 목록 가져오기 (페이지 단위 스트리밍)
             # Oxford Reading Tree 관련 영상만 필터링
-            relevant_video_ids = []
-            for item in playlist_response['items']:
+            # 이전 실행에서 본 업로드에 닿으면 그 앞에서 멈추고 다음 페이지는 요청하지 않음
+            candidate_ids = []
+            fetched = 0
+            items = self.iter_playlist_items(
+                uploads_playlist_id, max_items=max_results,
+                stop_at=lambda item: self._reached_known_upload(item, published_after)
+            )
+            for item in items:
+                fetched += 1
+                
                 title = item['snippet']['title'].lower()
                 description = item['snippet']['description'].lower()
-                
+
                 if self._is_ort_related(title, description):
-                    video_id = item['snippet']['resourceId']['videoId']
-                    if video_id not in self.collected_video_ids:
-                        relevant_video_ids.append(video_id)
-            
-            # 상세 정보 가져오기
-            if relevant_video_ids:
-                self.collected_video_ids.update(relevant_video_ids)
-                return self._get_videos_details(relevant_video_ids)
-            
-            return []
+                    candidate_ids.append(item['snippet']['resourceId']['videoId'])
+
+            # 알려진 업로드에서 멈췄거나 목록 끝까지 읽었으면 상한 전에 끝남
+            complete = fetched < max_results
+
+            # 다른 워커가 먼저 수집한 ID는 제외
+            return self._claim_new_ids(candidate_ids)
 
         except HttpError as e:
             self.logger.error(f"채널 영상 가져오기 실패 {channel_id}: {e}")
             return []
+        finally:
+            self._mark_complete('channel', channel_id, complete)
+
+    def _reached_known_upload(self, item: Dict, published_after: Optional[datetime]) -> bool:
+        """이전 실행에서 이미 본 업로드 항목인지 확인"""
+        snippet = item['snippet']
+        if snippet['resourceId']['videoId'] in self.known_video_ids:
+            return True
+        if published_after is not None and snippet.get('publishedAt'):
+            published_at = datetime.fromisoformat(snippet['publishedAt'].replace('Z', '+00:00'))
+            if published_after.tzinfo is None:
+                published_after = published_after.replace(tzinfo=timezone.utc)
+            return published_at <= published_after
+        return False
+
+    def _is_ort_related(self, title: str, description: str) -> bool:
+        """Oxford Reading Tree 관련 영상인지 간단히 판별"""
+        content = f"{title} {description}"
+        ort_indicators = ['oxford reading tree', 'biff', 'chip', 'kipper', 'floppy', 'read with oxford']
+        return any(indicator in content for indicator in ort_indicators)
 
     def _create_video_data(self, item: Dict) -> Optional[VideoData]:
         """YouTube API 응답을 VideoData 객체로 변환"""
@@ -175,7 +470,7 @@ class YouTubeCollector:
                 view_count=int(statistics.get('viewCount', 0)),
                 like_count=int(statistics.get('likeCount', 0)),
                 comment_count=int(statistics.get('commentCount', 0)),
-                thumbnail_url=snippet.get('thumbnails', {}).get('medium', {}).get('url'),
+                thumbnail_url=snippet.get('thumbnails', {}).get('medium', {}).get('url', ''),
                 url=f"https://www.youtube.com/watch?v={video_id}"
             )
             
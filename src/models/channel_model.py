@@ -1,5 +1,6 @@
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple, Any
+import heapq
 
 class ChannelData(BaseModel):
     channel_id: str
@@ -15,3 +16,62 @@ class ChannelData(BaseModel):
     trustworthiness_score: Optional[int] = None
     ort_video_count: Optional[int] = None
     average_quality_score: Optional[float] = None
+
+class ChannelAggregate:
+    """채널별 수집 집계 (영상 객체 대신 개수/점수 통계와 대표 영상 ID 일부만 보관)
+
+    메모리 사용량이 영상 수가 아니라 채널 수에 비례하도록 __slots__를 쓴다.
+    sample_video_ids는 점수가 높은 영상 ID를 최대 SAMPLE_SIZE개까지 유지한다.
+    """
+    
+    SAMPLE_SIZE = 5
+    
+    __slots__ = ('channel_id', 'name', 'video_count', 'score_sum', 'min_score', 'max_score', '_sample')
+    
+    def __init__(self, channel_id: str, name: str):
+        self.channel_id = channel_id
+        self.name = name
+        self.video_count = 0
+        self.score_sum = 0
+        self.min_score: Optional[int] = None
+        self.max_score: Optional[int] = None
+        # (점수, video_id) 최소 힙
+        self._sample: List[Tuple[int, str]] = []
+    
+    @property
+    def avg_quality_score(self) -> float:
+        return self.score_sum / self.video_count if self.video_count else 0
+    
+    @property
+    def sample_video_ids(self) -> List[str]:
+        """점수 내림차순 대표 영상 ID"""
+        return [video_id for _, video_id in sorted(self._sample, reverse=True)]
+    
+    def add(self, video_id: str, score: int):
+        self.video_count += 1
+        self.score_sum += score
+        self.min_score = score if self.min_score is None else min(self.min_score, score)
+        self.max_score = score if self.max_score is None else max(self.max_score, score)
+        
+        if len(self._sample) < self.SAMPLE_SIZE:
+            heapq.heappush(self._sample, (score, video_id))
+        elif (score, video_id) > self._sample[0]:
+            heapq.heapreplace(self._sample, (score, video_id))
+    
+    def remove(self, video_id: str, score: int):
+        """영상 1개 제외 (min/max는 다시 계산할 수 없으므로 그대로 범위로 남음)"""
+        self.video_count -= 1
+        self.score_sum -= score
+        if (score, video_id) in self._sample:
+            self._sample.remove((score, video_id))
+            heapq.heapify(self._sample)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'video_count': self.video_count,
+            'avg_quality_score': self.avg_quality_score,
+            'min_quality_score': self.min_score,
+            'max_quality_score': self.max_score,
+            'sample_video_ids': self.sample_video_ids
+        }
@@ -1,8 +1,24 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import Optional, List
 from datetime import datetime
+from functools import lru_cache
 import re
 
+_DURATION_PATTERN = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+
+@lru_cache(maxsize=4096)
+def parse_duration(duration: str) -> int:
+    """ISO 8601 duration을 초로 변환 (PT4M13S -> 253)"""
+    match = _DURATION_PATTERN.match(duration)
+    if not match:
+        return 0
+
+    hours = int(match.group(1) or 0)
+    minutes = int(match.group(2) or 0)
+    seconds = int(match.group(3) or 0)
+
+    return hours * 3600 + minutes * 60 + seconds
+
 class VideoData(BaseModel):
     video_id: str
     title: str
@@ -16,6 +32,7 @@ class VideoData(BaseModel):
     comment_count: int
     url: str
     thumbnail_url: str
+    duration_seconds: Optional[int] = None
     
     # 분석 결과
     quality_score: Optional[int] = None
@@ -23,26 +40,21 @@ class VideoData(BaseModel):
     learning_objectives: Optional[List[str]] = None
     educational_rating: Optional[str] = None  # 'excellent', 'good', 'fair', 'poor'
 
-    def __init__(self, **data):
-        super().__init__(**data)
+    @model_validator(mode='after')
+    def _fill_derived_fields(self) -> 'VideoData':
+        self._fill_defaults()
+        return self
+
+    def _fill_defaults(self):
         if not self.url:
             self.url = f"https://www.youtube.com/watch?v={self.video_id}"
 
         if self.duration and not self.duration_seconds:
-            self.duration_seconds = self._parse_duration(self.duration)
+            self.duration_seconds = parse_duration(self.duration)
 
     def _parse_duration(self, duration: str) -> int:
         """ISO 8601 duration을 초로 변환 (PT4M13S -> 253)"""
-        pattern = r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?'
-        match = re.match(pattern, duration)
-        if not match:
-            return 0
-
-        hours = int(match.group(1) or 0)
-        minutes = int(match.group(2) or 0)
-        seconds = int(match.group(3) or 0)
-
-        return hours * 3600 + minutes * 60 + seconds
+        return parse_duration(duration)
 
     
     class Config:
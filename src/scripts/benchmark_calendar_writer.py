@@ -0,0 +1,101 @@
+"""캘린더 반영 벤치마크 (로컬 SQLite 캘린더 + 요청당 지연 흉내: 건별 vs 배치, 재실행, 일부 변경)"""
+
+#!/usr/bin/env python3
+
+import sys
+import os
+import argparse
+import copy
+import random
+import tempfile
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calendar_writer import CalendarWriter, SQLiteCalendarBackend, build_events, plan_key
+from schedule_optimizer import LearningScheduleOptimizer
+from src.scripts.benchmark_time_slots import make_request
+
+START_DATE = '2024-03-04'
+
+
+def plan_events(optimizer: LearningScheduleOptimizer, plans, weeks: int):
+    """(plan_id, family_request) -> {plan_id: events}"""
+    events = {}
+    for plan_id, request in plans:
+        result = optimizer.optimize_weekly_schedule({
+            'family_schedule': request['family_schedule'],
+            'child_energy_pattern': request['child_energy_pattern'],
+            'session_minutes': request['learning_duration'],
+            'weeks': weeks, 'start_date': START_DATE
+        })
+        events[plan_id] = build_events(plan_id, result['sessions'])
+    return events
+
+
+def sync_all(writer: CalendarWriter, events_by_plan):
+    totals = {'inserted': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0, 'requests': 0}
+    start = time.perf_counter()
+    for plan_id, events in events_by_plan.items():
+        stats = writer.sync('primary', plan_id, events, time_min=f"{START_DATE}T00:00")
+        for key in totals:
+            totals[key] += stats[key]
+    return time.perf_counter() - start, totals
+
+
+def report(label: str, elapsed: float, totals, plans: int):
+    changes = totals['inserted'] + totals['updated'] + totals['deleted']
+    print(f"{label}: {elapsed:.2f}s (아이당 {elapsed / plans * 1000:.0f}ms, 요청 {totals['requests']:,}번, "
+          f"추가 {totals['inserted']:,} / 변경 {totals['updated']:,} / 삭제 {totals['deleted']:,} / "
+          f"유지 {totals['unchanged']:,}, 변경 {changes / elapsed:,.0f}건/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="캘린더 반영 벤치마크")
+    parser.add_argument('--children', type=int, default=200, help="일정을 반영할 아이 수")
+    parser.add_argument('--weeks', type=int, default=12, help="일정 기간 (주)")
+    parser.add_argument('--latency', type=float, default=0.02, help="요청(목록 조회/배치)당 흉내 낼 지연 (초)")
+    parser.add_argument('--batch-size', type=int, default=50, help="배치 요청 하나에 담을 작업 수")
+    parser.add_argument('--naive-children', type=int, default=5, help="건별 요청 기준을 측정할 아이 수")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    plans = [(plan_key(f"family-{index // 2}", f"child-{index % 2}"), make_request(rng)) for index in range(args.children)]
+    optimizer = LearningScheduleOptimizer()
+
+    start = time.perf_counter()
+    events_by_plan = plan_events(optimizer, plans, args.weeks)
+    total_events = sum(len(events) for events in events_by_plan.values())
+    print(f"🧮 일정 생성 {args.children:,}명 / 이벤트 {total_events:,}개: {time.perf_counter() - start:.2f}s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        naive_backend = SQLiteCalendarBackend(os.path.join(directory, 'naive.sqlite3'), args.latency)
+        naive_plans = dict(list(events_by_plan.items())[:args.naive_children])
+        elapsed, totals = sync_all(CalendarWriter(naive_backend, batch_size=1), naive_plans)
+        report(f"🐢 건별 요청 ({args.naive_children}명)", elapsed, totals, args.naive_children)
+
+        backend = SQLiteCalendarBackend(os.path.join(directory, 'calendar.sqlite3'), args.latency)
+        writer = CalendarWriter(backend, batch_size=args.batch_size)
+        elapsed, totals = sync_all(writer, events_by_plan)
+        report(f"🚀 배치 {args.batch_size}개씩 첫 반영", elapsed, totals, args.children)
+
+        elapsed, totals = sync_all(writer, events_by_plan)
+        report("🔁 같은 일정 재실행", elapsed, totals, args.children)
+
+        # 절반의 가족에 토요일 오전 일정이 새로 생김 -> 그 토요일들만 바뀜
+        changed_plans = []
+        for index, (plan_id, request) in enumerate(plans):
+            if index % 2 == 0:
+                request = copy.deepcopy(request)
+                request['family_schedule']['busy_times'].append({'day': 'saturday', 'start': '06:00', 'end': '13:00'})
+            changed_plans.append((plan_id, request))
+        elapsed, totals = sync_all(writer, plan_events(optimizer, changed_plans, args.weeks))
+        report("✏️ 일부 가족 일정 변경", elapsed, totals, args.children)
+
+        naive_backend.close()
+        backend.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""카탈로그 검색 색인 벤치마크 (색인 생성 시간 / 검색 지연 시간)"""
+
+#!/usr/bin/env python3
+
+import sys
+import os
+import argparse
+import itertools
+import random
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+
+from src.utils.catalog_search import CatalogSearchIndex
+
+DOMAIN_WORDS = (
+    "oxford reading tree level stage biff chip kipper floppy dog story read aloud phonics "
+    "sight words kids learn cat hat run big red fun park magic key adventure school family "
+    "mum dad home garden book letters sounds blending rhyme song bedtime"
+).split()
+# 도메인 단어를 앞 순위에 두고 나머지는 합성 단어로 채운 Zipf 분포 어휘
+VOCABULARY_SIZE = 20_000
+WORDS = DOMAIN_WORDS + [f"w{rank}" for rank in range(len(DOMAIN_WORDS), VOCABULARY_SIZE)]
+WORD_WEIGHTS = list(itertools.accumulate(1 / (rank + 1) for rank in range(VOCABULARY_SIZE)))
+OBJECTIVES = ['phonics', 'sight_words', 'story_comprehension', 'vocabulary', 'character_recognition']
+QUERIES = [
+    "phonics floppy", "biff chip kipper", "magic key adventure", "sight words", "bedtime story",
+    "rhyme song letters", "floppy dog park", "reading tree stage 1", "blending sounds", "school"
+]
+
+
+def make_items(count: int, seed: int = 0):
+    """MCP 내보내기 형식의 가상 항목 생성"""
+    rng = random.Random(seed)
+    return [
+        {
+            'content_id': f"vid{i:08d}",
+            'title': ' '.join(rng.choices(WORDS, cum_weights=WORD_WEIGHTS, k=8)),
+            'description': ' '.join(rng.choices(WORDS, cum_weights=WORD_WEIGHTS, k=40)),
+            'learning_objectives': rng.sample(OBJECTIVES, rng.randint(0, 3)),
+            'duration_minutes': round(rng.uniform(1, 20), 1),
+            'quality_score': rng.randint(50, 100),
+            'is_level1_verified': rng.random() < 0.6
+        }
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="카탈로그 검색 색인 벤치마크")
+    parser.add_argument('--count', type=int, default=100_000, help="색인할 영상 수")
+    parser.add_argument('--queries', type=int, default=2000, help="측정할 검색 횟수")
+    args = parser.parse_args()
+
+    items = make_items(args.count)
+
+    start = time.perf_counter()
+    index = CatalogSearchIndex.from_mcp_items(items)
+    print(f"📚 색인 생성: {args.count:,}개 {time.perf_counter() - start:.2f}s")
+
+    rng = random.Random(1)
+    filters = [
+        {},
+        {'max_duration_minutes': 8},
+        {'max_duration_minutes': 8, 'level1_only': True},
+        {'min_quality_score': 80, 'level1_only': True}
+    ]
+
+    # 포스팅 배열 생성(첫 검색)은 제외하고 측정
+    for query in QUERIES:
+        index.search(query)
+
+    latencies = []
+    for _ in range(args.queries):
+        query = rng.choice(QUERIES)
+        options = rng.choice(filters)
+        start = time.perf_counter()
+        index.search(query, top_k=10, **options)
+        latencies.append(time.perf_counter() - start)
+
+    latencies_ms = np.array(latencies) * 1000
+    print(f"🔎 검색 {args.queries:,}회: p50 {np.percentile(latencies_ms, 50):.3f}ms / "
+          f"p99 {np.percentile(latencies_ms, 99):.3f}ms / 최대 {latencies_ms.max():.3f}ms")
+
+    start = time.perf_counter()
+    for item in items[:1000]:
+        index.add_mcp_item(dict(item, quality_score=100))
+    print(f"♻️ 증분 갱신 1,000건: {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""MCP 콘텐츠 서버 부하 테스트 (지연 시간 p50/p99, 초당 요청 수, 교체 중 실패 수)"""
+
+#!/usr/bin/env python3
+
+import sys
+import os
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import tempfile
+import time
+from collections import Counter
+from urllib.parse import urlencode
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import httpx
+import numpy as np
+
+from src.scripts.benchmark_catalog_search import make_items, QUERIES
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FILTERS = [
+    {},
+    {'max_duration': 8},
+    {'max_duration': 8, 'level1_only': 'true'},
+    {'min_quality': 80, 'level1_only': 'true'}
+]
+
+
+def write_export(directory: str, timestamp: str, items) -> str:
+    path = os.path.join(directory, f"mcp_content_{timestamp}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(items, f, ensure_ascii=False)
+    return path
+
+
+def start_server(exports_dir: str, port: int) -> subprocess.Popen:
+    """별도 프로세스로 서버를 띄우고 스냅샷 로드가 끝날 때까지 대기"""
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(PROJECT_ROOT, 'mcp_content_server.py'),
+         '--port', str(port), '--exports-dir', exports_dir],
+        cwd=PROJECT_ROOT, env=dict(os.environ, LOG_LEVEL='WARNING')
+    )
+    while True:
+        if process.poll() is not None:
+            raise RuntimeError("콘텐츠 서버가 시작되지 않았습니다")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                return process
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+
+
+class KeepAliveConnection:
+    """부하 생성용 최소 HTTP/1.1 클라이언트 (연결 재사용, 클라이언트 오버헤드 최소화)"""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._reader = None
+        self._writer = None
+
+    async def request(self, method: str, target: str, headers: dict = None):
+        """(상태 코드, 헤더, 본문)"""
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {self.host}:{self.port}", "Content-Length: 0"]
+        lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        self._writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        await self._writer.drain()
+
+        head = (await self._reader.readuntil(b'\r\n\r\n')).decode('latin-1').split('\r\n')
+        status = int(head[0].split()[1])
+        response_headers = {}
+        for line in head[1:]:
+            if line:
+                name, _, value = line.partition(':')
+                response_headers[name.strip().lower()] = value.strip()
+        body = await self._reader.readexactly(int(response_headers.get('content-length', 0)))
+        if response_headers.get('connection', '').lower() == 'close':
+            self.close()
+        return status, response_headers, body
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+async def run_load(port: int, content_ids, requests: int, concurrency: int, reload_after: int):
+    """요청을 섞어 보내고 (지연 시간 목록, 상태 코드 수, 경과 시간, 교체 소요 시간) 반환"""
+    rng = random.Random(7)
+    latencies = []
+    statuses = Counter()
+    etags = {}
+    reload_seconds = []
+    issued = 0
+
+    def next_request() -> str:
+        roll = rng.random()
+        if roll < 0.1:
+            return f"/content/{rng.choice(content_ids)}"
+        params = dict(rng.choice(FILTERS), page=rng.randint(1, 3))
+        if roll < 0.8:
+            params['q'] = rng.choice(QUERIES)
+        return f"/content?{urlencode(sorted(params.items()))}"
+
+    async def reload():
+        connection = KeepAliveConnection('127.0.0.1', port)
+        start = time.perf_counter()
+        status, _, _ = await connection.request('POST', "/admin/reload")
+        reload_seconds.append(time.perf_counter() - start)
+        statuses[f"reload {status}"] += 1
+        connection.close()
+
+    async def worker():
+        nonlocal issued
+        connection = KeepAliveConnection('127.0.0.1', port)
+        while issued < requests:
+            issued += 1
+            if issued == reload_after:
+                # 새 내보내기 파일로 교체하는 동안에도 다른 요청은 계속 처리되어야 함
+                reload_task = asyncio.get_running_loop().create_task(reload())
+                background.append(reload_task)
+            target = next_request()
+            headers = {'If-None-Match': etags[target]} if target in etags and rng.random() < 0.5 else {}
+            start = time.perf_counter()
+            try:
+                status, response_headers, _ = await connection.request('GET', target, headers)
+            except (OSError, asyncio.IncompleteReadError):
+                statuses['error'] += 1
+                connection.close()
+                continue
+            latencies.append(time.perf_counter() - start)
+            statuses[status] += 1
+            if 'etag' in response_headers:
+                etags[target] = response_headers['etag']
+        connection.close()
+
+    background = []
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    await asyncio.gather(*background)
+    return latencies, statuses, elapsed, reload_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MCP 콘텐츠 서버 부하 테스트")
+    parser.add_argument('--count', type=int, default=100_000, help="카탈로그 영상 수")
+    parser.add_argument('--requests', type=int, default=20_000, help="보낼 요청 수")
+    parser.add_argument('--concurrency', type=int, default=32, help="동시 요청 수")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--no-reload', action='store_true', help="부하 중 스냅샷 교체 생략")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as exports_dir:
+        items = make_items(args.count)
+        write_export(exports_dir, "20240101_000000", items)
+
+        start = time.perf_counter()
+        server = start_server(exports_dir, args.port)
+        print(f"📦 서버 시작 및 스냅샷 로드: {args.count:,}개 {time.perf_counter() - start:.2f}s")
+
+        if not args.no_reload:
+            # 부하 도중 교체될 다음 내보내기 (점수 일부 변경)
+            write_export(exports_dir, "20240102_000000",
+                         [dict(item, quality_score=min(100, item['quality_score'] + 1)) for item in items])
+
+        try:
+            latencies, statuses, elapsed, reload_seconds = asyncio.run(run_load(
+                args.port, [item['content_id'] for item in items],
+                args.requests, args.concurrency, 0 if args.no_reload else args.requests // 4
+            ))
+            version = httpx.get(f"http://127.0.0.1:{args.port}/health").json()['version']
+        finally:
+            server.terminate()
+            server.wait()
+
+    latencies_ms = np.array(latencies) * 1000
+    print(f"🚀 요청 {len(latencies):,}회 (동시 {args.concurrency}): {len(latencies) / elapsed:,.0f} req/s")
+    print(f"⏱️ 지연 시간: p50 {np.percentile(latencies_ms, 50):.2f}ms / p99 {np.percentile(latencies_ms, 99):.2f}ms")
+    print(f"📊 상태 코드: {dict(statuses)}")
+    if reload_seconds:
+        print(f"♻️ 부하 중 스냅샷 교체: {reload_seconds[0]:.2f}s (버전 {version})")
+
+
+if __name__ == "__main__":
+    main()
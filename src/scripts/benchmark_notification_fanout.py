@@ -0,0 +1,191 @@
+"""알림 발송 벤치마크 (19:00 몰림 상황, 로컬 웹훅/SMTP 대역 서버 사용)"""
+
+#!/usr/bin/env python3
+
+import sys
+import os
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import random
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import httpx
+
+from notification_fanout import LogSink, NotificationFanout, SmtpSink, WebhookSink
+
+MESSAGES = ['오늘의 파닉스 시간이에요! 🎵', 'ORT Level 1 영상 볼 시간이에요 📚', '복습 퀴즈를 풀어볼까요? ✏️']
+
+
+class StandInWebhook:
+    """받은 알림 수를 세는 HTTP/1.1 keep-alive 웹훅 서버 (error_rate 비율로 503 응답)"""
+
+    def __init__(self, error_rate: float, rng: random.Random):
+        self.error_rate = error_rate
+        self.rng = rng
+        self.requests = 0
+        self.notifications = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                length = 0
+                for line in head.split(b'\r\n')[1:]:
+                    name, _, value = line.partition(b':')
+                    if name.strip().lower() == b'content-length':
+                        length = int(value)
+                body = await reader.readexactly(length)
+                self.requests += 1
+                if self.rng.random() < self.error_rate:
+                    writer.write(b'HTTP/1.1 503 Service Unavailable\r\ncontent-length: 0\r\n\r\n')
+                else:
+                    self.notifications += sum(len(delivery['ids']) for delivery in json.loads(body)['deliveries'])
+                    writer.write(b'HTTP/1.1 200 OK\r\ncontent-length: 0\r\n\r\n')
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class StandInSmtp:
+    """받은 메일 수를 세는 최소 SMTP 서버"""
+
+    def __init__(self):
+        self.messages = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        writer.write(b'220 localhost stand-in\r\n')
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line[:4].upper()
+                if command == b'EHLO':
+                    writer.write(b'250-localhost\r\n250 8BITMIME\r\n')
+                elif command == b'DATA':
+                    writer.write(b'354 end with .\r\n')
+                    await writer.drain()
+                    while await reader.readline() != b'.\r\n':
+                        pass
+                    self.messages += 1
+                    writer.write(b'250 queued\r\n')
+                elif command == b'QUIT':
+                    writer.write(b'221 bye\r\n')
+                    await writer.drain()
+                    break
+                else:
+                    writer.write(b'250 OK\r\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+def peak_notifications(families: int, rng: random.Random):
+    """19:00에 한꺼번에 발송할 알림 (가족마다 아이 1-3명, 채널은 가족별로 고정)"""
+    notifications = []
+    for family in range(families):
+        channel = rng.choices(['push', 'email', 'log'], [0.6, 0.3, 0.1])[0]
+        for child in range(rng.randint(1, 3)):
+            notifications.append({
+                'id': len(notifications) + 1,
+                'notification_type': channel,
+                'recipient': f"family-{family}@example.com",
+                'message': f"{child + 1}번째 아이: {rng.choice(MESSAGES)}"
+            })
+    return notifications
+
+
+def serve_stand_ins(connection, error_rate: float):
+    """별도 프로세스에서 대역 서버 실행 (포트를 보내고, 요청을 받으면 수신 건수를 보냄)"""
+    async def serve():
+        webhook = StandInWebhook(error_rate, random.Random(1))
+        smtp = StandInSmtp()
+        webhook_server = await asyncio.start_server(webhook.handle, '127.0.0.1', 0)
+        smtp_server = await asyncio.start_server(smtp.handle, '127.0.0.1', 0)
+        connection.send((webhook_server.sockets[0].getsockname()[1], smtp_server.sockets[0].getsockname()[1]))
+        loop = asyncio.get_running_loop()
+        while await loop.run_in_executor(None, connection.recv) != 'stop':
+            connection.send((webhook.requests, webhook.notifications, smtp.messages))
+            webhook.requests = webhook.notifications = smtp.messages = 0
+        webhook_server.close()
+        smtp_server.close()
+
+    asyncio.run(serve())
+
+
+async def run(args, connection):
+    rng = random.Random(0)
+    webhook_port, smtp_port = connection.recv()
+    webhook_url = f"http://127.0.0.1:{webhook_port}/notify"
+
+    # 기준: 알림마다 동기 POST 1번
+    sample = args.baseline
+    with httpx.Client() as client:
+        def send_one_by_one():
+            for index in range(sample):
+                client.post(webhook_url, json={'deliveries': [{'recipient': f"family-{index}", 'messages': ['x'],
+                                                               'ids': [index]}]})
+        start = time.perf_counter()
+        await asyncio.to_thread(send_one_by_one)
+        baseline_rate = sample / (time.perf_counter() - start)
+    print(f"🐢 알림마다 동기 웹훅 호출: {baseline_rate:,.0f}건/s ({sample:,}건)")
+    connection.send('count')
+    connection.recv()
+
+    notifications = peak_notifications(args.families, rng)
+    fanout = NotificationFanout(
+        {'push': WebhookSink(webhook_url), 'email': SmtpSink('127.0.0.1', smtp_port), 'log': LogSink()},
+        max_pending=args.max_pending, batch_size=args.batch_size, base_delay=0.05, max_delay=1.0
+    )
+    await fanout.start()
+    start = time.perf_counter()
+    for notification in notifications:
+        await fanout.submit(notification)
+    await fanout.drain()
+    elapsed = time.perf_counter() - start
+    await fanout.close()
+
+    stats = fanout.get_stats()
+    connection.send('count')
+    webhook_requests, webhook_notifications, smtp_messages = connection.recv()
+    print(f"🚀 19:00 몰림 {len(notifications):,}건 ({args.families:,}가족): {elapsed:.2f}s "
+          f"({len(notifications) / elapsed:,.0f}건/s, 기준 대비 {len(notifications) / elapsed / baseline_rate:.0f}배)")
+    print(f"   병합 후 전달 {stats['deliveries']:,}건 / 배치 {stats['batches']:,}개 / 재시도 {stats['retries']:,}회 / "
+          f"포기 {stats['dropped']:,}건")
+    print(f"   대역 서버 수신: 웹훅 요청 {webhook_requests:,}번 (알림 {webhook_notifications:,}건), "
+          f"메일 {smtp_messages:,}통")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="알림 발송 벤치마크")
+    parser.add_argument('--families', type=int, default=20_000, help="19:00에 알림을 받는 가족 수")
+    parser.add_argument('--batch-size', type=int, default=200, help="배치 크기")
+    parser.add_argument('--max-pending', type=int, default=10_000, help="채널별 대기열 상한")
+    parser.add_argument('--webhook-error-rate', type=float, default=0.02, help="웹훅 대역 서버의 503 응답 비율")
+    parser.add_argument('--baseline', type=int, default=2000, help="동기 호출 기준 측정 건수")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    connection, child_connection = multiprocessing.Pipe()
+    server = multiprocessing.Process(target=serve_stand_ins, args=(child_connection, args.webhook_error_rate),
+                                     daemon=True)
+    server.start()
+    try:
+        asyncio.run(run(args, connection))
+    finally:
+        connection.send('stop')
+        server.join(5)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""알림 발송기 벤치마크 (대량 예약 / 재시작 적재 / 가상 시계로 전체 발송, 중복 발송 검사)"""
+
+#!/usr/bin/env python3
+
+import sys
+import os
+import argparse
+import random
+import tempfile
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from reminder_dispatcher import ReminderDispatcher
+
+START_TIME = 1_710_000_000.0
+MESSAGES = ['오늘의 파닉스 시간이에요! 🎵', 'ORT Level 1 영상 볼 시간이에요 📚', '복습 퀴즈를 풀어볼까요? ✏️']
+
+
+class VirtualClock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def main():
+    parser = argparse.ArgumentParser(description="알림 발송기 벤치마크")
+    parser.add_argument('--reminders', type=int, default=1_000_000, help="예약할 알림 수")
+    parser.add_argument('--days', type=float, default=7.0, help="알림을 흩뿌릴 기간 (일)")
+    parser.add_argument('--tick', type=float, default=60.0, help="가상 시계 tick 간격 (초)")
+    parser.add_argument('--window', type=float, default=3600.0, help="메모리에 올리는 구간 (초)")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    span = args.days * 86400
+    sent = bytearray(args.reminders + 1)
+    duplicates = 0
+
+    def sender(reminder):
+        nonlocal duplicates
+        duplicates += sent[reminder['id']]
+        sent[reminder['id']] = 1
+
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = os.path.join(directory, 'reminders.sqlite3')
+        clock = VirtualClock(START_TIME)
+        dispatcher = ReminderDispatcher(db_path, sender=sender, window_seconds=args.window, clock=clock)
+
+        start = time.perf_counter()
+        batch = 10_000
+        for offset in range(0, args.reminders, batch):
+            dispatcher.schedule_many(
+                (START_TIME + rng.random() * span, rng.choice(MESSAGES), 'push', f"family-{rng.randrange(50_000)}")
+                for _ in range(min(batch, args.reminders - offset))
+            )
+        elapsed = time.perf_counter() - start
+        print(f"📝 예약 {args.reminders:,}건: {elapsed:.2f}s ({args.reminders / elapsed:,.0f}건/s)")
+        dispatcher.close()
+
+        # 재시작: 가까운 구간만 적재
+        start = time.perf_counter()
+        dispatcher = ReminderDispatcher(db_path, sender=sender, window_seconds=args.window, clock=clock)
+        print(f"🔄 재시작 적재: {(time.perf_counter() - start) * 1000:.1f}ms (힙 {len(dispatcher._heap):,}건)")
+
+        fire_seconds = 0.0
+        peak_heap = 0
+        restarted = False
+        while clock.now <= START_TIME + span + args.tick:
+            clock.now += args.tick
+            start = time.perf_counter()
+            dispatcher.tick()
+            fire_seconds += time.perf_counter() - start
+            peak_heap = max(peak_heap, len(dispatcher._heap))
+
+            if not restarted and clock.now >= START_TIME + span / 2:
+                # 중간에 프로세스가 재시작된 상황 (발송 도중 중단된 알림 100건 포함)
+                with dispatcher._lock:
+                    dispatcher._conn.execute(
+                        "UPDATE reminders SET status = 'claimed' WHERE id IN "
+                        "(SELECT id FROM reminders WHERE status = 'pending' ORDER BY due_at LIMIT 100)"
+                    )
+                    dispatcher._conn.commit()
+                dispatcher.close()
+                start = time.perf_counter()
+                dispatcher = ReminderDispatcher(db_path, sender=sender, window_seconds=args.window, clock=clock)
+                fire_seconds += time.perf_counter() - start
+                restarted = True
+
+        delivered = sum(sent)
+        print(f"🔔 발송 {delivered:,}건: {fire_seconds:.2f}s ({delivered / fire_seconds:,.0f}건/s, "
+              f"최대 힙 {peak_heap:,}건, 중복 발송 {duplicates}건, 남은 대기 {dispatcher.pending_count()}건)")
+        print(f"   재시작 시 중단 알림 실패 처리 {dispatcher.stats['recovered']}건 (재발송 안 함)")
+        dispatcher.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""학습 일정 최적화 벤치마크 (계획 기간 / 제약 수별 풀이 시간, 휴리스틱 처리 비율)"""
+
+#!/usr/bin/env python3
+
+import sys
+import os
+import argparse
+import random
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+
+from schedule_optimizer import LearningScheduleOptimizer
+from src.scripts.benchmark_time_slots import make_request
+
+# 연속 제약 조합 (연속 학습 일수 상한, 연속 휴식 일수 상한)
+SEQUENCE_RULES = {
+    'weekly-only': (None, None),
+    'consecutive': (3, None),
+    'consecutive+rest': (3, 2),
+    'tight': (2, 1)
+}
+
+
+def constraint_count(weeks: int, max_consecutive, max_rest) -> int:
+    """MIP로 풀 때의 제약식 수 (주별 최소/최대 + 연속 구간)"""
+    days = weeks * 7
+    count = 2 * weeks
+    if max_consecutive is not None:
+        count += days - max_consecutive
+    if max_rest is not None:
+        count += days - max_rest
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="학습 일정 최적화 벤치마크")
+    parser.add_argument('--families', type=int, default=30, help="조합마다 풀 가족 수")
+    parser.add_argument('--horizons', default='1,2,4,8,12', help="계획 기간(주) 목록")
+    args = parser.parse_args()
+
+    optimizer = LearningScheduleOptimizer()
+    horizons = [int(value) for value in args.horizons.split(',')]
+    print(f"{'제약':<18}{'주':>4}{'제약식':>8}{'휴리스틱':>10}{'p50 ms':>10}{'p95 ms':>10}{'MIP p50 ms':>12}")
+
+    for name, (max_consecutive, max_rest) in SEQUENCE_RULES.items():
+        for weeks in horizons:
+            rng = random.Random(weeks)
+            times = []
+            mip_times = []
+            heuristic = 0
+            for _ in range(args.families):
+                request = make_request(rng)
+                result = optimizer.optimize_weekly_schedule({
+                    'family_schedule': request['family_schedule'],
+                    'child_energy_pattern': request['child_energy_pattern'],
+                    'session_minutes': request['learning_duration'],
+                    'weeks': weeks,
+                    'start_date': '2024-03-04',
+                    'min_sessions_per_week': 3,
+                    'max_sessions_per_week': 5,
+                    'max_consecutive_days': max_consecutive,
+                    'max_rest_days': max_rest
+                })
+                times.append(result['solve_time_ms'])
+                if result['solved_by'] == 'mip':
+                    mip_times.append(result['solve_time_ms'])
+                else:
+                    heuristic += 1
+
+            mip_p50 = f"{np.percentile(mip_times, 50):.2f}" if mip_times else '-'
+            print(f"{name:<18}{weeks:>4}{constraint_count(weeks, max_consecutive, max_rest):>8}"
+                  f"{heuristic / args.families:>10.0%}{np.percentile(times, 50):>10.2f}"
+                  f"{np.percentile(times, 95):>10.2f}{mip_p50:>12}")
+
+    print(f"📊 누적 처리: {optimizer.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""학습 일정 결과 캐시 벤치마크 (표현만 다른 비슷한 가족 요청의 적중률 / 적중 시 지연 시간)"""
+
+#!/usr/bin/env python3
+
+import sys
+import os
+import argparse
+import copy
+import random
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+
+from schedule_optimizer import LearningScheduleOptimizer
+from solution_cache import SolutionCache
+from src.scripts.benchmark_time_slots import make_request
+from time_slot_engine import DAYS, TimeSlotEngine
+
+
+def rewrite(request, rng: random.Random):
+    """내용은 같고 표현만 다른 요청 (구간 순서, 'weekdays' 풀어 쓰기, 'H:MM' 표기, 컨디션 미세 차이)"""
+    request = copy.deepcopy(request)
+    busy_times = []
+    for interval in request['family_schedule']['busy_times']:
+        if interval['day'] == 'weekdays' and rng.random() < 0.5:
+            busy_times.extend(dict(interval, day=day) for day in DAYS[:5])
+        else:
+            busy_times.append(dict(interval, start=interval['start'].lstrip('0') or '0:00'))
+    rng.shuffle(busy_times)
+    request['family_schedule']['busy_times'] = busy_times
+
+    pattern = request['child_energy_pattern']
+    if 'morning' in pattern:
+        request['child_energy_pattern'] = {key: value + rng.uniform(-0.01, 0.01) for key, value in pattern.items()}
+    return request
+
+
+def percentiles(latencies):
+    values = np.array(latencies) * 1e6
+    return f"p50 {np.percentile(values, 50):.1f}µs / p99 {np.percentile(values, 99):.1f}µs"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="학습 일정 결과 캐시 벤치마크")
+    parser.add_argument('--templates', type=int, default=300, help="서로 다른 가족 일정 수")
+    parser.add_argument('--requests', type=int, default=5000, help="요청 수 (템플릿을 Zipf 분포로 선택해 변형)")
+    parser.add_argument('--weeks', type=int, default=4, help="주간 일정 최적화 기간")
+    parser.add_argument('--db-path', help="디스크 캐시 경로 (없으면 메모리만 사용)")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    templates = [make_request(rng) for _ in range(args.templates)]
+    weights = [1 / (rank + 1) for rank in range(args.templates)]
+    stream = [rewrite(request, rng) for request in rng.choices(templates, weights, k=args.requests)]
+
+    cache = SolutionCache(db_path=args.db_path)
+    if args.db_path:
+        cache.clear()
+    plain_engine = TimeSlotEngine()
+    engine = TimeSlotEngine(cache=cache)
+
+    misses, hits, uncached = [], [], []
+    for request in stream:
+        start = time.perf_counter()
+        plain_engine.recommend(**request)
+        uncached.append(time.perf_counter() - start)
+
+        before = cache.misses
+        start = time.perf_counter()
+        engine.recommend(**request)
+        (misses if cache.misses > before else hits).append(time.perf_counter() - start)
+
+    stats = cache.get_stats()
+    print(f"🔎 최적 시간 추천 {args.requests:,}건: 적중률 {stats['by_kind']['time_slots']['hit_rate']:.1%} "
+          f"(캐시 항목 {stats['entries']:,}개)")
+    print(f"   캐시 없음 {percentiles(uncached)}")
+    print(f"   캐시 미스 {percentiles(misses)}")
+    print(f"   캐시 적중 {percentiles(hits)}")
+
+    optimizer = LearningScheduleOptimizer(cache=SolutionCache(db_path=None))
+    misses, hits = [], []
+    for request in stream[:args.requests // 5]:
+        constraints = {
+            'family_schedule': request['family_schedule'],
+            'child_energy_pattern': request['child_energy_pattern'],
+            'session_minutes': request['learning_duration'],
+            'weeks': args.weeks, 'start_date': '2024-03-04',
+            'min_sessions_per_week': 3, 'max_sessions_per_week': 5,
+            'max_consecutive_days': 3, 'max_rest_days': 2
+        }
+        start = time.perf_counter()
+        result = optimizer.optimize_weekly_schedule(constraints)
+        (hits if result['cached'] else misses).append(time.perf_counter() - start)
+
+    stats = optimizer.cache.get_stats()['by_kind']['weekly_schedule']
+    print(f"📅 주간 일정 최적화 {len(hits) + len(misses):,}건: 적중률 {stats['hit_rate']:.1%} "
+          f"(최적화 통계 {optimizer.stats})")
+    print(f"   캐시 미스 {percentiles(misses)}")
+    print(f"   캐시 적중 {percentiles(hits)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""시간 슬롯 엔진 벤치마크 (가족 배치 평가 / 단건 추천 지연 시간)"""
+
+#!/usr/bin/env python3
+
+import sys
+import os
+import argparse
+import random
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+
+from time_slot_engine import TimeSlotEngine, DAYS, slot_to_time
+
+ENERGY_PATTERNS = [
+    {'morning': 0.9, 'afternoon': 0.6, 'evening': 0.3},
+    {'morning': 0.5, 'afternoon': 0.8, 'evening': 0.6},
+    {'hourly': {'7': 0.6, '9': 0.9, '12': 0.4, '15': 0.7, '18': 0.5, '20': 0.2}}
+]
+
+
+def make_request(rng: random.Random):
+    """가상의 가족 일정 (등원/출근, 학원, 주말 일정 등)"""
+    busy_times = [{'day': 'weekdays', 'start': f"{rng.randint(8, 9):02d}:{rng.choice(['00', '30'])}",
+                   'end': f"{rng.randint(14, 17):02d}:{rng.choice(['00', '30'])}"}]
+    for _ in range(rng.randint(2, 10)):
+        start = rng.randint(84, 240)
+        busy_times.append({'day': rng.choice(DAYS), 'start': slot_to_time(start),
+                           'end': slot_to_time(start + rng.randint(3, 24))})
+    schedule = {'busy_times': busy_times, 'buffer_minutes': rng.choice([0, 10, 15])}
+    if rng.random() < 0.3:
+        schedule['parent_available'] = [{'day': 'weekdays', 'start': '17:00', 'end': '21:00'},
+                                        {'day': 'weekends', 'start': '08:00', 'end': '20:00'}]
+    return {
+        'family_schedule': schedule,
+        'child_energy_pattern': rng.choice(ENERGY_PATTERNS),
+        'learning_duration': rng.choice([15, 20, 30])
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시간 슬롯 엔진 벤치마크")
+    parser.add_argument('--families', type=int, default=10_000, help="배치 평가할 가족 수")
+    parser.add_argument('--single', type=int, default=1000, help="단건 추천 측정 횟수")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    requests = [make_request(rng) for _ in range(args.families)]
+    engine = TimeSlotEngine()
+
+    start = time.perf_counter()
+    results = engine.recommend_batch(requests)
+    elapsed = time.perf_counter() - start
+    found = sum(1 for result in results if result['best_slot'] is not None)
+    print(f"👨‍👩‍👧 배치 {args.families:,}가족: {elapsed:.3f}s (가족당 {elapsed / args.families * 1e6:.1f}µs, "
+          f"추천 가능 {found:,}가족)")
+
+    latencies = []
+    for request in requests[:args.single]:
+        start = time.perf_counter()
+        engine.recommend(**request)
+        latencies.append(time.perf_counter() - start)
+    latencies_ms = np.array(latencies) * 1000
+    print(f"🔎 단건 {len(latencies):,}회: p50 {np.percentile(latencies_ms, 50):.3f}ms / "
+          f"p99 {np.percentile(latencies_ms, 99):.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
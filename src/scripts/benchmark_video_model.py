@@ -0,0 +1,109 @@
+"""VideoData 생성 속도 벤치마크 (기존 방식 vs 캐시된 파서 / TypeAdapter 일괄 검증)"""
+
+#!/usr/bin/env python3
+
+import sys
+import os
+import re
+import json
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from pydantic import BaseModel
+
+from src.models.video_model import VideoData
+from src.storage.json_handler import JSONHandler
+
+
+class LegacyVideoData(VideoData):
+    """변경 전 생성 방식 재현: 객체마다 __init__에서 후처리, 호출마다 정규식 컴파일"""
+
+    def __init__(self, **data):
+        BaseModel.__init__(self, **data)
+        if not self.url:
+            self.url = f"https://www.youtube.com/watch?v={self.video_id}"
+
+        if self.duration and not self.duration_seconds:
+            self.duration_seconds = self._legacy_parse_duration(self.duration)
+
+    @staticmethod
+    def _legacy_parse_duration(duration: str) -> int:
+        pattern = r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?'
+        match = re.match(pattern, duration)
+        if not match:
+            return 0
+        return int(match.group(1) or 0) * 3600 + int(match.group(2) or 0) * 60 + int(match.group(3) or 0)
+
+    def _fill_defaults(self):
+        # 후처리는 __init__에서 수행
+        pass
+
+
+def make_records(count: int):
+    """API 변환 결과와 같은 형태의 레코드 생성"""
+    base = datetime(2024, 1, 1)
+    return [
+        {
+            'video_id': f"vid{i:08d}",
+            'title': f"Oxford Reading Tree Level 1 Story {i}",
+            'description': "Biff, Chip and Kipper phonics story for beginners",
+            'channel_id': f"UC{i % 500:06d}",
+            'channel_title': f"Channel {i % 500}",
+            'published_at': base + timedelta(minutes=i),
+            'duration': f"PT{i % 20}M{i % 60}S",
+            'view_count': i * 10,
+            'like_count': i,
+            'comment_count': i % 100,
+            'url': f"https://www.youtube.com/watch?v=vid{i:08d}",
+            'thumbnail_url': f"https://i.ytimg.com/vi/vid{i:08d}/mqdefault.jpg"
+        }
+        for i in range(count)
+    ]
+
+
+def timed(label: str, count: int, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<40} {elapsed:8.3f}s  {count / elapsed:>12,.0f} 개/초")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VideoData 생성 속도 벤치마크")
+    parser.add_argument('--count', type=int, default=100_000, help="생성할 영상 수")
+    args = parser.parse_args()
+
+    records = make_records(args.count)
+    print(f"📊 VideoData 생성 벤치마크 ({args.count:,}개)")
+
+    print("\n[API 응답 변환]")
+    timed("기존: 객체별 검증 + 정규식 재컴파일", args.count,
+          lambda: [LegacyVideoData(**record) for record in records])
+    timed("검증 + 캐시된 duration 파서", args.count,
+          lambda: [VideoData(**record) for record in records])
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        handler = JSONHandler(tmp_dir)
+        filepath = handler.save_videos([VideoData(**record) for record in records], "bench.json")
+
+        def legacy_load():
+            with open(filepath, 'r', encoding='utf-8') as f:
+                videos_data = json.load(f)
+            videos = []
+            for video_dict in videos_data:
+                video_dict['published_at'] = datetime.fromisoformat(video_dict['published_at'])
+                videos.append(LegacyVideoData(**video_dict))
+            return videos
+
+        print("\n[아카이브 재로드]")
+        timed("기존: json.load + 객체별 검증", args.count, legacy_load)
+        timed("TypeAdapter 일괄 검증", args.count, lambda: handler.load_videos(filepath))
+
+
+if __name__ == "__main__":
+    main()
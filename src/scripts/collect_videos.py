@@ -4,6 +4,7 @@
 
 import sys
 import os
+import argparse
 import logging
 from datetime import datetime
 
@@ -13,7 +14,13 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.collectors.main_collector import MainCollector
 from src.utils.data_processing import DataProcessor
 from src.storage.json_handler import JSONHandler
-from src.storage.csv_handler import CSVHandler
+from src.storage.export_pipeline import (
+    ExportPipeline, RawJSONSink, FullCSVSink, SummaryCSVSink, MCPJSONSink, ReportSink
+)
+from src.storage.sqlite_handler import SQLiteHandler
+from src.storage.api_cache import APICache
+from src.storage.collection_state import CollectionState
+from src.utils.quota_ledger import QuotaLedger
 from config.settings import settings
 
 def setup_logging():
@@ -31,8 +38,26 @@ def setup_logging():
         ]
     )
 
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="Oxford Reading Tree Level 1 YouTube 콘텐츠 수집")
+    parser.add_argument(
+        '--incremental', action='store_true',
+        help="이전 실행 이후의 새 영상만 수집하여 기존 데이터셋에 병합"
+    )
+    parser.add_argument(
+        '--storage', choices=['files', 'sqlite', 'both'], default=settings.STORAGE_BACKEND,
+        help="영상 데이터 저장 방식: files(JSON/CSV), sqlite(카탈로그 DB), both"
+    )
+    parser.add_argument(
+        '--jsonl', action='store_true',
+        help="품질 기준을 통과한 영상을 즉시 JSONL 파일에 추가 (중단되어도 기록된 영상 보존)"
+    )
+    return parser.parse_args()
+
 def main():
     """메인 수집 프로세스"""
+    args = parse_args()
     setup_logging()
     logger = logging.getLogger(__name__)
     
@@ -49,60 +74,108 @@ def main():
         os.makedirs(settings.PROCESSED_DATA_DIR, exist_ok=True)
         os.makedirs(settings.EXPORTS_DIR, exist_ok=True)
         
+        # 타임스탬프 (실행 시작 시각, 모든 출력 파일에 공통)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        json_handler = JSONHandler(settings.RAW_DATA_DIR)
+        
+        # 스트리밍 JSONL 기록기 (영상이 분석을 통과하는 즉시 한 줄씩 추가)
+        jsonl_writer = json_handler.open_jsonl_writer(f"ort_level1_videos_{timestamp}.jsonl") if args.jsonl else None
+        
+        # API 응답 캐시 (재실행 시 쿼터 절약)
+        api_cache = APICache(settings.API_CACHE_PATH) if settings.API_CACHE_ENABLED else None
+        
+        # 쿼터 장부 (같은 쿼터 일 동안 사용량 누적)
+        quota_ledger = QuotaLedger(settings.QUOTA_LEDGER_PATH, daily_limit=settings.QUOTA_DAILY_LIMIT)
+        logger.info(f"남은 일일 쿼터: {quota_ledger.remaining()} units")
+        
+        # 증분 수집 상태 저장소
+        collection_state = CollectionState(settings.COLLECTION_STATE_PATH) if args.incremental else None
+        
+        # 저장 핸들러 초기화
+        use_files = args.storage in ('files', 'both')
+        use_sqlite = args.storage in ('sqlite', 'both')
+        catalog = SQLiteHandler(settings.CATALOG_DB_PATH) if use_sqlite else None
+        
+        # 증분 수집: 병합할 기존 데이터셋 (새 영상 중 기존 영상의 재업로드는 수집 단계에서 제거)
+        existing_videos = []
+        if args.incremental:
+            if catalog:
+                existing_videos = catalog.query_videos()
+            else:
+                latest_filepath = json_handler.find_latest()
+                if latest_filepath:
+                    existing_videos = json_handler.load_videos(latest_filepath)
+        
         # 메인 컬렉터 초기화
         collector = MainCollector(
             api_key=settings.YOUTUBE_API_KEY,
-            min_quality_score=settings.MIN_QUALITY_SCORE
+            min_quality_score=settings.MIN_QUALITY_SCORE,
+            max_workers=settings.MAX_WORKERS,
+            max_videos_per_keyword=settings.MAX_VIDEOS_PER_KEYWORD,
+            requests_per_second=settings.API_REQUESTS_PER_SECOND,
+            burst=settings.API_BURST,
+            api_cache=api_cache,
+            quota_ledger=quota_ledger,
+            phase_budgets={
+                'search': settings.SEARCH_PHASE_QUOTA,
+                'channel_expansion': settings.CHANNEL_PHASE_QUOTA
+            },
+            collection_state=collection_state,
+            near_duplicate_threshold=settings.NEAR_DUPLICATE_THRESHOLD or None,
+            on_video_accepted=jsonl_writer.write if jsonl_writer else None,
+            # 유사 중복으로 빠진 영상은 기록기를 닫을 때 JSONL에서도 제거
+            on_video_discarded=jsonl_writer.discard if jsonl_writer else None,
+            existing_videos=existing_videos
         )
         
         # 수집 실행
-        collection_result = collector.collect_oxford_reading_tree_level1()
+        try:
+            collection_result = collector.collect_oxford_reading_tree_level1()
+        finally:
+            if jsonl_writer:
+                jsonl_writer.close()
+                logger.info(f"JSONL 기록 완료: {jsonl_writer.filepath} ({jsonl_writer.count}개 영상)")
         
         # 데이터 처리
         processor = DataProcessor()
-        report = processor.generate_collection_report(collection_result)
-        mcp_data = processor.prepare_for_mcp(collection_result['videos'])
         
-        # 저장 핸들러 초기화
-        json_handler = JSONHandler(settings.RAW_DATA_DIR)
-        csv_handler = CSVHandler(settings.PROCESSED_DATA_DIR)
+        # 카탈로그 DB upsert (같은 video_id는 갱신)
+        if catalog:
+            catalog.save_videos(collection_result['videos'])
+            catalog.save_channels(collection_result['channel_stats'])
         
-        # 타임스탬프
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # 증분 수집: 기존 데이터셋에 새 영상 병합
+        if args.incremental:
+            if catalog:
+                collection_result['videos'] = catalog.query_videos()
+            elif existing_videos:
+                collection_result['videos'] = processor.merge_videos(existing_videos, collection_result['videos'])
         
-        # 데이터 저장
+        # 데이터 저장 (영상마다 한 번 직렬화하여 모든 출력에 전달)
         logger.info("💾 수집 결과 저장 중...")
         
-        # 1. 원시 영상 데이터 (JSON)
-        json_handler.save_videos(
-            collection_result['videos'], 
-            f"ort_level1_videos_{timestamp}.json"
-        )
-        
-        # 2. 처리된 영상 데이터 (CSV)
-        csv_handler.save_videos(
-            collection_result['videos'],
-            f"ort_level1_videos_{timestamp}.csv"
-        )
-        
-        # 3. 요약 CSV
-        csv_handler.save_summary_csv(
-            collection_result['videos'],
-            f"ort_level1_summary_{timestamp}.csv"
-        )
+        pipeline = ExportPipeline()
+        if use_files:
+            # 1. 원시 영상 데이터 (JSON)
+            pipeline.register(RawJSONSink(os.path.join(settings.RAW_DATA_DIR, f"ort_level1_videos_{timestamp}.json")))
+            # 2. 처리된 영상 데이터 (CSV)
+            pipeline.register(FullCSVSink(os.path.join(settings.PROCESSED_DATA_DIR, f"ort_level1_videos_{timestamp}.csv")))
+            # 3. 요약 CSV
+            pipeline.register(SummaryCSVSink(os.path.join(settings.PROCESSED_DATA_DIR, f"ort_level1_summary_{timestamp}.csv")))
         
         # 4. 수집 리포트
-        json_handler.save_report(
-            report,
-            f"collection_report_{timestamp}.json"
+        # 수집 중 누적된 통계를 그대로 사용 (증분 병합 시에는 병합된 목록으로 다시 누적)
+        report_sink = ReportSink(
+            processor, collection_result, json_handler, f"collection_report_{timestamp}.json",
+            video_summary=None if args.incremental else collection_result.get('report_summary')
         )
+        pipeline.register(report_sink)
         
         # 5. MCP 서버용 데이터
-        mcp_filepath = os.path.join(settings.EXPORTS_DIR, f"mcp_content_{timestamp}.json")
-        with open(mcp_filepath, 'w', encoding='utf-8') as f:
-            import json
-            json.dump(mcp_data, f, ensure_ascii=False, indent=2)
-        logger.info(f"MCP 데이터 저장 완료: {mcp_filepath}")
+        pipeline.register(MCPJSONSink(os.path.join(settings.EXPORTS_DIR, f"mcp_content_{timestamp}.json")))
+        
+        pipeline.run(collection_result['videos'])
+        report = report_sink.report
         
         # 최종 결과 출력
         logger.info("\n" + "="*60)
@@ -0,0 +1,162 @@
+"""YouTube API 응답 캐시 (SQLite)"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class APICache:
+    """엔드포인트별 TTL을 가진 SQLite 기반 API 응답 캐시
+
+    키는 엔드포인트 이름과 정규화된 요청 파라미터로 만든다.
+    TTL이 지난 항목도 ETag 재검증을 위해 남겨 두며, 서버가 304를
+    돌려주면 저장된 응답을 그대로 재사용한다.
+    """
+
+    # 엔드포인트별 기본 TTL (초)
+    DEFAULT_TTLS = {
+        'search': 6 * 3600,
+        'videos': 3600,
+        'channels': 24 * 3600,
+        'playlistItems': 3600,
+    }
+
+    def __init__(self, db_path: str, ttls: Optional[Dict[str, int]] = None):
+        self.db_path = db_path
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.logger = logging.getLogger(__name__)
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # 여러 수집 워커가 공유하므로 연결 하나를 잠금으로 보호
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS api_responses (
+                cache_key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                params TEXT NOT NULL,
+                response TEXT NOT NULL,
+                etag TEXT,
+                stored_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def normalize_params(params: Dict[str, Any]) -> Dict[str, Any]:
+        """캐시 키와 실제 요청에 함께 쓰이는 정규화된 파라미터"""
+        normalized = {}
+        for key, value in params.items():
+            if value is None:
+                continue
+            # id 목록은 순서와 무관하게 같은 요청으로 취급
+            if key == 'id' and isinstance(value, str) and ',' in value:
+                value = ','.join(sorted(set(value.split(','))))
+            normalized[key] = value
+        return normalized
+
+    def make_key(self, endpoint: str, params: Dict[str, Any]) -> str:
+        payload = json.dumps(
+            {'endpoint': endpoint, 'params': self.normalize_params(params)},
+            sort_keys=True, separators=(',', ':'), default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def lookup(self, endpoint: str, params: Dict[str, Any]) -> Tuple[Optional[Dict], Optional[str], bool]:
+        """(응답, ETag, 신선 여부) 반환. 항목이 없으면 (None, None, False)"""
+        cache_key = self.make_key(endpoint, params)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, etag, stored_at FROM api_responses WHERE cache_key = ?",
+                (cache_key,)
+            ).fetchone()
+
+        if row is None:
+            return None, None, False
+
+        response, etag, stored_at = row
+        ttl = self.ttls.get(endpoint, 0)
+        is_fresh = (time.time() - stored_at) < ttl
+        return json.loads(response), etag, is_fresh
+
+    def store(self, endpoint: str, params: Dict[str, Any], response: Dict):
+        cache_key = self.make_key(endpoint, params)
+        normalized = json.dumps(self.normalize_params(params), sort_keys=True, default=str)
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO api_responses (cache_key, endpoint, params, response, etag, stored_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    response = excluded.response,
+                    etag = excluded.etag,
+                    stored_at = excluded.stored_at
+                """,
+                (cache_key, endpoint, normalized, json.dumps(response, ensure_ascii=False),
+                 response.get('etag'), time.time())
+            )
+            self._conn.commit()
+
+    def touch(self, endpoint: str, params: Dict[str, Any]):
+        """ETag 재검증(304) 성공 시 저장 시각 갱신"""
+        cache_key = self.make_key(endpoint, params)
+        with self._lock:
+            self._conn.execute(
+                "UPDATE api_responses SET stored_at = ? WHERE cache_key = ?",
+                (time.time(), cache_key)
+            )
+            self._conn.commit()
+
+    def record_hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def record_revalidated(self):
+        with self._lock:
+            self.revalidated += 1
+
+    def purge(self, max_age_seconds: int) -> int:
+        """오래된 항목 삭제 (재검증 대상으로도 쓰기 어려운 항목 정리)"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM api_responses WHERE stored_at < ?",
+                (time.time() - max_age_seconds,)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 적중/실패 통계"""
+        with self._lock:
+            total = self.hits + self.misses + self.revalidated
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'revalidated': self.revalidated,
+                'hit_rate': round(self.hits / total, 3) if total else 0.0
+            }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,117 @@
+"""JSONL 원시 영상 아카이브의 오프셋 인덱스와 mmap 기반 임의 접근"""
+
+import json
+import logging
+import mmap
+import os
+from typing import Any, Dict, Optional, Tuple
+
+from ..models.video_model import VideoData
+
+INDEX_SUFFIX = '.idx'
+
+
+def index_path_for(archive_path: str) -> str:
+    """아카이브 파일의 사이드카 인덱스 경로 (예: videos.jsonl -> videos.jsonl.idx)"""
+    return archive_path + INDEX_SUFFIX
+
+
+def format_index_entry(video_id: str, offset: int, length: int) -> str:
+    """인덱스 한 줄: video_id<TAB>바이트 오프셋<TAB>바이트 길이"""
+    return f"{video_id}\t{offset}\t{length}\n"
+
+
+def build_index(archive_path: str, index_path: Optional[str] = None) -> int:
+    """아카이브 전체를 한 번 스캔하여 인덱스를 다시 생성
+
+    인덱스가 없거나 기록 도중 중단된 아카이브에 사용한다. 같은 video_id가
+    여러 번 있으면 나중 레코드가 우선한다. 손상된 줄은 건너뛴다.
+    """
+    logger = logging.getLogger(__name__)
+    index_path = index_path or index_path_for(archive_path)
+    count = 0
+    offset = 0
+
+    with open(archive_path, 'rb') as archive, open(index_path, 'w', encoding='utf-8') as index:
+        for line in archive:
+            length = len(line)
+            record = line.strip()
+            if record:
+                try:
+                    video_id = json.loads(record)['video_id']
+                    index.write(format_index_entry(video_id, offset, length))
+                    count += 1
+                except (ValueError, KeyError, TypeError) as e:
+                    logger.warning(f"인덱스 생성 중 {archive_path}@{offset} 건너뜀: {e}")
+            offset += length
+
+    logger.info(f"인덱스 생성 완료: {index_path} ({count}개 레코드)")
+    return count
+
+
+class ArchiveReader:
+    """사이드카 인덱스로 JSONL 아카이브의 레코드 하나만 읽어오는 리더
+
+    아카이브는 메모리 맵으로 열고, 요청된 video_id의 바이트 범위만 디코딩한다.
+    인덱스는 (video_id -> 오프셋, 길이) 딕셔너리로 한 번만 읽는다.
+    """
+
+    def __init__(self, archive_path: str, index_path: Optional[str] = None):
+        self.archive_path = archive_path
+        self.index_path = index_path or index_path_for(archive_path)
+        self.logger = logging.getLogger(__name__)
+
+        if not os.path.exists(self.index_path):
+            build_index(self.archive_path, self.index_path)
+
+        self._file = open(archive_path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        # 빈 파일은 mmap할 수 없음
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self._offsets = self._load_index(size)
+
+    def _load_index(self, archive_size: int) -> Dict[str, Tuple[int, int]]:
+        offsets: Dict[str, Tuple[int, int]] = {}
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                parts = line.rstrip('\n').split('\t')
+                if len(parts) != 3:
+                    continue  # 기록 도중 잘린 인덱스 줄
+                video_id, offset, length = parts[0], int(parts[1]), int(parts[2])
+                if offset + length > archive_size:
+                    continue  # 아카이브에 아직 없는 범위
+                offsets[video_id] = (offset, length)
+        return offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __contains__(self, video_id: str) -> bool:
+        return video_id in self._offsets
+
+    def get_raw(self, video_id: str) -> Optional[Dict[str, Any]]:
+        """video_id 레코드를 딕셔너리로 반환 (없으면 None)"""
+        location = self._offsets.get(video_id)
+        if location is None or self._mmap is None:
+            return None
+        offset, length = location
+        return json.loads(self._mmap[offset:offset + length])
+
+    def get(self, video_id: str) -> Optional[VideoData]:
+        """video_id 레코드를 VideoData로 반환 (없으면 None, JSON 바이트에서 바로 검증)"""
+        location = self._offsets.get(video_id)
+        if location is None or self._mmap is None:
+            return None
+        offset, length = location
+        return VideoData.model_validate_json(self._mmap[offset:offset + length])
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> 'ArchiveReader':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,85 @@
+"""증분 수집 상태 저장소 (SQLite)"""
+
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Iterable, Optional, Set
+
+
+class CollectionState:
+    """실행 간에 유지되는 수집 상태
+
+    - seen_videos: 이미 상세 조회/분석한 영상 ID
+    - watermarks: 키워드/채널별 마지막 수집 시각 (다음 실행의 publishedAfter)
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.logger = logging.getLogger(__name__)
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS seen_videos (
+                video_id TEXT PRIMARY KEY,
+                first_seen_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS watermarks (
+                scope TEXT NOT NULL,
+                key TEXT NOT NULL,
+                watermark TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (scope, key)
+            );
+            """
+        )
+        self._conn.commit()
+
+    def load_seen_ids(self) -> Set[str]:
+        """지금까지 분석한 모든 영상 ID"""
+        with self._lock:
+            rows = self._conn.execute("SELECT video_id FROM seen_videos").fetchall()
+        return {row[0] for row in rows}
+
+    def add_seen_ids(self, video_ids: Iterable[str]):
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen_videos (video_id, first_seen_at) VALUES (?, ?)",
+                ((video_id, now) for video_id in video_ids)
+            )
+            self._conn.commit()
+
+    def get_watermark(self, scope: str, key: str) -> Optional[datetime]:
+        """scope('keyword' / 'channel')와 key의 마지막 수집 시각"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT watermark FROM watermarks WHERE scope = ? AND key = ?",
+                (scope, key)
+            ).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def set_watermark(self, scope: str, key: str, watermark: datetime):
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO watermarks (scope, key, watermark, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(scope, key) DO UPDATE SET
+                    watermark = excluded.watermark,
+                    updated_at = excluded.updated_at
+                """,
+                (scope, key, watermark.isoformat(), datetime.now(timezone.utc).isoformat())
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
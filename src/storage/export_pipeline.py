@@ -0,0 +1,270 @@
+"""수집 결과 내보내기 파이프라인 (영상당 한 번 직렬화, 모든 싱크에 전달)"""
+
+import csv
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from ..models.video_model import VideoData
+from .json_handler import JSONHandler, video_to_json_dict
+
+# 전체 CSV 열
+FULL_CSV_FIELDS = [
+    'video_id', 'title', 'channel_title', 'url', 'quality_score',
+    'is_level1_content', 'learning_objectives', 'view_count',
+    'like_count', 'duration_seconds', 'published_at', 'thumbnail_url'
+]
+
+# 요약 CSV 열
+SUMMARY_CSV_FIELDS = ['Title', 'Channel', 'Quality Score', 'Level 1 Content', 'Duration (min)', 'Views', 'URL']
+
+# 리포트 상위 영상 항목
+REPORT_VIDEO_FIELDS = [
+    'video_id', 'title', 'channel_title', 'url', 'quality_score', 'is_level1_content',
+    'learning_objectives', 'view_count', 'duration_seconds', 'published_at'
+]
+
+REPORT_TOP_VIDEOS = 10
+
+
+def canonical_row(video: VideoData) -> Dict[str, Any]:
+    """영상을 모든 싱크가 공유하는 표준 행으로 변환 (published_at은 ISO 문자열)"""
+    return video_to_json_dict(video)
+
+
+def duration_minutes(row: Dict[str, Any]) -> float:
+    return round(row['duration_seconds'] / 60, 1) if row['duration_seconds'] else 0
+
+
+def report_item(row: Dict[str, Any]) -> Dict[str, Any]:
+    """리포트 상위 영상 목록 항목"""
+    return {field: row[field] for field in REPORT_VIDEO_FIELDS}
+
+
+def mcp_item(row: Dict[str, Any]) -> Dict[str, Any]:
+    """MCP 서버용 콘텐츠 항목"""
+    return {
+        'content_id': row['video_id'],
+        'title': row['title'],
+        'description': row['description'],
+        'url': row['url'],
+        'content_type': 'youtube_video',
+        'educational_level': 'oxford_reading_tree_level_1',
+        'target_age': '3-4',
+        'learning_objectives': row['learning_objectives'] or [],
+        'quality_score': row['quality_score'],
+        'duration_minutes': duration_minutes(row),
+        'channel': row['channel_title'],
+        'is_level1_verified': row['is_level1_content'],
+        'metadata': {
+            'view_count': row['view_count'],
+            'like_count': row['like_count'],
+            'published_date': row['published_at'],
+            'thumbnail_url': row['thumbnail_url']
+        }
+    }
+
+
+class ExportSink:
+    """내보내기 대상 기본 클래스
+
+    open() → 영상마다 write(row) → close() 순서로 호출된다. close()는 결과
+    (보통 저장한 파일 경로)를 반환한다.
+    """
+
+    name = 'sink'
+
+    def open(self):
+        pass
+
+    def write(self, row: Dict[str, Any]):
+        raise NotImplementedError
+
+    def close(self) -> Any:
+        return None
+
+    def abort(self):
+        """실패 시 정리 (열린 파일 닫기, 결과는 만들지 않음)"""
+        pass
+
+
+class JSONArraySink(ExportSink):
+    """항목을 하나씩 JSON 배열로 기록 (json.dump(..., indent=2)와 같은 형식)"""
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self.count = 0
+        self._file = None
+
+    def to_item(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        return row
+
+    def open(self):
+        self.count = 0
+        self._file = open(self.filepath, 'w', encoding='utf-8')
+        self._file.write('[')
+
+    def write(self, row: Dict[str, Any]):
+        item = json.dumps(self.to_item(row), ensure_ascii=False, indent=2).replace('\n', '\n  ')
+        self._file.write(('\n  ' if self.count == 0 else ',\n  ') + item)
+        self.count += 1
+
+    def close(self) -> str:
+        if self._file is not None and not self._file.closed:
+            self._file.write('\n]' if self.count else ']')
+            self._file.close()
+        return self.filepath
+
+    def abort(self):
+        if self._file is not None and not self._file.closed:
+            self._file.close()
+
+
+class RawJSONSink(JSONArraySink):
+    """원시 영상 데이터 (전체 필드)"""
+
+    name = 'raw_json'
+
+
+class MCPJSONSink(JSONArraySink):
+    """MCP 서버용 콘텐츠 데이터"""
+
+    name = 'mcp_json'
+
+    def to_item(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        return mcp_item(row)
+
+
+class FullCSVSink(ExportSink):
+    """처리된 영상 데이터 CSV"""
+
+    name = 'full_csv'
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self._file = None
+        self._writer = None
+
+    def open(self):
+        self._file = open(self.filepath, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(FULL_CSV_FIELDS)
+
+    def write(self, row: Dict[str, Any]):
+        values = [row[field] for field in FULL_CSV_FIELDS]
+        objectives = row['learning_objectives']
+        values[FULL_CSV_FIELDS.index('learning_objectives')] = ', '.join(objectives) if objectives else ''
+        self._writer.writerow(values)
+
+    def close(self) -> str:
+        self.abort()
+        return self.filepath
+
+    def abort(self):
+        if self._file is not None and not self._file.closed:
+            self._file.close()
+
+
+class SummaryCSVSink(FullCSVSink):
+    """요약 CSV (주요 정보만)"""
+
+    name = 'summary_csv'
+
+    def open(self):
+        self._file = open(self.filepath, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(SUMMARY_CSV_FIELDS)
+
+    def write(self, row: Dict[str, Any]):
+        title = row['title']
+        self._writer.writerow([
+            title[:60] + '...' if len(title) > 60 else title,
+            row['channel_title'],
+            row['quality_score'],
+            'Yes' if row['is_level1_content'] else 'No',
+            # pandas 요약표와 같이 길이가 없는 영상도 실수로 기록 (0 -> 0.0)
+            float(duration_minutes(row)),
+            f"{row['view_count']:,}",
+            row['url']
+        ])
+
+
+class ReportSink(ExportSink):
+    """수집 리포트 (영상 통계를 행 단위로 누적한 뒤 close 시 리포트 생성/저장)
+
+    processor는 DataProcessor, 결과 리포트는 close 후 `report` 속성에 남는다.
+    video_summary(수집 중 누적된 ReportAccumulator.snapshot())를 주면 행을
+    다시 누적하지 않고 그대로 사용한다.
+    """
+
+    name = 'report'
+
+    def __init__(self, processor, collection_result: Dict, json_handler: JSONHandler, filename: str,
+                 video_summary: Optional[Dict[str, Any]] = None):
+        self.processor = processor
+        self.collection_result = collection_result
+        self.json_handler = json_handler
+        self.filename = filename
+        self.video_summary = video_summary
+        self.accumulator = None
+        self.report: Optional[Dict[str, Any]] = None
+
+    def open(self):
+        if self.video_summary is None:
+            self.accumulator = self.processor.new_report_accumulator()
+
+    def write(self, row: Dict[str, Any]):
+        if self.accumulator is not None:
+            self.accumulator.add_row(row)
+
+    def close(self) -> str:
+        video_summary = self.accumulator.snapshot() if self.accumulator is not None else self.video_summary
+        self.report = self.processor.generate_collection_report(self.collection_result, video_summary=video_summary)
+        return self.json_handler.save_report(self.report, self.filename)
+
+
+class ExportPipeline:
+    """등록된 모든 싱크에 영상 목록을 한 번의 순회로 전달
+
+    영상마다 canonical_row()를 한 번만 계산하고 같은 행을 모든 싱크가
+    공유한다. 새 출력 형식은 ExportSink를 구현해 register()로 추가한다.
+    """
+
+    def __init__(self, sinks: Optional[List[ExportSink]] = None):
+        self.sinks: List[ExportSink] = list(sinks or [])
+        self.logger = logging.getLogger(__name__)
+
+    def register(self, sink: ExportSink) -> 'ExportPipeline':
+        self.sinks.append(sink)
+        return self
+
+    def run(self, videos: List[VideoData]) -> Dict[str, Any]:
+        """싱크 이름 → close() 결과 (파일 경로 등)"""
+        results: Dict[str, Any] = {}
+        opened: List[ExportSink] = []
+
+        try:
+            for sink in self.sinks:
+                sink.open()
+                opened.append(sink)
+
+            for video in videos:
+                row = canonical_row(video)
+                for sink in self.sinks:
+                    sink.write(row)
+
+            for sink in self.sinks:
+                results[sink.name] = sink.close()
+                path = results[sink.name]
+                if isinstance(path, str) and os.path.exists(path):
+                    self.logger.info(f"내보내기 완료 [{sink.name}]: {path} ({len(videos)}개 영상)")
+            return results
+
+        except Exception as e:
+            self.logger.error(f"내보내기 실패: {e}")
+            # 열린 파일 정리
+            for sink in opened:
+                if sink.name not in results:
+                    sink.abort()
+            raise
@@ -2,11 +2,146 @@
 
 import json
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Iterator, Set, Tuple
 from datetime import datetime
 import logging
 
+from pydantic import TypeAdapter
+
 from ..models.video_model import VideoData
+from .archive_index import index_path_for, format_index_entry, build_index
+
+def video_to_json_dict(video: VideoData) -> Dict[str, Any]:
+    """VideoData를 JSON 직렬화 가능한 딕셔너리로 변환"""
+    video_dict = video.dict()
+    # datetime 객체를 ISO 형식 문자열로 변환
+    video_dict['published_at'] = video.published_at.isoformat()
+    return video_dict
+
+# 아카이브 전체(JSON 배열)를 한 번에 검증하는 어댑터
+_VIDEO_LIST_ADAPTER = TypeAdapter(List[VideoData])
+
+class JSONLWriter:
+    """영상을 한 줄에 하나씩 즉시 추가하는 JSON Lines 기록기
+    
+    줄마다 flush하므로 수집이 중간에 중단되어도 그때까지 기록된 영상은 남는다.
+    기존 파일이 있으면 이어서 추가하며, 중단된 실행이 남긴 잘린 마지막 줄은 먼저 잘라낸다.
+    사이드카 인덱스(.idx)에 각 레코드의
+    바이트 오프셋과 길이를 함께 기록하여 ArchiveReader로 임의 접근할 수 있다.
+    나중에 제외된 영상(유사 중복 등)은 discard()로 표시하면 close()할 때 파일에서 빠진다.
+    """
+    
+    # 잘린 줄을 찾을 때 파일 끝에서부터 읽는 단위
+    _TAIL_CHUNK = 64 * 1024
+    
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self.index_path = index_path_for(filepath)
+        self.count = 0
+        self.logger = logging.getLogger(__name__)
+        self._repair_tail()
+        self._file = open(filepath, 'ab')
+        self._index = open(self.index_path, 'a', encoding='utf-8')
+        # 이번 세션에 기록한 레코드 (video_id, 오프셋, 길이)와 제외할 video_id
+        self._start = self._file.tell()
+        self._entries: List[Tuple[str, int, int]] = []
+        self._discarded: Set[str] = set()
+    
+    def _repair_tail(self):
+        """줄바꿈으로 끝나지 않는 마지막 줄을 잘라내고, 인덱스가 아카이브와 맞지 않으면 다시 생성
+        
+        잘린 줄 뒤에 바로 이어 쓰면 다음 레코드와 한 줄로 붙어 로더가 둘 다 버리게 된다.
+        """
+        if not os.path.exists(self.filepath):
+            return
+        with open(self.filepath, 'r+b') as f:
+            size = f.seek(0, os.SEEK_END)
+            end = size
+            # 마지막 줄바꿈 바로 뒤까지만 남김
+            while end > 0:
+                start = max(0, end - self._TAIL_CHUNK)
+                f.seek(start)
+                chunk = f.read(end - start)
+                newline = chunk.rfind(b'\n')
+                if newline >= 0:
+                    end = start + newline + 1
+                    break
+                end = start
+            if end < size:
+                f.truncate(end)
+                self.logger.warning(f"JSONL {self.filepath}: 잘린 마지막 줄 {size - end}바이트 제거")
+        
+        if not self._index_matches(end):
+            build_index(self.filepath, self.index_path)
+    
+    def _index_matches(self, archive_size: int) -> bool:
+        """인덱스의 마지막 항목이 아카이브 끝에서 끝나는지 (인덱스 줄도 잘리지 않았는지)"""
+        if not os.path.exists(self.index_path):
+            return archive_size == 0
+        with open(self.index_path, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return archive_size == 0
+            f.seek(max(0, size - 1024))
+            tail = f.read()
+        if not tail.endswith(b'\n'):
+            return False
+        parts = tail[:-1].rsplit(b'\n', 1)[-1].split(b'\t')
+        try:
+            return len(parts) == 3 and int(parts[1]) + int(parts[2]) == archive_size
+        except ValueError:
+            return False
+    
+    def write(self, video: VideoData):
+        line = (json.dumps(video_to_json_dict(video), ensure_ascii=False) + '\n').encode('utf-8')
+        offset = self._file.tell()
+        self._file.write(line)
+        self._file.flush()
+        # 레코드를 먼저 기록한 뒤 인덱스 추가 (인덱스가 없는 레코드는 build_index로 복구)
+        self._index.write(format_index_entry(video.video_id, offset, len(line)))
+        self._index.flush()
+        self._entries.append((video.video_id, offset, len(line)))
+        self.count += 1
+    
+    def discard(self, video: VideoData):
+        """이번 세션에 기록한 영상을 close() 때 파일에서 제거하도록 표시"""
+        self._discarded.add(video.video_id)
+    
+    def close(self):
+        if self._file.closed:
+            return
+        for f in (self._file, self._index):
+            f.close()
+        if self._discarded:
+            self._compact()
+    
+    def _compact(self):
+        """제외한 영상의 줄을 뺀 아카이브와 인덱스를 임시 파일에 쓴 뒤 교체"""
+        kept = [entry for entry in self._entries if entry[0] not in self._discarded]
+        archive_tmp = self.filepath + '.tmp'
+        index_tmp = self.index_path + '.tmp'
+        with open(self.filepath, 'rb') as source, open(archive_tmp, 'wb') as archive, \
+                open(index_tmp, 'w', encoding='utf-8') as index:
+            # 이전 세션의 내용은 그대로 복사
+            archive.write(source.read(self._start))
+            with open(self.index_path, 'r', encoding='utf-8') as old_index:
+                for line in old_index:
+                    parts = line.split('\t')
+                    if len(parts) == 3 and int(parts[1]) < self._start:
+                        index.write(line)
+            for video_id, offset, length in kept:
+                source.seek(offset)
+                index.write(format_index_entry(video_id, archive.tell(), length))
+                archive.write(source.read(length))
+        os.replace(archive_tmp, self.filepath)
+        os.replace(index_tmp, self.index_path)
+        self.count = len(kept)
+    
+    def __enter__(self) -> 'JSONLWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
 class JSONHandler:
     def __init__(self, base_dir: str = "data"):
@@ -23,12 +158,7 @@ class JSONHandler:
         filepath = os.path.join(self.base_dir, filename)
         
         # VideoData 객체를 딕셔너리로 변환
-        videos_data = []
-        for video in videos:
-            video_dict = video.dict()
-            # datetime 객체를 ISO 형식 문자열로 변환
-            video_dict['published_at'] = video.published_at.isoformat()
-            videos_data.append(video_dict)
+        videos_data = [video_to_json_dict(video) for video in videos]
         
         try:
             with open(filepath, 'w', encoding='utf-8') as f:
@@ -63,20 +193,44 @@ class JSONHandler:
             self.logger.error(f"리포트 저장 실패: {e}")
             raise
     
+    def open_jsonl_writer(self, filename: str = None) -> JSONLWriter:
+        """영상을 하나씩 추가하는 JSON Lines 기록기 열기"""
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"ort_level1_videos_{timestamp}.jsonl"
+        
+        filepath = os.path.join(self.base_dir, filename)
+        self.logger.info(f"JSONL 기록 시작: {filepath}")
+        return JSONLWriter(filepath)
+    
+    def iter_videos_jsonl(self, filepath: str) -> Iterator[VideoData]:
+        """JSON Lines 파일에서 영상을 한 줄씩 읽어 검증 후 반환 (메모리 사용량 일정)
+        
+        중단된 실행이 남긴 잘린 줄 등 손상된 줄은 경고 후 건너뛴다.
+        """
+        with open(filepath, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield VideoData.model_validate_json(line)
+                except Exception as e:
+                    self.logger.warning(f"JSONL {filepath}:{line_number} 건너뜀: {e}")
+    
+    def find_latest(self, prefix: str = "ort_level1_videos_", suffix: str = ".json") -> Optional[str]:
+        """가장 최근에 저장된 파일 경로 (파일명의 타임스탬프 기준)"""
+        candidates = sorted(
+            name for name in os.listdir(self.base_dir)
+            if name.startswith(prefix) and name.endswith(suffix)
+        )
+        return os.path.join(self.base_dir, candidates[-1]) if candidates else None
+    
     def load_videos(self, filepath: str) -> List[VideoData]:
-        """JSON에서 영상 데이터 로드"""
+        """JSON에서 영상 데이터 로드 (파일 전체를 TypeAdapter로 한 번에 파싱/검증)"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                videos_data = json.load(f)
-            
-            videos = []
-            for video_dict in videos_data:
-                # ISO 형식 문자열을 datetime 객체로 변환
-                if isinstance(video_dict['published_at'], str):
-                    video_dict['published_at'] = datetime.fromisoformat(video_dict['published_at'])
-                
-                video = VideoData(**video_dict)
-                videos.append(video)
+            with open(filepath, 'rb') as f:
+                videos = _VIDEO_LIST_ADAPTER.validate_json(f.read())
             
             self.logger.info(f"JSON 로드 완료: {filepath} ({len(videos)}개 영상)")
             return videos
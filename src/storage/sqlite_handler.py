@@ -0,0 +1,202 @@
+"""SQLite 카탈로그 저장/조회 핸들러"""
+
+import json
+import os
+import sqlite3
+from typing import List, Dict, Any, Optional
+from datetime import datetime, timezone
+import logging
+
+from ..models.video_model import VideoData
+from ..models.channel_model import ChannelAggregate
+
+VIDEO_COLUMNS = [
+    'video_id', 'title', 'description', 'channel_id', 'channel_title',
+    'published_at', 'duration', 'duration_seconds', 'view_count', 'like_count',
+    'comment_count', 'url', 'thumbnail_url', 'quality_score', 'is_level1_content',
+    'learning_objectives', 'educational_rating', 'updated_at'
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    video_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT,
+    channel_id TEXT NOT NULL,
+    channel_title TEXT,
+    published_at TEXT NOT NULL,
+    duration TEXT,
+    duration_seconds INTEGER,
+    view_count INTEGER,
+    like_count INTEGER,
+    comment_count INTEGER,
+    url TEXT,
+    thumbnail_url TEXT,
+    quality_score INTEGER,
+    is_level1_content INTEGER,
+    learning_objectives TEXT,
+    educational_rating TEXT,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_videos_channel_id ON videos (channel_id);
+CREATE INDEX IF NOT EXISTS idx_videos_quality_score ON videos (quality_score);
+CREATE INDEX IF NOT EXISTS idx_videos_is_level1 ON videos (is_level1_content, quality_score);
+CREATE INDEX IF NOT EXISTS idx_videos_published_at ON videos (published_at);
+
+CREATE TABLE IF NOT EXISTS channels (
+    channel_id TEXT PRIMARY KEY,
+    channel_name TEXT,
+    video_count INTEGER,
+    avg_quality_score REAL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_channels_avg_quality ON channels (avg_quality_score);
+"""
+
+class SQLiteHandler:
+    def __init__(self, db_path: str = "data/catalog.sqlite3"):
+        self.db_path = db_path
+        self.logger = logging.getLogger(__name__)
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    @staticmethod
+    def _to_utc_iso(value: datetime) -> str:
+        """정렬/범위 조회가 가능하도록 UTC ISO 문자열로 저장"""
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.isoformat()
+
+    def _video_to_row(self, video: VideoData, updated_at: str) -> tuple:
+        return (
+            video.video_id,
+            video.title,
+            video.description,
+            video.channel_id,
+            video.channel_title,
+            self._to_utc_iso(video.published_at),
+            video.duration,
+            video.duration_seconds,
+            video.view_count,
+            video.like_count,
+            video.comment_count,
+            video.url,
+            video.thumbnail_url,
+            video.quality_score,
+            None if video.is_level1_content is None else int(video.is_level1_content),
+            json.dumps(video.learning_objectives, ensure_ascii=False) if video.learning_objectives is not None else None,
+            video.educational_rating,
+            updated_at
+        )
+
+    def _row_to_video(self, row: sqlite3.Row) -> VideoData:
+        data = dict(row)
+        data.pop('updated_at', None)
+        data['published_at'] = datetime.fromisoformat(data['published_at'])
+        if data['is_level1_content'] is not None:
+            data['is_level1_content'] = bool(data['is_level1_content'])
+        if data['learning_objectives'] is not None:
+            data['learning_objectives'] = json.loads(data['learning_objectives'])
+        return VideoData(**data)
+
+    def save_videos(self, videos: List[VideoData], batch_size: int = 1000) -> int:
+        """영상 데이터 upsert (배치당 하나의 트랜잭션)"""
+        placeholders = ', '.join('?' for _ in VIDEO_COLUMNS)
+        updates = ', '.join(f"{column} = excluded.{column}" for column in VIDEO_COLUMNS if column != 'video_id')
+        sql = (
+            f"INSERT INTO videos ({', '.join(VIDEO_COLUMNS)}) VALUES ({placeholders}) "
+            f"ON CONFLICT(video_id) DO UPDATE SET {updates}"
+        )
+        updated_at = datetime.now(timezone.utc).isoformat()
+
+        try:
+            for i in range(0, len(videos), batch_size):
+                batch = videos[i:i + batch_size]
+                with self.conn:
+                    self.conn.executemany(sql, (self._video_to_row(video, updated_at) for video in batch))
+
+            self.logger.info(f"SQLite 저장 완료: {self.db_path} ({len(videos)}개 영상)")
+            return len(videos)
+
+        except Exception as e:
+            self.logger.error(f"SQLite 저장 실패: {e}")
+            raise
+
+    def save_channels(self, channel_stats: Dict[str, ChannelAggregate]) -> int:
+        """채널 통계 upsert"""
+        updated_at = datetime.now(timezone.utc).isoformat()
+        rows = [
+            (channel_id, stats.name, stats.video_count, stats.avg_quality_score, updated_at)
+            for channel_id, stats in channel_stats.items()
+        ]
+
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    """
+                    INSERT INTO channels (channel_id, channel_name, video_count, avg_quality_score, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(channel_id) DO UPDATE SET
+                        channel_name = excluded.channel_name,
+                        video_count = excluded.video_count,
+                        avg_quality_score = excluded.avg_quality_score,
+                        updated_at = excluded.updated_at
+                    """,
+                    rows
+                )
+            return len(rows)
+
+        except Exception as e:
+            self.logger.error(f"채널 저장 실패: {e}")
+            raise
+
+    def get_video(self, video_id: str) -> Optional[VideoData]:
+        """video_id로 영상 1개 조회"""
+        row = self.conn.execute("SELECT * FROM videos WHERE video_id = ?", (video_id,)).fetchone()
+        return self._row_to_video(row) if row else None
+
+    def query_videos(self, channel_id: Optional[str] = None, min_quality_score: Optional[int] = None,
+                     level1_only: bool = False, published_after: Optional[datetime] = None,
+                     limit: Optional[int] = None) -> List[VideoData]:
+        """인덱스를 사용하는 조건 조회 (품질 점수 내림차순)
+
+        예: query_videos(channel_id='UC...', min_quality_score=70, level1_only=True)
+        """
+        conditions = []
+        params: List[Any] = []
+
+        if channel_id is not None:
+            conditions.append("channel_id = ?")
+            params.append(channel_id)
+        if level1_only:
+            conditions.append("is_level1_content = 1")
+        if min_quality_score is not None:
+            conditions.append("quality_score >= ?")
+            params.append(min_quality_score)
+        if published_after is not None:
+            conditions.append("published_at > ?")
+            params.append(self._to_utc_iso(published_after))
+
+        sql = "SELECT * FROM videos"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY quality_score DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        return [self._row_to_video(row) for row in self.conn.execute(sql, params)]
+
+    def count_videos(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM videos").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
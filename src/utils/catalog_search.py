@@ -0,0 +1,329 @@
+"""수집 카탈로그 검색용 역색인 (BM25 순위 + 조건 필터)"""
+
+import logging
+import math
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..models.video_model import VideoData
+
+_TOKEN_PATTERN = re.compile(r'[^\W_]+')
+
+# 검색에서 무시하는 흔한 영어 단어
+STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is', 'it',
+    'of', 'on', 'or', 'that', 'the', 'this', 'to', 'with', 'about', 'video', 'videos'
+})
+
+# 필드별 가중치 (해당 필드에 나온 횟수에 곱해 문서 내 빈도로 사용)
+FIELD_WEIGHTS = {
+    'title': 2,
+    'description': 1,
+    'learning_objectives': 2
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """소문자 단어 토큰 (밑줄도 구분자로 처리: story_comprehension -> story, comprehension)"""
+    return [token for token in _TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+class CatalogSearchIndex:
+    """제목/설명/학습 목표에 대한 역색인과 BM25 순위 검색
+
+    - 문서마다 슬롯 번호를 배정하고, 단어별 포스팅(슬롯, 가중 빈도)을 유지
+    - 단어별 문서 BM25 점수를 미리 계산해 점수 내림차순으로 보관 (변경 후 첫 검색 때 생성)
+    - 흔한 단어(dense_ratio 이상 문서에 등장)는 슬롯 전체 길이 배열로 두어 점수 합산을 벡터 덧셈으로 처리
+    - 단어별 점수 상위 문서로 k번째 점수의 하한을 먼저 구해, 그 이상인 문서에만 필터와 정렬을 적용
+    - 재생 시간/품질 점수/Level 1 필터는 후보 슬롯에만 마스크로 적용
+    - 문서 수/평균 길이는 stats_tolerance 이내 변화면 캐시한 점수를 그대로 사용
+    - add/remove로 증분 갱신 (삭제는 표시만 하고 삭제 비율이 높아지면 압축)
+
+    사용 예:
+        index = CatalogSearchIndex.from_videos(videos)
+        index.search("phonics floppy", max_duration_minutes=8, top_k=10)
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, compact_ratio: float = 0.3,
+                 stats_tolerance: float = 0.05, dense_ratio: float = 0.05):
+        self.k1 = k1
+        self.b = b
+        self.compact_ratio = compact_ratio
+        self.stats_tolerance = stats_tolerance
+        self.dense_ratio = dense_ratio
+        self.logger = logging.getLogger(__name__)
+        self._reset()
+
+    def _reset(self):
+        self._doc_ids: List[Optional[str]] = []
+        self._slots: Dict[str, int] = {}
+        self._payloads: List[Any] = []
+        self._doc_terms: List[Optional[Dict[str, int]]] = []
+
+        # 슬롯별 속성 (numpy 배열은 _attributes()에서 지연 생성)
+        self._lengths: List[int] = []
+        self._durations: List[float] = []
+        self._scores: List[float] = []
+        self._level1: List[bool] = []
+        self._alive: List[bool] = []
+        self._attribute_arrays: Optional[Tuple[np.ndarray, ...]] = None
+
+        # 단어 -> ([슬롯], [가중 빈도]), 단어 -> BM25 점수 배열, 단어 -> 살아있는 문서 수
+        self._postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        self._posting_arrays: Dict[str, Tuple[np.ndarray, ...]] = {}
+        self._impact_stats: Optional[Tuple[int, float]] = None
+        self._document_frequency: Dict[str, int] = {}
+
+        self._live_count = 0
+        self._live_length_sum = 0
+
+    @classmethod
+    def from_videos(cls, videos: Iterable[VideoData], **kwargs) -> 'CatalogSearchIndex':
+        index = cls(**kwargs)
+        for video in videos:
+            index.add_video(video)
+        return index
+
+    @classmethod
+    def from_mcp_items(cls, items: Iterable[Dict[str, Any]], **kwargs) -> 'CatalogSearchIndex':
+        """DataProcessor.prepare_for_mcp 형식의 항목으로 색인 생성 (payload는 항목 자체)"""
+        index = cls(**kwargs)
+        for item in items:
+            index.add_mcp_item(item)
+        return index
+
+    def add_video(self, video: VideoData, payload: Any = None):
+        self.add(
+            video.video_id,
+            title=video.title,
+            description=video.description,
+            learning_objectives=video.learning_objectives,
+            duration_minutes=(video.duration_seconds or 0) / 60,
+            quality_score=video.quality_score or 0,
+            is_level1=bool(video.is_level1_content),
+            payload=payload if payload is not None else video
+        )
+
+    def add_mcp_item(self, item: Dict[str, Any]):
+        self.add(
+            item['content_id'],
+            title=item['title'],
+            description=item.get('description', ''),
+            learning_objectives=item.get('learning_objectives'),
+            duration_minutes=item.get('duration_minutes') or 0,
+            quality_score=item.get('quality_score') or 0,
+            is_level1=bool(item.get('is_level1_verified')),
+            payload=item
+        )
+
+    def add(self, doc_id: str, title: str, description: str = '', learning_objectives: Optional[List[str]] = None,
+            duration_minutes: float = 0, quality_score: float = 0, is_level1: bool = False, payload: Any = None):
+        """문서 추가 (같은 doc_id가 있으면 교체)"""
+        if doc_id in self._slots:
+            self.remove(doc_id)
+
+        term_counts: Dict[str, int] = {}
+        for field, text in (('title', title), ('description', description or ''),
+                            ('learning_objectives', ' '.join(learning_objectives or []))):
+            weight = FIELD_WEIGHTS[field]
+            for token in tokenize(text):
+                term_counts[token] = term_counts.get(token, 0) + weight
+
+        self._add_terms(doc_id, term_counts, float(duration_minutes), float(quality_score), bool(is_level1), payload)
+
+    def remove(self, doc_id: str) -> bool:
+        """문서 삭제 (슬롯은 삭제 표시만 하고 포스팅은 압축 시 정리)"""
+        slot = self._slots.pop(doc_id, None)
+        if slot is None:
+            return False
+
+        term_counts = self._doc_terms[slot]
+        for term in term_counts:
+            self._document_frequency[term] -= 1
+            self._posting_arrays.pop(term, None)
+
+        self._alive[slot] = False
+        self._doc_ids[slot] = None
+        self._payloads[slot] = None
+        self._doc_terms[slot] = None
+        self._attribute_arrays = None
+        self._live_count -= 1
+        self._live_length_sum -= self._lengths[slot]
+
+        if len(self._doc_ids) - self._live_count > self.compact_ratio * max(len(self._doc_ids), 1):
+            self.compact()
+        return True
+
+    def compact(self):
+        """삭제된 슬롯을 제거하고 색인 재구성"""
+        documents = [
+            (doc_id, self._doc_terms[slot], self._durations[slot], self._scores[slot],
+             self._level1[slot], self._payloads[slot])
+            for slot, doc_id in enumerate(self._doc_ids) if doc_id is not None
+        ]
+        self._reset()
+        for doc_id, term_counts, duration, score, level1, payload in documents:
+            self._add_terms(doc_id, term_counts, duration, score, level1, payload)
+
+    def _add_terms(self, doc_id: str, term_counts: Dict[str, int], duration: float, score: float,
+                   level1: bool, payload: Any):
+        slot = len(self._doc_ids)
+        self._doc_ids.append(doc_id)
+        self._slots[doc_id] = slot
+        self._payloads.append(payload)
+        self._doc_terms.append(term_counts)
+        length = sum(term_counts.values())
+        self._lengths.append(length)
+        self._durations.append(duration)
+        self._scores.append(score)
+        self._level1.append(level1)
+        self._alive.append(True)
+        self._attribute_arrays = None
+
+        for term, count in term_counts.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = ([], [])
+            postings[0].append(slot)
+            postings[1].append(count)
+            self._document_frequency[term] = self._document_frequency.get(term, 0) + 1
+            self._posting_arrays.pop(term, None)
+
+        self._live_count += 1
+        self._live_length_sum += length
+
+    def __len__(self) -> int:
+        return self._live_count
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._slots
+
+    def get(self, doc_id: str) -> Any:
+        slot = self._slots.get(doc_id)
+        return self._payloads[slot] if slot is not None else None
+
+    def _attributes(self) -> Tuple[np.ndarray, ...]:
+        """(길이, 재생 시간, 품질 점수, Level 1, 유효, 품질 점수 내림차순 슬롯) 배열"""
+        if self._attribute_arrays is None:
+            quality_scores = np.asarray(self._scores, dtype=np.float32)
+            self._attribute_arrays = (
+                np.asarray(self._lengths, dtype=np.float32),
+                np.asarray(self._durations, dtype=np.float32),
+                quality_scores,
+                np.asarray(self._level1, dtype=bool),
+                np.asarray(self._alive, dtype=bool),
+                np.argsort(-quality_scores, kind='stable')
+            )
+        return self._attribute_arrays
+
+    def _refresh_impact_stats(self):
+        """문서 수/평균 길이가 stats_tolerance 이상 달라졌으면 캐시한 단어 점수를 모두 버림"""
+        average_length = self._live_length_sum / self._live_count
+        if self._impact_stats is not None:
+            count, length = self._impact_stats
+            if (abs(self._live_count - count) <= self.stats_tolerance * count
+                    and abs(average_length - length) <= self.stats_tolerance * length):
+                return
+        self._impact_stats = (self._live_count, average_length)
+        self._posting_arrays = {}
+
+    def _term_impacts(self, term: str) -> Optional[Tuple[Any, ...]]:
+        """단어의 문서별 BM25 점수 (슬롯, 점수, 점수 내림차순 슬롯, 흔한 단어면 슬롯 전체 길이의 점수 배열)"""
+        arrays = self._posting_arrays.get(term)
+        if arrays is None:
+            postings = self._postings.get(term)
+            df = self._document_frequency.get(term, 0)
+            if postings is None or df <= 0:
+                return None
+            live_count, average_length = self._impact_stats
+            lengths = self._attributes()[0]
+            slots = np.asarray(postings[0], dtype=np.int64)
+            frequencies = np.asarray(postings[1], dtype=np.float32)
+            idf = math.log(1 + max(live_count - df + 0.5, 0.5) / (df + 0.5))
+            norm = self.k1 * (1 - self.b + self.b * lengths[slots] / average_length)
+            impacts = (idf * frequencies * (self.k1 + 1) / (frequencies + norm)).astype(np.float32)
+
+            dense = None
+            if len(slots) >= self.dense_ratio * len(self._doc_ids):
+                dense = np.zeros(len(self._doc_ids), dtype=np.float32)
+                dense[slots] = impacts
+            arrays = (slots, impacts, slots[np.argsort(-impacts, kind='stable')], dense)
+            self._posting_arrays[term] = arrays
+        return arrays
+
+    def _filter_mask(self, slots: np.ndarray, min_duration_minutes: Optional[float],
+                     max_duration_minutes: Optional[float], min_quality_score: Optional[float],
+                     level1_only: bool) -> np.ndarray:
+        _, durations, quality_scores, level1, alive, _ = self._attributes()
+        mask = alive[slots]
+        if min_duration_minutes is not None:
+            mask &= durations[slots] >= min_duration_minutes
+        if max_duration_minutes is not None:
+            mask &= durations[slots] <= max_duration_minutes
+        if min_quality_score is not None:
+            mask &= quality_scores[slots] >= min_quality_score
+        if level1_only:
+            mask &= level1[slots]
+        return mask
+
+    def search(self, query: str = '', top_k: int = 10,
+               min_duration_minutes: Optional[float] = None, max_duration_minutes: Optional[float] = None,
+               min_quality_score: Optional[float] = None, level1_only: bool = False) -> List[Tuple[str, float]]:
+        """BM25 상위 k개 (doc_id, 점수) 목록
+
+        검색어가 없으면 필터를 통과한 문서를 품질 점수순으로 반환한다.
+        """
+        if self._live_count == 0 or top_k <= 0:
+            return []
+
+        filters = (min_duration_minutes, max_duration_minutes, min_quality_score, level1_only)
+        terms = list(dict.fromkeys(tokenize(query)))
+        depth = max(8 * top_k, 128)
+
+        if not terms:
+            quality_order = self._attributes()[5]
+            while True:
+                candidates = quality_order[:depth]
+                candidates = candidates[self._filter_mask(candidates, *filters)]
+                if len(candidates) >= top_k or depth >= len(quality_order):
+                    break
+                depth *= 4
+            return self._ranked(candidates, self._attributes()[2][candidates], top_k)
+
+        self._refresh_impact_stats()
+        term_arrays = [arrays for arrays in (self._term_impacts(term) for term in terms) if arrays is not None]
+        if not term_arrays:
+            return []
+
+        # 문서별 점수 합산 (흔한 단어는 전체 길이 배열 덧셈, 드문 단어는 포스팅 위치에만 덧셈)
+        accumulated = np.zeros(len(self._doc_ids), dtype=np.float32)
+        for slots, impacts, _, dense in term_arrays:
+            if dense is not None:
+                accumulated[:len(dense)] += dense
+            else:
+                accumulated[slots] += impacts
+
+        # 단어별 점수 상위 문서 중 필터를 통과한 k번째 점수는 최종 k번째 점수의 하한이므로
+        # 그 이상인 문서만 후보로 남겨 전체 문서에 필터/정렬을 적용하지 않음
+        heads = [sorted_slots[:depth] for _, _, sorted_slots, _ in term_arrays]
+        head_slots = heads[0] if len(heads) == 1 else np.unique(np.concatenate(heads))
+        head_slots = head_slots[self._filter_mask(head_slots, *filters)]
+        if len(head_slots) >= top_k:
+            head_scores = accumulated[head_slots]
+            lower_bound = np.partition(head_scores, len(head_scores) - top_k)[len(head_scores) - top_k]
+            candidates = np.flatnonzero(accumulated >= lower_bound)
+        else:
+            candidates = np.flatnonzero(accumulated)
+        candidates = candidates[self._filter_mask(candidates, *filters)]
+        return self._ranked(candidates, accumulated[candidates], top_k)
+
+    def _ranked(self, candidates: np.ndarray, scores: np.ndarray, top_k: int) -> List[Tuple[str, float]]:
+        """점수 내림차순 상위 k개, 같은 점수는 품질 점수 높은 순"""
+        quality_scores = self._attributes()[2]
+        if len(candidates) > top_k:
+            top = np.argpartition(-scores, top_k - 1)[:top_k]
+            candidates, scores = candidates[top], scores[top]
+        order = np.lexsort((-quality_scores[candidates], -scores))
+        return [(self._doc_ids[slot], float(score)) for slot, score in zip(candidates[order].tolist(), scores[order].tolist())]
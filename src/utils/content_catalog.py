@@ -0,0 +1,164 @@
+"""MCP 콘텐츠 서버용 카탈로그 스냅샷 (한 번 로드, 원자적 교체)"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .catalog_search import CatalogSearchIndex
+from .data_processing import DataProcessor
+from ..storage.sqlite_handler import SQLiteHandler
+
+# 한 검색어에 대해 넘겨볼 수 있는 최대 결과 수 (page * page_size 상한)
+MAX_RESULT_WINDOW = 10000
+
+
+class ContentSnapshot:
+    """로드 시점의 콘텐츠 목록과 색인 (생성 후 변경하지 않음)
+
+    - content_id -> 항목 사전과 CatalogSearchIndex를 함께 보관
+    - 같은 버전 안에서는 응답이 바뀌지 않으므로 ETag를 검색 없이 계산하고,
+      직렬화한 페이지 응답은 LRU로 재사용
+    """
+
+    def __init__(self, items: List[Dict[str, Any]], source: str, version: str, page_cache_size: int = 1024):
+        self.source = source
+        self.version = version
+        self.loaded_at = datetime.now().isoformat()
+        self.items_by_id: Dict[str, Dict[str, Any]] = {item['content_id']: item for item in items}
+        self.index = CatalogSearchIndex.from_mcp_items(items)
+        self.page_cache_size = page_cache_size
+        self._page_cache: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 필터용 배열을 미리 만들어 교체 직후 첫 요청이 느려지지 않게 함
+        self.index.search('', top_k=1)
+
+    def __len__(self) -> int:
+        return len(self.items_by_id)
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.version}"'
+
+    @staticmethod
+    def page_key(query: str = '', page: int = 1, page_size: int = 20,
+                 min_duration_minutes: Optional[float] = None, max_duration_minutes: Optional[float] = None,
+                 min_quality_score: Optional[float] = None, level1_only: bool = False) -> str:
+        """페이지 요청을 정규화한 캐시 키"""
+        return json.dumps([' '.join(query.lower().split()), page, page_size, min_duration_minutes,
+                           max_duration_minutes, min_quality_score, bool(level1_only)])
+
+    def page_etag(self, key: str) -> str:
+        return f'"{self.version}-{zlib.crc32(key.encode("utf-8")):08x}"'
+
+    def item_etag(self, content_id: str) -> str:
+        return f'"{self.version}-{zlib.crc32(content_id.encode("utf-8")):08x}"'
+
+    def cached_page(self, key: str) -> Optional[bytes]:
+        """이미 만든 페이지 응답 본문 (없으면 None)"""
+        with self._lock:
+            body = self._page_cache.get(key)
+            if body is not None:
+                self._page_cache.move_to_end(key)
+            return body
+
+    def render_page(self, key: str) -> bytes:
+        """page_key()로 만든 키의 JSON 응답 본문 (캐시에 없으면 검색하므로 블로킹)"""
+        body = self.cached_page(key)
+        if body is not None:
+            return body
+
+        query, page, page_size, min_duration, max_duration, min_quality, level1_only = json.loads(key)
+        offset = (page - 1) * page_size
+        results = self.index.search(
+            query, top_k=min(offset + page_size + 1, MAX_RESULT_WINDOW),
+            min_duration_minutes=min_duration, max_duration_minutes=max_duration,
+            min_quality_score=min_quality, level1_only=level1_only
+        )
+        body = json.dumps({
+            'version': self.version,
+            'page': page,
+            'page_size': page_size,
+            'has_more': len(results) > offset + page_size and offset + page_size < MAX_RESULT_WINDOW,
+            'items': [self.index.get(content_id) for content_id, _ in results[offset:offset + page_size]]
+        }, ensure_ascii=False).encode('utf-8')
+
+        with self._lock:
+            self._page_cache[key] = body
+            if len(self._page_cache) > self.page_cache_size:
+                self._page_cache.popitem(last=False)
+        return body
+
+
+class ContentCatalog:
+    """최신 MCP 내보내기(mcp_content_*.json) 또는 SQLite 카탈로그를 스냅샷으로 로드
+
+    요청 처리 쪽은 snapshot 속성을 한 번 읽어 그 스냅샷으로 끝까지 응답하고,
+    다시 로드할 때는 새 스냅샷을 모두 만든 뒤 참조만 바꾸므로 교체 중에도
+    요청이 실패하거나 두 버전이 섞이지 않는다.
+    """
+
+    def __init__(self, source: str = 'exports', exports_dir: str = 'data/exports',
+                 db_path: str = 'data/catalog.sqlite3', pattern: str = 'mcp_content_*.json'):
+        if source not in ('exports', 'sqlite'):
+            raise ValueError(f"지원하지 않는 콘텐츠 소스: {source}")
+        self.source = source
+        self.exports_dir = exports_dir
+        self.db_path = db_path
+        self.pattern = pattern
+        self.logger = logging.getLogger(__name__)
+        self._snapshot: Optional[ContentSnapshot] = None
+        self._reload_lock = threading.Lock()
+
+    @property
+    def snapshot(self) -> Optional[ContentSnapshot]:
+        return self._snapshot
+
+    def latest_export(self) -> Optional[str]:
+        """가장 최근 MCP 내보내기 파일 (파일명의 타임스탬프 기준)"""
+        candidates = sorted(glob.glob(os.path.join(self.exports_dir, self.pattern)))
+        return candidates[-1] if candidates else None
+
+    def _read_export(self) -> Optional[Tuple[List[Dict[str, Any]], str, str]]:
+        path = self.latest_export()
+        if path is None:
+            return None
+        with open(path, 'rb') as f:
+            data = f.read()
+        return json.loads(data), path, hashlib.sha1(data).hexdigest()[:16]
+
+    def _read_sqlite(self) -> Optional[Tuple[List[Dict[str, Any]], str, str]]:
+        if not os.path.exists(self.db_path):
+            return None
+        handler = SQLiteHandler(self.db_path)
+        try:
+            items = DataProcessor().prepare_for_mcp(handler.query_videos())
+        finally:
+            handler.close()
+        version = hashlib.sha1(json.dumps(items, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()[:16]
+        return items, self.db_path, version
+
+    def load_latest(self, force: bool = False) -> bool:
+        """최신 데이터로 스냅샷 교체 (내용이 같으면 그대로 두고 False)"""
+        with self._reload_lock:
+            loaded = self._read_export() if self.source == 'exports' else self._read_sqlite()
+            if loaded is None:
+                self.logger.warning(f"⚠️ 로드할 콘텐츠가 없습니다 ({self.source})")
+                return False
+
+            items, source, version = loaded
+            current = self._snapshot
+            if not force and current is not None and current.version == version:
+                return False
+
+            snapshot = ContentSnapshot(items, source, version)
+            self._snapshot = snapshot
+            self.logger.info(f"📦 콘텐츠 스냅샷 교체: {source} ({len(snapshot)}개, 버전 {version})")
+            return True
@@ -0,0 +1,79 @@
+"""다중 키워드 단일 패스 매처"""
+
+import re
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class KeywordMatcher:
+    """여러 키워드 그룹을 한 번의 텍스트 스캔으로 찾는 매처
+
+    모든 키워드를 트라이 형태의 정규식 하나로 컴파일한다. 각 위치에서
+    가장 긴 키워드 하나를 찾은 뒤, 그 키워드의 접두사인 다른 키워드도
+    같은 위치에서 일치한 것으로 처리하므로 결과는 키워드마다
+    `keyword in text`를 검사한 것과 같다 (겹치는 키워드 포함).
+    """
+
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        self.categories: Dict[str, Tuple[str, ...]] = {
+            name: tuple(keywords) for name, keywords in categories.items()
+        }
+
+        # 키워드 -> 속한 카테고리 목록
+        self._keyword_categories: Dict[str, List[str]] = {}
+        for name, keywords in self.categories.items():
+            for keyword in keywords:
+                self._keyword_categories.setdefault(keyword, []).append(name)
+
+        keywords = sorted(self._keyword_categories)
+        # 가장 긴 일치 키워드 -> 같은 위치에서 함께 일치하는 키워드 (자기 자신 + 접두사)
+        self._prefix_closure: Dict[str, Tuple[str, ...]] = {
+            keyword: tuple(other for other in keywords if keyword.startswith(other))
+            for keyword in keywords
+        }
+        self._pattern = re.compile(f"(?=({self._build_trie_pattern(keywords)}))") if keywords else None
+
+    @staticmethod
+    def _build_trie_pattern(keywords: List[str]) -> str:
+        """키워드 목록을 트라이 구조의 정규식으로 변환 (탐욕적 매칭 = 최장 일치)"""
+        trie: Dict = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = True  # 키워드 끝 표시
+
+        def _to_pattern(node: Dict) -> str:
+            is_end = '' in node
+            branches = [re.escape(char) + _to_pattern(child)
+                        for char, child in sorted(node.items()) if char != '']
+            if not branches:
+                return ''
+            body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+            if is_end:
+                return f"(?:{body})?"
+            return body
+
+        return _to_pattern(trie)
+
+    def find_all(self, text: str) -> List[Tuple[int, str]]:
+        """텍스트에서 일치하는 모든 (시작 위치, 키워드) 목록"""
+        if self._pattern is None:
+            return []
+        found = []
+        for match in self._pattern.finditer(text):
+            start = match.start()
+            for keyword in self._prefix_closure[match.group(1)]:
+                found.append((start, keyword))
+        return found
+
+    def categorize(self, found: Iterable[Tuple[int, str]]) -> Dict[str, Set[str]]:
+        """(위치, 키워드) 목록을 카테고리별 일치 키워드 집합으로 변환"""
+        result: Dict[str, Set[str]] = {name: set() for name in self.categories}
+        for _, keyword in found:
+            for name in self._keyword_categories[keyword]:
+                result[name].add(keyword)
+        return result
+
+    def match(self, text: str) -> Dict[str, Set[str]]:
+        """카테고리별로 텍스트에 포함된 키워드 집합 (한 번의 스캔)"""
+        return self.categorize(self.find_all(text))
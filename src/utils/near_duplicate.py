@@ -0,0 +1,201 @@
+"""MinHash/LSH 기반 유사 중복(재업로드) 영상 탐지"""
+
+import itertools
+import logging
+import re
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..models.video_model import VideoData
+
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+_HASH_SHIFT = np.uint64(32)
+# 연속 토큰 해시를 k-gram shingle 해시로 합칠 때 쓰는 곱셈 상수 (FNV prime)
+_SHINGLE_MULTIPLIER = np.uint64(0x01000193)
+
+_NON_WORD_PATTERN = re.compile(r'[^\w]+')
+
+
+def normalize_text(text: str) -> str:
+    """소문자 변환 후 문장 부호/이모지/해시태그 기호 등을 공백으로 정리"""
+    return _NON_WORD_PATTERN.sub(' ', text.lower()).strip()
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            # 입력 순서가 빠른 쪽을 대표로
+            if root_a < root_b:
+                self.parent[root_b] = root_a
+            else:
+                self.parent[root_a] = root_b
+
+
+class NearDuplicateDetector:
+    """제목/설명 shingle의 MinHash 서명을 LSH 밴드로 묶어 유사 중복 군집 탐지
+
+    - shingle: 정규화한 제목 + 설명 앞부분의 연속 단어 k-gram (토큰 해시를 합성)
+    - MinHash: num_perm개의 해시 함수, 청크 단위 numpy 연산
+    - LSH: 서명을 bands개 밴드로 나눠 같은 밴드 값을 가진 영상만 후보로 비교
+    - 확인: 추정 Jaccard 유사도 >= threshold 이고 재생 시간이 비슷해야 같은 군집
+
+    버킷 안에서는 대표 영상과만 비교하므로 전체 시간은 영상 수에 거의 선형이다.
+    """
+
+    def __init__(self, threshold: float = 0.6, num_perm: int = 64, bands: int = 16,
+                 shingle_size: int = 2, description_chars: int = 300,
+                 duration_tolerance_seconds: int = 5, duration_tolerance_ratio: float = 0.05,
+                 chunk_size: int = 2000, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.shingle_size = shingle_size
+        self.description_chars = description_chars
+        self.duration_tolerance_seconds = duration_tolerance_seconds
+        self.duration_tolerance_ratio = duration_tolerance_ratio
+        self.chunk_size = chunk_size
+        self.logger = logging.getLogger(__name__)
+        # 토큰 -> crc32 (어휘 크기만큼만 커짐)
+        self._token_hashes_cache: Dict[str, int] = {}
+
+        # multiply-shift 해시 함수 계수 (a는 홀수)
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(0, 2 ** 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rng.randint(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+
+    def _token_hashes(self, video: VideoData) -> List[int]:
+        """정규화한 제목 + 설명 앞부분의 토큰별 해시 (최소 shingle_size개가 되도록 0으로 채움)"""
+        text = f"{video.title} {(video.description or '')[:self.description_chars]}"
+        cache = self._token_hashes_cache
+        hashes = []
+        for token in normalize_text(text).split():
+            token_hash = cache.get(token)
+            if token_hash is None:
+                token_hash = cache[token] = zlib.crc32(token.encode('utf-8'))
+            hashes.append(token_hash)
+        if len(hashes) < self.shingle_size:
+            hashes.extend([0] * (self.shingle_size - len(hashes)))
+        return hashes
+
+    def _shingles(self, videos: List[VideoData]) -> Tuple[np.ndarray, np.ndarray]:
+        """영상들의 k-gram shingle 해시 (영상 순서대로 이어붙임)와 영상별 shingle 수"""
+        token_lists = [self._token_hashes(video) for video in videos]
+        lengths = np.fromiter((len(tokens) for tokens in token_lists), dtype=np.int64, count=len(token_lists))
+        tokens = np.fromiter(itertools.chain.from_iterable(token_lists), dtype=np.uint64, count=int(lengths.sum()))
+
+        # 연속한 k개 토큰 해시를 합성 (영상 경계를 넘는 시작 위치는 제외)
+        size = self.shingle_size
+        starts = len(tokens) - size + 1
+        shingles = tokens[:starts].copy()
+        for step in range(1, size):
+            shingles = (shingles * _SHINGLE_MULTIPLIER + tokens[step:step + starts]) & _MAX_HASH
+        video_ends = np.repeat(np.cumsum(lengths), lengths)[:starts]
+        valid = np.arange(starts) + size <= video_ends
+        return shingles[valid], lengths - size + 1
+
+    def signatures(self, videos: List[VideoData]) -> np.ndarray:
+        """MinHash 서명 행렬 (영상 수 x num_perm)"""
+        signatures = np.empty((len(videos), self.num_perm), dtype=np.uint64)
+
+        for start in range(0, len(videos), self.chunk_size):
+            chunk = videos[start:start + self.chunk_size]
+            shingles, counts = self._shingles(chunk)
+            offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+            # 모든 shingle에 num_perm개 해시 함수 ((a * h + b) mod 2^64 의 상위 32비트)를 한 번에 적용한 뒤 영상별 최솟값
+            # (해시 함수 x shingle) 배치로 두어 영상 구간 최솟값을 연속 메모리에서 계산
+            permuted = np.multiply.outer(self._a, shingles)
+            permuted += self._b[:, None]
+            permuted >>= _HASH_SHIFT
+            signatures[start:start + len(chunk)] = np.minimum.reduceat(permuted, offsets, axis=1).T
+
+        return signatures
+
+    def _durations_match(self, a: Optional[int], b: Optional[int]) -> bool:
+        if not a or not b:
+            return True  # 재생 시간을 모르면 텍스트 유사도로만 판단
+        tolerance = max(self.duration_tolerance_seconds, self.duration_tolerance_ratio * max(a, b))
+        return abs(a - b) <= tolerance
+
+    def find_clusters(self, videos: List[VideoData]) -> List[List[int]]:
+        """2개 이상으로 이루어진 유사 중복 군집 (입력 인덱스 목록)"""
+        if len(videos) < 2:
+            return []
+
+        signatures = self.signatures(videos)
+        durations = [video.duration_seconds for video in videos]
+        union_find = _UnionFind(len(videos))
+        rows = self.rows_per_band
+
+        for band in range(self.bands):
+            band_values = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows])
+            keys = band_values.view(np.dtype((np.void, band_values.dtype.itemsize * rows))).ravel()
+            order = np.argsort(keys, kind='stable')
+            sorted_keys = keys[order]
+            boundaries = np.flatnonzero(sorted_keys[1:] != sorted_keys[:-1]) + 1
+            bucket_starts = np.concatenate(([0], boundaries))
+            bucket_ends = np.concatenate((boundaries, [len(order)]))
+            # 영상이 2개 이상인 버킷만 비교
+            multi = bucket_ends - bucket_starts > 1
+            ordered = order.tolist()
+
+            for bucket_start, bucket_end in zip(bucket_starts[multi].tolist(), bucket_ends[multi].tolist()):
+                # 버킷 안에서 각 영상을 기존 대표들과만 비교
+                leaders: List[int] = []
+                for index in ordered[bucket_start:bucket_end]:
+                    for leader in leaders:
+                        if (union_find.find(index) == union_find.find(leader)
+                                or self._is_near_duplicate(signatures, durations, index, leader)):
+                            union_find.union(index, leader)
+                            break
+                    else:
+                        leaders.append(index)
+
+        clusters = {}
+        for index in range(len(videos)):
+            clusters.setdefault(union_find.find(index), []).append(index)
+        return [members for members in clusters.values() if len(members) > 1]
+
+    def _is_near_duplicate(self, signatures: np.ndarray, durations: List[Optional[int]], i: int, j: int) -> bool:
+        similarity = np.count_nonzero(signatures[i] == signatures[j]) / self.num_perm
+        return similarity >= self.threshold and self._durations_match(durations[i], durations[j])
+
+    def deduplicate(self, videos: List[VideoData],
+                    existing: Optional[List[VideoData]] = None) -> Tuple[List[VideoData], List[VideoData]]:
+        """군집마다 품질 점수가 가장 높은 영상만 남김 (같은 점수면 앞선 영상)
+
+        existing(이미 저장한 데이터셋)을 주면 함께 군집을 찾는다. 기존 영상은 그대로 두고,
+        기존 영상과 같은 군집에 든 새 영상은 모두 제거한다.
+        반환: (videos 중 남은 영상 - 입력 순서 유지, videos 중 제거된 영상)
+        """
+        existing = existing or []
+        offset = len(existing)
+        removed_indexes = set()
+        for members in self.find_clusters(existing + videos):
+            new_members = [index - offset for index in members if index >= offset]
+            if len(new_members) < len(members):
+                removed_indexes.update(new_members)
+                continue
+            best = max(new_members, key=lambda index: (videos[index].quality_score or 0, -index))
+            removed_indexes.update(index for index in new_members if index != best)
+
+        kept = [video for index, video in enumerate(videos) if index not in removed_indexes]
+        removed = [videos[index] for index in sorted(removed_indexes)]
+        return kept, removed
@@ -0,0 +1,55 @@
+"""백그라운드 선행 조회(prefetch) 유틸리티"""
+
+import queue
+import threading
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar('T')
+
+_DONE = object()
+
+
+def prefetch(iterable: Iterable[T], depth: int = 1) -> Iterator[T]:
+    """다른 스레드에서 iterable을 미리 진행시키며 항목을 순서대로 반환
+
+    소비자가 현재 항목(예: 검색 결과 1페이지)을 처리하는 동안 다음 항목
+    (2페이지)을 가져온다. 대기열 크기가 `depth`로 제한되므로 메모리에는
+    최대 depth + 2개 항목만 존재한다. 생산자에서 발생한 예외는 소비자
+    쪽에서 그대로 다시 발생한다.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=max(1, depth))
+    stop_event = threading.Event()
+
+    def _put(item) -> bool:
+        while not stop_event.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce():
+        try:
+            for item in iterable:
+                if not _put((item, None)):
+                    return
+        except BaseException as e:  # 소비자 스레드로 전달
+            _put((_DONE, e))
+            return
+        _put((_DONE, None))
+
+    producer = threading.Thread(target=_produce, name='prefetch', daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        # 소비자가 중간에 멈추면 생산자도 정지
+        stop_event.set()
@@ -0,0 +1,151 @@
+"""YouTube Data API 쿼터 사용량 장부"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import pytz
+
+
+class QuotaExceededError(Exception):
+    """쿼터 예산 또는 일일 한도 초과"""
+
+    def __init__(self, message: str, scope: str = 'daily'):
+        super().__init__(message)
+        # 'phase': 현재 단계 예산 소진, 'daily': 일일 한도 소진
+        self.scope = scope
+
+
+class QuotaLedger:
+    """API 호출별 쿼터 사용량을 기록하고 단계별 예산을 강제하는 장부
+
+    YouTube 쿼터는 태평양 시간 자정에 초기화되므로 같은 쿼터 일(day)
+    안에서는 여러 번 실행해도 사용량이 파일에 누적된다.
+    """
+
+    # 엔드포인트별 호출 비용 (units)
+    UNIT_COSTS = {
+        'search': 100,
+        'videos': 1,
+        'channels': 1,
+        'playlistItems': 1,
+    }
+
+    QUOTA_TIMEZONE = pytz.timezone('America/Los_Angeles')
+
+    def __init__(self, ledger_path: str, daily_limit: int = 10000):
+        self.ledger_path = ledger_path
+        self.daily_limit = daily_limit
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+        self.current_phase: Optional[str] = None
+        self.phase_budget: Optional[int] = None
+        self.phase_spent = 0
+
+        directory = os.path.dirname(ledger_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._data = self._load()
+
+    def _quota_day(self) -> str:
+        return datetime.now(self.QUOTA_TIMEZONE).strftime('%Y-%m-%d')
+
+    def _empty_ledger(self) -> Dict[str, Any]:
+        return {
+            'quota_day': self._quota_day(),
+            'spent': 0,
+            'by_endpoint': {},
+            'by_phase': {},
+            'exhausted': False
+        }
+
+    def _load(self) -> Dict[str, Any]:
+        if not os.path.exists(self.ledger_path):
+            return self._empty_ledger()
+
+        try:
+            with open(self.ledger_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning(f"쿼터 장부 로드 실패, 새로 시작: {e}")
+            return self._empty_ledger()
+
+        if data.get('quota_day') != self._quota_day():
+            return self._empty_ledger()
+        return data
+
+    def _save(self):
+        tmp_path = f"{self.ledger_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.ledger_path)
+
+    def _roll_over_if_needed(self):
+        if self._data['quota_day'] != self._quota_day():
+            self._data = self._empty_ledger()
+
+    def start_phase(self, phase: str, budget: Optional[int] = None):
+        """수집 단계 시작 (budget이 None이면 일일 한도만 적용)"""
+        with self._lock:
+            self.current_phase = phase
+            self.phase_budget = budget
+            self.phase_spent = 0
+
+    def charge(self, endpoint: str):
+        """호출 전에 비용을 예약. 예산을 넘으면 QuotaExceededError"""
+        cost = self.UNIT_COSTS.get(endpoint, 1)
+
+        with self._lock:
+            self._roll_over_if_needed()
+
+            if self._data['exhausted'] or self._data['spent'] + cost > self.daily_limit:
+                raise QuotaExceededError(
+                    f"일일 쿼터 한도 초과 ({self._data['spent']}/{self.daily_limit} units)",
+                    scope='daily'
+                )
+
+            if self.phase_budget is not None and self.phase_spent + cost > self.phase_budget:
+                raise QuotaExceededError(
+                    f"'{self.current_phase}' 단계 쿼터 예산 초과 ({self.phase_spent}/{self.phase_budget} units)",
+                    scope='phase'
+                )
+
+            self.phase_spent += cost
+            self._data['spent'] += cost
+            by_endpoint = self._data['by_endpoint']
+            by_endpoint[endpoint] = by_endpoint.get(endpoint, 0) + cost
+            if self.current_phase:
+                by_phase = self._data['by_phase']
+                by_phase[self.current_phase] = by_phase.get(self.current_phase, 0) + cost
+            self._save()
+
+    def mark_exhausted(self):
+        """API가 quotaExceeded를 반환한 경우 남은 하루 동안 호출 중단"""
+        with self._lock:
+            self._data['exhausted'] = True
+            self._save()
+
+    def remaining(self) -> int:
+        with self._lock:
+            self._roll_over_if_needed()
+            if self._data['exhausted']:
+                return 0
+            return max(self.daily_limit - self._data['spent'], 0)
+
+    def get_summary(self) -> Dict[str, Any]:
+        """쿼터 사용량 요약"""
+        with self._lock:
+            return {
+                'quota_day': self._data['quota_day'],
+                'daily_limit': self.daily_limit,
+                'spent': self._data['spent'],
+                'remaining': 0 if self._data['exhausted'] else max(self.daily_limit - self._data['spent'], 0),
+                'by_endpoint': dict(self._data['by_endpoint']),
+                'by_phase': dict(self._data['by_phase']),
+                'exhausted': self._data['exhausted']
+            }
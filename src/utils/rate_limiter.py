@@ -0,0 +1,52 @@
+"""API 호출 속도 제한 유틸리티"""
+
+import threading
+import time
+
+
+class TokenBucketRateLimiter:
+    """스레드 안전한 토큰 버킷 속도 제한기
+
+    초당 `rate`개의 토큰이 채워지고 최대 `capacity`개까지 쌓인다.
+    여러 워커 스레드가 하나의 버킷을 공유하므로 동시성을 높여도
+    전체 호출 속도는 설정값을 넘지 않는다.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다")
+        self.rate = float(rate)
+        self.capacity = max(1, int(capacity))
+        self._tokens = float(self.capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._last_refill = now
+
+    def try_acquire(self, tokens: int = 1) -> bool:
+        """토큰을 즉시 가져올 수 있으면 소비하고 True 반환"""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: int = 1):
+        """토큰을 얻을 때까지 대기"""
+        if tokens > self.capacity:
+            raise ValueError(f"요청 토큰 수({tokens})가 버킷 용량({self.capacity})보다 큽니다")
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait_time = (tokens - self._tokens) / self.rate
+            time.sleep(wait_time)
@@ -0,0 +1,152 @@
+"""수집 리포트용 온라인 통계 누적기"""
+
+import heapq
+import itertools
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ..models.video_model import VideoData
+from ..models.channel_model import ChannelAggregate
+from ..storage.export_pipeline import canonical_row, report_item, REPORT_TOP_VIDEOS
+
+# 품질 점수 분포 구간 (하한, 이름)
+QUALITY_BUCKETS = [
+    (90, 'excellent (90-100)'),
+    (70, 'good (70-89)'),
+    (50, 'fair (50-69)'),
+    (0, 'poor (0-49)')
+]
+
+
+def quality_bucket(score: int) -> str:
+    """품질 점수 분포 구간 이름"""
+    for lower_bound, name in QUALITY_BUCKETS:
+        if score >= lower_bound:
+            return name
+    return QUALITY_BUCKETS[-1][1]
+
+
+class ReportAccumulator:
+    """채택된 영상을 하나씩 받아 리포트 통계를 누적
+
+    평균 점수, 분포 구간, Level 1 수, 학습 목표 빈도, 채널별 집계와
+    상위 k개 영상(힙)을 유지하므로 수집이 끝나면 snapshot()으로 바로
+    리포트 통계를 얻을 수 있다. 다른 스레드에서 수집 도중 snapshot()을
+    호출해 진행 상황을 볼 수도 있다.
+
+    나중에 제거되는 영상(중복 등)은 discard()로 되돌린다. 상위 목록 힙은
+    k + slack개를 보관하므로 slack개까지의 제거는 정확하게 반영되고, 그보다
+    많이 제거되어 목록이 모자라면 top_complete가 False가 된다 (rebuild_top 사용).
+    같은 영상 객체가 두 번 반영된 경우 discard()는 그중 하나만 제거한다.
+    """
+
+    def __init__(self, top_k: int = REPORT_TOP_VIDEOS, slack: Optional[int] = None):
+        self.top_k = top_k
+        self.slack = top_k if slack is None else slack
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+
+        self.total_videos = 0
+        self.quality_score_sum = 0
+        self.level1_videos = 0
+        self.quality_distribution: Dict[str, int] = {name: 0 for _, name in QUALITY_BUCKETS}
+        self.learning_objectives: Dict[str, int] = {}
+        self.channels: Dict[str, ChannelAggregate] = {}
+
+        # (점수, -순번, video_id, 영상 또는 표준 행) 최소 힙: 점수가 같으면 먼저 들어온 영상이 우선
+        self._top_heap: List[Tuple[int, int, str, Any]] = []
+
+    def add(self, video: VideoData):
+        """채택된 영상 1개 반영"""
+        self._add(video.video_id, video.quality_score, video.is_level1_content,
+                  video.learning_objectives, video.channel_id, video.channel_title, video)
+
+    def add_row(self, row: Dict[str, Any]):
+        """표준 행(canonical_row) 1개 반영"""
+        self._add(row['video_id'], row['quality_score'], row['is_level1_content'],
+                  row['learning_objectives'], row['channel_id'], row['channel_title'], row)
+
+    def discard(self, video: VideoData):
+        """add()로 반영한 영상 객체를 통계에서 제거 (중복 제거 등)"""
+        with self._lock:
+            self._update_counts(video.quality_score, video.is_level1_content, video.learning_objectives, -1)
+            channel = self.channels.get(video.channel_id)
+            if channel is not None:
+                channel.remove(video.video_id, video.quality_score)
+                if channel.video_count <= 0:
+                    del self.channels[video.channel_id]
+            for i, entry in enumerate(self._top_heap):
+                if entry[3] is video:
+                    self._top_heap[i] = self._top_heap[-1]
+                    self._top_heap.pop()
+                    heapq.heapify(self._top_heap)
+                    break
+
+    def _add(self, video_id: str, score: int, is_level1: Optional[bool], objectives: Optional[List[str]],
+             channel_id: str, channel_title: str, payload: Union[VideoData, Dict[str, Any]]):
+        with self._lock:
+            self._update_counts(score, is_level1, objectives, 1)
+            channel = self.channels.get(channel_id)
+            if channel is None:
+                channel = self.channels[channel_id] = ChannelAggregate(channel_id, channel_title)
+            channel.add(video_id, score)
+
+            self._push_top(score, video_id, payload)
+
+    def _push_top(self, score: int, video_id: str, payload: Union[VideoData, Dict[str, Any]]):
+        entry = (score, -next(self._sequence), video_id, payload)
+        if len(self._top_heap) < self.top_k + self.slack:
+            heapq.heappush(self._top_heap, entry)
+        elif entry[:2] > self._top_heap[0][:2]:
+            heapq.heapreplace(self._top_heap, entry)
+
+    def _update_counts(self, score: int, is_level1: Optional[bool], objectives: Optional[List[str]], sign: int):
+        self.total_videos += sign
+        self.quality_score_sum += sign * score
+        if is_level1:
+            self.level1_videos += sign
+        self.quality_distribution[quality_bucket(score)] += sign
+
+        for objective in objectives or []:
+            count = self.learning_objectives.get(objective, 0) + sign
+            if count:
+                self.learning_objectives[objective] = count
+            else:
+                self.learning_objectives.pop(objective, None)
+
+    def _top_entries(self) -> List[Tuple[int, int, str, Any]]:
+        """상위 k개 항목 (점수 내림차순, 같은 점수는 먼저 들어온 순)"""
+        return heapq.nlargest(self.top_k, self._top_heap, key=lambda e: (e[0], e[1]))
+
+    @property
+    def top_complete(self) -> bool:
+        """상위 목록이 정확한지 (제거가 slack을 넘어 힙이 모자라지 않은지)"""
+        with self._lock:
+            return len(self._top_heap) >= min(self.top_k, self.total_videos)
+
+    def rebuild_top(self, videos: List[VideoData]):
+        """최종 영상 목록으로 상위 목록 힙을 다시 구성"""
+        with self._lock:
+            self._top_heap = []
+            for video in videos:
+                self._push_top(video.quality_score, video.video_id, video)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재까지의 리포트 통계 (DataProcessor.generate_collection_report의 video_summary 형식)"""
+        with self._lock:
+            top_entries = self._top_entries()
+            return {
+                'total_videos': self.total_videos,
+                'quality_score_sum': self.quality_score_sum,
+                'avg_quality_score': self.quality_score_sum / self.total_videos if self.total_videos else 0,
+                'level1_videos': self.level1_videos,
+                'quality_distribution': dict(self.quality_distribution),
+                'learning_objectives': dict(self.learning_objectives),
+                'channel_count': len(self.channels),
+                'top_videos': [
+                    report_item(payload if isinstance(payload, dict) else canonical_row(payload))
+                    for _, _, _, payload in top_entries
+                ]
+            }
@@ -0,0 +1,116 @@
+# conftest.py
+import os
+import sys
+import threading
+from typing import Any, Dict, List, Tuple
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+# 프로젝트 루트 모듈(schedule_optimizer, notification_fanout 등)을 테스트에서 import
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class StandInYouTube:
+    """googleapiclient YouTube 클라이언트 대역 (search/videos/channels/playlistItems의 list().execute())
+
+    요청은 calls에 (endpoint, params)로 기록한다. 페이지 토큰은 다음 항목의 위치.
+    모든 응답에 etag를 붙이고, If-None-Match가 현재 etag와 같으면 304 HttpError를 낸다.
+    """
+
+    def __init__(self):
+        self.video_resources: Dict[str, Dict[str, Any]] = {}
+        self.search_results: Dict[str, List[str]] = {}
+        self.uploads: Dict[str, List[str]] = {}  # 채널 ID -> 최신순 영상 ID
+        self.calls: List[Tuple[str, Dict[str, Any]]] = []
+        self.etag = '"v1"'
+        self._lock = threading.Lock()
+
+    def add_video(self, video_id: str, title: str, description: str = '', channel_id: str = 'UC1',
+                  published_at: str = '2024-01-01T00:00:00Z', duration: str = 'PT5M', views: int = 1000,
+                  likes: int = 50, keywords: Tuple[str, ...] = ()):
+        self.video_resources[video_id] = {
+            'id': video_id,
+            'snippet': {'title': title, 'description': description, 'channelId': channel_id,
+                        'channelTitle': f"Channel {channel_id}", 'publishedAt': published_at,
+                        'thumbnails': {'medium': {'url': f"https://i.ytimg.com/vi/{video_id}/mqdefault.jpg"}}},
+            'statistics': {'viewCount': str(views), 'likeCount': str(likes), 'commentCount': '0'},
+            'contentDetails': {'duration': duration}
+        }
+        for keyword in keywords:
+            self.search_results.setdefault(keyword, []).append(video_id)
+        self.uploads.setdefault(channel_id, []).insert(0, video_id)
+
+    def count(self, endpoint: str) -> int:
+        return sum(1 for name, _ in self.calls if name == endpoint)
+
+    def __getattr__(self, endpoint: str):
+        if endpoint not in ('search', 'videos', 'channels', 'playlistItems'):
+            raise AttributeError(endpoint)
+        return lambda: _Resource(self, endpoint)
+
+    def respond(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            self.calls.append((endpoint, dict(params)))
+        if endpoint == 'videos':
+            return {'items': [self.video_resources[video_id] for video_id in params['id'].split(',')
+                              if video_id in self.video_resources]}
+        if endpoint == 'channels':
+            if params['id'] not in self.uploads:
+                return {'items': []}
+            return {'items': [{'contentDetails': {'relatedPlaylists': {'uploads': 'UU' + params['id']}}}]}
+        if endpoint == 'search':
+            video_ids = self.search_results.get(params['q'], [])
+            if 'publishedAfter' in params:
+                video_ids = [video_id for video_id in video_ids
+                             if self.video_resources[video_id]['snippet']['publishedAt'] > params['publishedAfter']]
+            return self._page(params, [{'id': {'videoId': video_id}} for video_id in video_ids])
+        video_ids = self.uploads.get(params['playlistId'][2:], [])
+        return self._page(params, [{'snippet': {
+            'title': self.video_resources[video_id]['snippet']['title'],
+            'description': self.video_resources[video_id]['snippet']['description'],
+            'publishedAt': self.video_resources[video_id]['snippet']['publishedAt'],
+            'resourceId': {'videoId': video_id}
+        }} for video_id in video_ids])
+
+    @staticmethod
+    def _page(params: Dict[str, Any], items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        start = int(params.get('pageToken') or 0)
+        end = start + params.get('maxResults', 5)
+        response = {'items': items[start:end]}
+        if end < len(items):
+            response['nextPageToken'] = str(end)
+        return response
+
+
+class _Resource:
+    def __init__(self, api: StandInYouTube, endpoint: str):
+        self.api = api
+        self.endpoint = endpoint
+
+    def list(self, **params):
+        return _Request(self.api, self.endpoint, params)
+
+
+class _Request:
+    def __init__(self, api: StandInYouTube, endpoint: str, params: Dict[str, Any]):
+        self.api = api
+        self.endpoint = endpoint
+        self.params = params
+        self.headers: Dict[str, str] = {}
+
+    def execute(self) -> Dict[str, Any]:
+        if self.headers.get('If-None-Match') == self.api.etag:
+            with self.api._lock:
+                self.api.calls.append((self.endpoint, dict(self.params)))
+            raise HttpError(httplib2.Response({'status': 304}), b'')
+        return dict(self.api.respond(self.endpoint, self.params), etag=self.api.etag)
+
+
+@pytest.fixture
+def youtube_api(monkeypatch) -> StandInYouTube:
+    """YouTubeCollector가 만드는 API 클라이언트를 대역으로 교체"""
+    api = StandInYouTube()
+    monkeypatch.setattr('src.collectors.youtube_collector.build', lambda *args, **kwargs: api)
+    return api
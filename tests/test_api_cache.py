@@ -0,0 +1,36 @@
+# test_api_cache.py
+"""APICache: 신선한 항목 재사용, ID 순서 정규화, 만료 항목의 ETag 재검증 (대역 API 클라이언트 사용)"""
+from src.collectors.youtube_collector import YouTubeCollector
+from src.storage.api_cache import APICache
+
+
+def test_fresh_entry_is_served_without_a_request(tmp_path, youtube_api):
+    youtube_api.add_video('a', 'Biff and Chip', keywords=('ort',))
+    cache = APICache(str(tmp_path / 'api_cache.sqlite3'))
+    first = YouTubeCollector('test-key', cache=cache).search_video_ids('ort')
+    second = YouTubeCollector('test-key', cache=cache).search_video_ids('ort')
+
+    assert first == second == ['a']
+    assert youtube_api.count('search') == 1
+    assert cache.get_stats()['hits'] == 1
+    cache.close()
+
+
+def test_id_order_does_not_change_the_key(tmp_path):
+    cache = APICache(str(tmp_path / 'api_cache.sqlite3'))
+    cache.store('videos', {'id': 'b,a,c', 'part': 'snippet'}, {'items': ['x']})
+    response, _, is_fresh = cache.lookup('videos', {'part': 'snippet', 'id': 'c,b,a'})
+    assert response == {'items': ['x']} and is_fresh
+    cache.close()
+
+
+def test_stale_entry_is_revalidated_with_etag(tmp_path, youtube_api):
+    youtube_api.add_video('a', 'Biff and Chip', keywords=('ort',))
+    cache = APICache(str(tmp_path / 'api_cache.sqlite3'), ttls={'search': 0})
+    YouTubeCollector('test-key', cache=cache).search_video_ids('ort')
+    video_ids = YouTubeCollector('test-key', cache=cache).search_video_ids('ort')
+
+    assert video_ids == ['a']
+    assert youtube_api.count('search') == 2
+    assert cache.get_stats()['revalidated'] == 1
+    cache.close()
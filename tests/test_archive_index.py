@@ -0,0 +1,59 @@
+# test_archive_index.py
+"""ArchiveReader / build_index: 임의 접근 결과와 순차 로드의 일치, 기록기 인덱스와 재생성 인덱스의 일치"""
+import os
+from datetime import datetime
+
+from src.models.video_model import VideoData
+from src.storage.archive_index import ArchiveReader, build_index, index_path_for
+from src.storage.json_handler import JSONHandler, JSONLWriter
+
+
+def make_video(video_id: str, title: str) -> VideoData:
+    return VideoData(
+        video_id=video_id, title=title, description='Oxford Reading Tree', channel_id='UC1',
+        channel_title='Channel', published_at=datetime(2024, 1, 1), duration='PT4M13S', view_count=10,
+        like_count=1, comment_count=0, url='', thumbnail_url='', quality_score=70
+    )
+
+
+def write_archive(path: str, count: int):
+    videos = [make_video(f"vid{index}", title=f"스토리 {index}") for index in range(count)]
+    with JSONLWriter(path) as writer:
+        for video in videos:
+            writer.write(video)
+    return videos
+
+
+def test_reader_matches_sequential_load(tmp_path):
+    handler = JSONHandler(str(tmp_path))
+    path = str(tmp_path / 'videos.jsonl')
+    videos = write_archive(path, 200)
+
+    with ArchiveReader(path) as reader:
+        assert len(reader) == 200
+        assert [reader.get(video.video_id) for video in reversed(videos)] == \
+            list(reversed(list(handler.iter_videos_jsonl(path))))
+        assert reader.get_raw('vid7')['title'] == '스토리 7'
+        assert reader.get('missing') is None
+
+
+def test_rebuilt_index_equals_writer_index(tmp_path):
+    path = str(tmp_path / 'videos.jsonl')
+    write_archive(path, 50)
+    with open(index_path_for(path), encoding='utf-8') as f:
+        written = f.read()
+
+    rebuilt_path = str(tmp_path / 'rebuilt.idx')
+    assert build_index(path, rebuilt_path) == 50
+    with open(rebuilt_path, encoding='utf-8') as f:
+        assert f.read() == written
+
+
+def test_missing_index_is_rebuilt_on_open(tmp_path):
+    path = str(tmp_path / 'videos.jsonl')
+    write_archive(path, 5)
+    os.remove(index_path_for(path))
+
+    with ArchiveReader(path) as reader:
+        assert reader.get('vid3').title == '스토리 3'
+    assert os.path.exists(index_path_for(path))
@@ -0,0 +1,110 @@
+# test_catalog_search.py
+"""CatalogSearchIndex: MCP 내보내기 항목으로 만든 색인이 제목/설명/학습 목표를 모두 검색, 증분 갱신 후에도 전수 BM25와 같은 순위"""
+import random
+from datetime import datetime
+from math import log
+
+from src.models.video_model import VideoData
+from src.utils.catalog_search import FIELD_WEIGHTS, CatalogSearchIndex, tokenize
+from src.utils.content_catalog import ContentSnapshot
+from src.utils.data_processing import DataProcessor
+
+
+def make_video(video_id: str, title: str, description: str, objectives=None) -> VideoData:
+    return VideoData(
+        video_id=video_id, title=title, description=description, channel_id='UC1', channel_title='Channel',
+        published_at=datetime(2024, 1, 1), duration='PT5M', view_count=10, like_count=1, comment_count=0,
+        url='', thumbnail_url='', quality_score=50, is_level1_content=True, learning_objectives=objectives
+    )
+
+
+VIDEOS = [
+    make_video('vid1', 'Floppy and the Ball', 'Biff, Chip and Kipper play in the garden with a trampoline'),
+    make_video('vid2', 'Phonics Song', 'Letter sounds for beginners', ['phonics_practice']),
+    make_video('vid3', 'Story Time', 'A calm bedtime reading'),
+]
+
+
+def test_mcp_items_carry_description():
+    items = DataProcessor().prepare_for_mcp(VIDEOS)
+    assert [item['description'] for item in items] == [video.description for video in VIDEOS]
+
+
+def test_finds_video_by_word_only_in_description():
+    index = CatalogSearchIndex.from_mcp_items(DataProcessor().prepare_for_mcp(VIDEOS))
+    assert [doc_id for doc_id, _ in index.search('trampoline')] == ['vid1']
+    assert [doc_id for doc_id, _ in index.search('bedtime')] == ['vid3']
+    assert [doc_id for doc_id, _ in index.search('practice')] == ['vid2']
+
+
+def test_snapshot_index_matches_video_index():
+    snapshot = ContentSnapshot(DataProcessor().prepare_for_mcp(VIDEOS), source='test', version='1')
+    video_index = CatalogSearchIndex.from_videos(VIDEOS)
+    for query in ['trampoline', 'garden kipper', 'floppy', 'letter sounds', 'reading']:
+        assert snapshot.index.search(query) == video_index.search(query)
+
+
+def reference_search(documents, query, top_k, k1=1.2, b=0.75, max_duration=None, min_quality=None, level1_only=False):
+    """문서 전체를 매번 채점하는 BM25 (float64)"""
+    term_counts = {}
+    for doc_id, (title, description, objectives, _, _, _) in documents.items():
+        counts = {}
+        for field, text in (('title', title), ('description', description), ('learning_objectives', ' '.join(objectives))):
+            for token in tokenize(text):
+                counts[token] = counts.get(token, 0) + FIELD_WEIGHTS[field]
+        term_counts[doc_id] = counts
+    average_length = sum(sum(counts.values()) for counts in term_counts.values()) / len(term_counts)
+
+    scores = {}
+    for term in dict.fromkeys(tokenize(query)):
+        df = sum(1 for counts in term_counts.values() if term in counts)
+        if not df:
+            continue
+        idf = log(1 + max(len(documents) - df + 0.5, 0.5) / (df + 0.5))
+        for doc_id, counts in term_counts.items():
+            if term in counts:
+                frequency = counts[term]
+                norm = k1 * (1 - b + b * sum(counts.values()) / average_length)
+                scores[doc_id] = scores.get(doc_id, 0) + idf * frequency * (k1 + 1) / (frequency + norm)
+
+    def passes(doc_id):
+        _, _, _, duration, quality, level1 = documents[doc_id]
+        return ((max_duration is None or duration <= max_duration) and (min_quality is None or quality >= min_quality)
+                and (not level1_only or level1))
+
+    return sorted(((doc_id, score) for doc_id, score in scores.items() if passes(doc_id)),
+                  key=lambda item: -item[1])[:top_k], scores
+
+
+def test_bm25_matches_brute_force_after_adds_and_removes():
+    rng = random.Random(13)
+    words = ['biff', 'chip', 'kipper', 'floppy', 'phonics', 'trampoline', 'garden', 'story', 'letter', 'sounds',
+             'magic', 'key', 'castle', 'dragon', 'pancake', 'bed', 'six', 'dog', 'park', 'rain'] + \
+        [f"word{index}" for index in range(200)]
+    index = CatalogSearchIndex(stats_tolerance=0)
+    documents = {}
+    for step in range(3000):
+        if documents and rng.random() < 0.2:
+            doc_id = rng.choice(sorted(documents))
+            assert index.remove(doc_id)
+            del documents[doc_id]
+            continue
+        doc_id = f"vid{rng.randint(0, 2500)}"
+        document = (' '.join(rng.choices(words, k=rng.randint(1, 6))), ' '.join(rng.choices(words, k=rng.randint(0, 30))),
+                    rng.sample(['phonics_practice', 'first_words', 'story_comprehension'], rng.randint(0, 2)),
+                    rng.uniform(1, 15), rng.randint(0, 100), rng.random() < 0.5)
+        index.add(doc_id, *document[:3], duration_minutes=document[3], quality_score=document[4], is_level1=document[5])
+        documents[doc_id] = document
+
+    assert len(index) == len(documents)
+    for query, filters in [('floppy', {}), ('biff chip kipper', {}), ('word7 garden', {'max_duration': 8}),
+                           ('phonics practice', {'min_quality': 60}), ('story dragon', {'level1_only': True}),
+                           ('magic key castle', {'max_duration': 5, 'level1_only': True})]:
+        expected, all_scores = reference_search(documents, query, 10, **filters)
+        actual = index.search(query, top_k=10, max_duration_minutes=filters.get('max_duration'),
+                              min_quality_score=filters.get('min_quality'), level1_only=filters.get('level1_only', False))
+        assert len(actual) == len(expected)
+        for (doc_id, score), (_, expected_score) in zip(actual, expected):
+            # float32 합산이라 동점 근처의 순서만 다를 수 있음
+            assert abs(score - expected_score) < 1e-3 * max(1, expected_score)
+            assert abs(all_scores[doc_id] - score) < 1e-3 * max(1, score)
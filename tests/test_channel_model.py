@@ -0,0 +1,59 @@
+# test_channel_model.py
+"""ChannelAggregate: 영상 목록을 보관하던 채널 통계와 같은 값, 같은 고품질 채널 선정"""
+import random
+from types import SimpleNamespace
+
+from src.collectors.main_collector import MainCollector
+from src.models.channel_model import ChannelAggregate
+
+
+def random_scores(count: int, seed: int = 9):
+    rng = random.Random(seed)
+    return [(f"vid{index}", f"UC{rng.randint(0, 40)}", rng.choice([rng.randint(0, 100), 70, 85]))
+            for index in range(count)]
+
+
+def test_aggregate_matches_full_video_lists():
+    aggregates = {}
+    lists = {}
+    for video_id, channel_id, score in random_scores(2000):
+        aggregates.setdefault(channel_id, ChannelAggregate(channel_id, channel_id)).add(video_id, score)
+        lists.setdefault(channel_id, []).append((score, video_id))
+
+    for channel_id, entries in lists.items():
+        aggregate = aggregates[channel_id]
+        scores = [score for score, _ in entries]
+        assert aggregate.video_count == len(entries)
+        assert aggregate.avg_quality_score == sum(scores) / len(scores)
+        assert (aggregate.min_score, aggregate.max_score) == (min(scores), max(scores))
+        assert aggregate.sample_video_ids == [video_id for _, video_id in sorted(entries, reverse=True)[:5]]
+    assert not hasattr(next(iter(aggregates.values())), '__dict__')
+
+
+def test_remove_updates_counts_and_sample():
+    aggregate = ChannelAggregate('UC1', 'Oxford Owl')
+    for video_id, score in [('a', 90), ('b', 80), ('c', 70)]:
+        aggregate.add(video_id, score)
+    aggregate.remove('a', 90)
+    assert (aggregate.video_count, aggregate.avg_quality_score) == (2, 75)
+    assert aggregate.sample_video_ids == ['b', 'c']
+
+
+def original_high_quality_channels(lists):
+    """영상 목록 딕셔너리 기반의 기존 선정 기준 (영상 2개 이상, 평균 70점 이상, 상위 5개)"""
+    candidates = {channel_id: sum(scores) / len(scores) for channel_id, scores in lists.items()
+                  if len(scores) >= 2 and sum(scores) / len(scores) >= 70}
+    return [channel_id for channel_id, _ in sorted(candidates.items(), key=lambda item: item[1], reverse=True)[:5]]
+
+
+def test_high_quality_channel_selection_is_unchanged():
+    collector = MainCollector('test-key')
+    for seed in range(20):
+        aggregates = {}
+        lists = {}
+        for video_id, channel_id, score in random_scores(60, seed):
+            video = SimpleNamespace(video_id=video_id, channel_id=channel_id, channel_title=channel_id,
+                                    quality_score=score)
+            collector._update_channel_stats(aggregates, video)
+            lists.setdefault(channel_id, []).append(score)
+        assert list(collector._identify_high_quality_channels(aggregates)) == original_high_quality_channels(lists)
@@ -0,0 +1,63 @@
+# test_collection_state.py
+"""CollectionState / 증분 수집: seen ID와 워터마크 유지, 두 번째 실행은 새 영상만 조회"""
+from datetime import datetime, timezone
+
+from config.keywords import SEARCH_KEYWORDS
+from src.collectors.main_collector import MainCollector
+from src.storage.collection_state import CollectionState
+
+
+def test_seen_ids_and_watermarks_survive_reopen(tmp_path):
+    path = str(tmp_path / 'state.sqlite3')
+    state = CollectionState(path)
+    state.add_seen_ids(['a', 'b'])
+    state.add_seen_ids(['b', 'c'])
+    watermark = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    state.set_watermark('keyword', 'ort', watermark)
+    state.close()
+
+    state = CollectionState(path)
+    assert state.load_seen_ids() == {'a', 'b', 'c'}
+    assert state.get_watermark('keyword', 'ort') == watermark
+    assert state.get_watermark('channel', 'ort') is None
+    state.close()
+
+
+def collect(state: CollectionState):
+    collector = MainCollector('test-key', min_quality_score=0, requests_per_second=1000, burst=100,
+                              collection_state=state, near_duplicate_threshold=None)
+    return collector.collect_oxford_reading_tree_level1()
+
+
+def test_second_run_searches_after_watermark_and_skips_seen_videos(tmp_path, youtube_api):
+    keyword = SEARCH_KEYWORDS[0]
+    youtube_api.add_video('old', 'Biff and Chip Oxford Reading Tree', published_at='2020-01-01T00:00:00Z',
+                          keywords=(keyword,))
+    state = CollectionState(str(tmp_path / 'state.sqlite3'))
+    assert [video.video_id for video in collect(state)['videos']] == ['old']
+    first_watermark = state.get_watermark('keyword', keyword)
+    assert first_watermark is not None
+
+    youtube_api.add_video('new', 'Floppy Oxford Reading Tree', published_at='2099-01-01T00:00:00Z',
+                          keywords=(keyword,))
+    youtube_api.calls.clear()
+    assert [video.video_id for video in collect(state)['videos']] == ['new']
+
+    searches = [params for endpoint, params in youtube_api.calls if endpoint == 'search']
+    assert all(params['publishedAfter'] == first_watermark.strftime('%Y-%m-%dT%H:%M:%SZ') for params in searches)
+    assert [params['id'] for endpoint, params in youtube_api.calls if endpoint == 'videos'] == ['new']
+    assert state.get_watermark('keyword', keyword) > first_watermark
+    state.close()
+
+
+def test_truncated_search_keeps_previous_watermark(tmp_path, youtube_api):
+    keyword = SEARCH_KEYWORDS[0]
+    for index in range(30):
+        youtube_api.add_video(f"vid{index}", f"Biff and Chip Oxford Reading Tree {index}", keywords=(keyword,))
+    state = CollectionState(str(tmp_path / 'state.sqlite3'))
+    collect(state)
+
+    # 상한(25개)에 걸린 키워드는 다음 실행에서 같은 구간을 다시 검색
+    assert state.get_watermark('keyword', keyword) is None
+    assert state.get_watermark('keyword', SEARCH_KEYWORDS[1]) is not None
+    state.close()
@@ -0,0 +1,195 @@
+# test_content_analyzer.py
+"""ContentAnalyzer: 단일 패스 매처와 기존 키워드별 `in` 검사의 결과 일치 (무작위 영상 3,000개)"""
+import random
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import pytest
+
+from config.keywords import MAX_VIDEO_DURATION, MIN_VIDEO_DURATION, NEGATIVE_KEYWORDS, TRUSTED_CHANNEL_INDICATORS
+from src.collectors.content_analyzer import (
+    CHANNEL_KEYWORD_GROUPS, OBJECTIVE_KEYWORDS, TEXT_KEYWORD_GROUPS, ContentAnalyzer
+)
+from src.models.video_model import VideoData
+from src.utils.keyword_matcher import KeywordMatcher
+
+ALL_KEYWORDS = sorted({keyword for groups in (TEXT_KEYWORD_GROUPS, OBJECTIVE_KEYWORDS, CHANNEL_KEYWORD_GROUPS)
+                       for keywords in groups.values() for keyword in keywords})
+FILLER = ['the', 'big', 'trampoline', 'read', 'aloud', 'with', 'mum', 'dad', 'a', 'on', 'up', 'go', 'see', 'i',
+          'level', '1', '2', 'stage', 'words', 'letter', 'ready', 'oxf', 'kip', 'ch', 'ip']
+
+
+def random_text(rng: random.Random, max_parts: int = 12) -> str:
+    """키워드 조각과 일반 단어를 섞은 텍스트 (붙여 쓰기, 대소문자 혼용으로 겹치는 일치를 만듦)"""
+    parts = [rng.choice(ALL_KEYWORDS) if rng.random() < 0.4 else rng.choice(FILLER)
+             for _ in range(rng.randint(0, max_parts))]
+    text = ''.join(part + rng.choice([' ', ' ', ' ', '', '-', '. ']) for part in parts)
+    return ''.join(char.upper() if rng.random() < 0.2 else char for char in text)
+
+
+def random_videos(count: int, seed: int = 7) -> List[VideoData]:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    return [
+        VideoData(
+            video_id=f"vid{index}", title=random_text(rng), description=random_text(rng, 40),
+            channel_id=f"UC{index % 50}", channel_title=random_text(rng, 4),
+            published_at=now - timedelta(days=rng.randint(0, 2000), hours=rng.randint(0, 23)),
+            duration=f"PT{rng.randint(0, 30)}M{rng.randint(0, 59)}S",
+            view_count=rng.choice([0, 400, 500, 999, 1000, rng.randint(0, 1000000), 500000, 500001]),
+            like_count=rng.randint(0, 30000), comment_count=0, url='', thumbnail_url=''
+        )
+        for index in range(count)
+    ]
+
+
+VIDEOS = random_videos(3000)
+
+
+class OriginalAnalyzer:
+    """키워드마다 `in`으로 검사하던 기존 구현 (calculate_quality_score는 수정된 채널/길이 호출 기준)"""
+
+    def calculate_quality_score(self, video: VideoData) -> int:
+        score = self.analyze_title(video.title)
+        score += self.analyze_channel_trustworthiness(video.channel_title)
+        score += self.analyze_engagement(video.view_count, video.like_count)
+        duration = video.duration_seconds
+        if duration and MIN_VIDEO_DURATION <= duration <= MAX_VIDEO_DURATION:
+            score += 10 if 300 <= duration <= 600 else 7
+        return min(score, 100)
+
+    @staticmethod
+    def analyze_title(title: str) -> int:
+        score = 0
+        title_lower = title.lower()
+        if 'oxford reading tree' in title_lower:
+            score += 15
+        elif 'oxford' in title_lower and 'reading' in title_lower:
+            score += 10
+        if 'level 1' in title_lower or 'stage 1' in title_lower:
+            score += 10
+        if any(char in title_lower for char in ['biff', 'chip', 'kipper', 'floppy']):
+            score += 5
+        return score
+
+    @staticmethod
+    def analyze_engagement(view_count: int, like_count: int) -> int:
+        score = 10 if 1000 <= view_count <= 500000 else 5 if 500 <= view_count < 1000 else 0
+        if view_count > 0 and like_count > 0:
+            like_ratio = like_count / view_count
+            score += 5 if like_ratio >= 0.02 else 3 if like_ratio >= 0.01 else 0
+        return score
+
+    @staticmethod
+    def analyze_description(description: str) -> int:
+        desc_lower = description.lower()
+        keyword_count = sum(1 for keyword in ['phonics', 'learn', 'reading', 'education', 'children']
+                            if keyword in desc_lower)
+        return min(keyword_count * 2, 10) + (5 if 50 <= len(description) <= 500 else 0)
+
+    @staticmethod
+    def analyze_channel_trustworthiness(channel_title: str) -> int:
+        channel_lower = channel_title.lower()
+        if any(indicator in channel_lower for indicator in TRUSTED_CHANNEL_INDICATORS):
+            return 25
+        if any(indicator in channel_lower for indicator in ['education', 'learning', 'school', 'teacher', 'kids']):
+            return 10
+        return 0
+
+    @staticmethod
+    def check_inappropriate_content(title: str, description: str) -> int:
+        content = f"{title} {description}".lower()
+        return sum(20 for keyword in NEGATIVE_KEYWORDS if keyword in content)
+
+    @staticmethod
+    def is_level1_content(video: VideoData) -> bool:
+        content = f"{video.title} {video.description}".lower()
+        if 'level 1' in content or 'stage 1' in content:
+            return True
+        if any(keyword in content for keyword in TEXT_KEYWORD_GROUPS['level1_keywords']):
+            return True
+        if any(keyword in content for keyword in TEXT_KEYWORD_GROUPS['advanced_keywords']):
+            return False
+        has_ort = 'oxford' in content and 'reading' in content
+        return has_ort and any(char in content for char in ['biff', 'chip', 'kipper'])
+
+    @staticmethod
+    def extract_learning_objectives(video: VideoData) -> List[str]:
+        content = f"{video.title} {video.description}".lower()
+        return [objective for objective, keywords in OBJECTIVE_KEYWORDS.items()
+                if any(keyword in content for keyword in keywords)]
+
+
+ORIGINAL = OriginalAnalyzer()
+
+
+def test_matcher_equals_substring_checks_including_overlaps():
+    rng = random.Random(11)
+    matcher = KeywordMatcher({**TEXT_KEYWORD_GROUPS, **CHANNEL_KEYWORD_GROUPS})
+    texts = ['chipper kipper', 'level 1level 2', 'oxford reading treeoxford', 'letter sounds'] + \
+        [random_text(rng, 30).lower() for _ in range(3000)]
+    for text in texts:
+        assert matcher.match(text) == {
+            name: {keyword for keyword in keywords if keyword in text}
+            for name, keywords in matcher.categories.items()
+        }, text
+
+
+@pytest.mark.parametrize('method', ['title', 'description', 'channel', 'inappropriate', 'level1', 'objectives'])
+def test_analyzer_checks_match_original(method):
+    analyzer = ContentAnalyzer()
+    for video in VIDEOS:
+        if method == 'title':
+            assert analyzer._analyze_title(video.title) == ORIGINAL.analyze_title(video.title)
+        elif method == 'description':
+            assert analyzer._analyze_description(video.description) == \
+                ORIGINAL.analyze_description(video.description)
+        elif method == 'channel':
+            assert analyzer._analyze_channel_trustworthiness(video.channel_title) == \
+                ORIGINAL.analyze_channel_trustworthiness(video.channel_title)
+        elif method == 'inappropriate':
+            assert analyzer._check_inappropriate_content(video.title, video.description) == \
+                ORIGINAL.check_inappropriate_content(video.title, video.description)
+        elif method == 'level1':
+            assert analyzer.is_level1_content(video) == ORIGINAL.is_level1_content(video)
+        else:
+            assert analyzer.extract_learning_objectives(video) == ORIGINAL.extract_learning_objectives(video)
+
+
+def test_analyze_matches_separate_original_checks():
+    analyzer = ContentAnalyzer()
+    for video in VIDEOS:
+        result = analyzer.analyze(video)
+        assert result.quality_score == ORIGINAL.calculate_quality_score(video)
+        assert result.is_level1_content == ORIGINAL.is_level1_content(video)
+        assert result.learning_objectives == ORIGINAL.extract_learning_objectives(video)
+
+
+def test_analyze_scores_title_only_on_title_text():
+    # 제목 끝과 설명 앞을 이어 붙이면 'oxford reading'이 되지만 제목 점수에는 들어가지 않음
+    video = VIDEOS[0].model_copy(update={'title': 'Biff Oxford', 'description': 'reading tree level 1'})
+    result = ContentAnalyzer().analyze(video)
+    assert result.quality_score == ORIGINAL.calculate_quality_score(video)
+    assert result.is_level1_content
+
+
+def test_score_batch_matches_per_video_scoring():
+    analyzer = ContentAnalyzer()
+    now = datetime.now(timezone.utc)
+    table = {
+        'title': [video.title for video in VIDEOS],
+        'channel_title': [video.channel_title for video in VIDEOS],
+        'view_count': [video.view_count for video in VIDEOS],
+        'like_count': [video.like_count for video in VIDEOS],
+        'duration_seconds': [video.duration_seconds for video in VIDEOS],
+        'published_at': [video.published_at for video in VIDEOS],
+    }
+    result = analyzer.score_batch(table, now=now)
+
+    assert result['quality_score'].tolist() == [ORIGINAL.calculate_quality_score(video) for video in VIDEOS]
+    expected_bonus = [5 if days <= 30 else 3 if days <= 365 else 1 if days <= 1095 else 0
+                      for days in ((now - video.published_at).days for video in VIDEOS)]
+    assert result['recency_bonus'].tolist() == expected_bonus
+    # 시간대 없는 now는 UTC로 간주
+    naive = analyzer.score_batch(table, now=now.replace(tzinfo=None))
+    assert naive['recency_bonus'].tolist() == expected_bonus
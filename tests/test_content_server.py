@@ -0,0 +1,120 @@
+# test_content_server.py
+"""콘텐츠 서버: 느린 검색이 이벤트 루프를 막지 않음, 같은 페이지는 캐시에서 응답, 페이지 나눔과 ETag, 스냅샷 교체"""
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime
+
+import httpx
+
+from mcp_content_server import create_app
+from src.models.video_model import VideoData
+from src.utils.content_catalog import ContentCatalog
+from src.utils.data_processing import DataProcessor
+
+
+def write_export(tmp_path, name: str, count: int):
+    videos = [
+        VideoData(video_id=f"vid{index}", title=f"Phonics Story {index}", description='Biff and Chip',
+                  channel_id='UC1', channel_title='Channel', published_at=datetime(2024, 1, 1), duration='PT5M',
+                  view_count=10, like_count=1, comment_count=0, url='', thumbnail_url='', quality_score=index)
+        for index in range(count)
+    ]
+    (tmp_path / name).write_text(json.dumps(DataProcessor().prepare_for_mcp(videos), default=str), encoding='utf-8')
+
+
+def make_catalog(tmp_path) -> ContentCatalog:
+    write_export(tmp_path, 'mcp_content_20240101_000000.json', 5)
+    catalog = ContentCatalog(exports_dir=str(tmp_path))
+    catalog.load_latest()
+    return catalog
+
+
+def test_slow_search_does_not_block_other_requests(tmp_path):
+    catalog = make_catalog(tmp_path)
+    index = catalog.snapshot.index
+    search = index.search
+    search_threads = []
+
+    def slow_search(*args, **kwargs):
+        search_threads.append(threading.current_thread())
+        time.sleep(0.5)
+        return search(*args, **kwargs)
+
+    index.search = slow_search
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=create_app(catalog))
+        async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+            started = time.perf_counter()
+            searching = asyncio.create_task(client.get('/content', params={'q': 'phonics'}))
+            await asyncio.sleep(0.05)
+            health = await client.get('/health')
+            health_elapsed = time.perf_counter() - started
+            listed = await searching
+
+            # 같은 페이지는 다시 검색하지 않음
+            again = await client.get('/content', params={'q': 'phonics'})
+            return health, health_elapsed, listed, again
+
+    health, health_elapsed, listed, again = asyncio.run(scenario())
+    assert health.status_code == 200
+    assert health_elapsed < 0.4
+    assert listed.status_code == 200
+    assert len(listed.json()['items']) == 5
+    assert again.content == listed.content
+    assert len(search_threads) == 1
+    assert search_threads[0] is not threading.main_thread()
+
+
+def request(catalog: ContentCatalog, calls):
+    """calls(client)를 실행한 결과 (앱 하나로 여러 요청)"""
+    async def scenario():
+        transport = httpx.ASGITransport(app=create_app(catalog))
+        async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+            return await calls(client)
+
+    return asyncio.run(scenario())
+
+
+def test_pages_cover_every_item_once_and_honour_etag(tmp_path):
+    catalog = make_catalog(tmp_path)
+
+    async def calls(client):
+        pages = [await client.get('/content', params={'page': page, 'page_size': 2}) for page in (1, 2, 3)]
+        revalidated = await client.get('/content', params={'page': 1, 'page_size': 2},
+                                       headers={'If-None-Match': pages[0].headers['ETag']})
+        item = await client.get('/content/vid3')
+        item_revalidated = await client.get('/content/vid3', headers={'If-None-Match': f"W/{item.headers['ETag']}"})
+        missing = await client.get('/content/nope')
+        return pages, revalidated, item, item_revalidated, missing
+
+    pages, revalidated, item, item_revalidated, missing = request(catalog, calls)
+    bodies = [page.json() for page in pages]
+    # 검색어가 없으면 품질 점수순
+    assert [item['content_id'] for body in bodies for item in body['items']] == [f"vid{index}" for index in range(4, -1, -1)]
+    assert [body['has_more'] for body in bodies] == [True, True, False]
+    assert revalidated.status_code == 304
+    assert item.json()['content_id'] == 'vid3'
+    assert item_revalidated.status_code == 304
+    assert missing.status_code == 404
+
+
+def test_reload_swaps_snapshot_and_changes_etag(tmp_path):
+    catalog = make_catalog(tmp_path)
+
+    async def calls(client):
+        before = await client.get('/content')
+        unchanged = await client.post('/admin/reload')
+        write_export(tmp_path, 'mcp_content_20240102_000000.json', 7)
+        reloaded = await client.post('/admin/reload')
+        after = await client.get('/content', headers={'If-None-Match': before.headers['ETag']})
+        return before, unchanged, reloaded, after
+
+    before, unchanged, reloaded, after = request(catalog, calls)
+    assert unchanged.json()['reloaded'] is False
+    assert reloaded.json() == {'reloaded': True, 'version': catalog.snapshot.version, 'content_count': 7}
+    assert after.status_code == 200
+    assert after.headers['ETag'] != before.headers['ETag']
+    assert len(after.json()['items']) == 7
@@ -0,0 +1,80 @@
+# test_export_pipeline.py
+"""ExportPipeline: 싱크별 출력과 기존 저장 함수의 출력 일치, 실패 시 열린 싱크 정리"""
+import csv
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.models.video_model import VideoData
+from src.storage.csv_handler import CSVHandler
+from src.storage.export_pipeline import (
+    ExportPipeline, ExportSink, FullCSVSink, MCPJSONSink, RawJSONSink, SummaryCSVSink
+)
+from src.storage.json_handler import JSONHandler
+
+
+def make_videos(count: int):
+    start = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    return [
+        VideoData(
+            video_id=f"vid{index}", title=f"Biff, Chip and \"Kipper\" 스토리 {index} " + 'long ' * (index % 15),
+            description=f"줄바꿈이 있는\n설명 {index}", channel_id=f"UC{index % 3}", channel_title=f"Channel {index % 3}",
+            published_at=start + timedelta(days=index), duration=['PT4M13S', 'PT0S', 'PT1H2M'][index % 3],
+            view_count=index * 12345, like_count=index, comment_count=0,
+            url=f"https://www.youtube.com/watch?v=vid{index}", thumbnail_url='',
+            quality_score=50 + index, is_level1_content=[True, False, None][index % 3],
+            learning_objectives=[['phonics', 'alphabet'], [], None][index % 3]
+        )
+        for index in range(30)
+    ]
+
+
+def read_csv(path: str):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.reader(f))
+
+
+def test_sinks_match_existing_writers(tmp_path):
+    videos = make_videos(30)
+    results = ExportPipeline([
+        RawJSONSink(str(tmp_path / 'raw.json')), MCPJSONSink(str(tmp_path / 'mcp.json')),
+        FullCSVSink(str(tmp_path / 'full.csv')), SummaryCSVSink(str(tmp_path / 'summary.csv'))
+    ]).run(videos)
+
+    reference_dir = tmp_path / 'reference'
+    json_path = JSONHandler(str(reference_dir)).save_videos(videos, 'raw.json')
+    with open(json_path, encoding='utf-8') as expected, open(results['raw_json'], encoding='utf-8') as actual:
+        assert actual.read() == expected.read()
+
+    csv_handler = CSVHandler(str(reference_dir))
+    assert read_csv(results['full_csv']) == read_csv(csv_handler.save_videos(videos, 'full.csv'))
+    assert read_csv(results['summary_csv']) == read_csv(csv_handler.save_summary_csv(videos, 'summary.csv'))
+
+    with open(results['mcp_json'], encoding='utf-8') as f:
+        items = json.load(f)
+    assert [item['content_id'] for item in items] == [video.video_id for video in videos]
+    assert items[1]['description'] == videos[1].description
+    assert items[2]['learning_objectives'] == []
+    assert items[0]['duration_minutes'] == 4.2
+    assert items[0]['metadata']['published_date'] == videos[0].published_at.isoformat()
+
+
+def test_empty_export_writes_empty_arrays(tmp_path):
+    results = ExportPipeline([RawJSONSink(str(tmp_path / 'raw.json'))]).run([])
+    with open(results['raw_json'], encoding='utf-8') as f:
+        assert json.load(f) == []
+
+
+class FailingSink(ExportSink):
+    name = 'failing'
+
+    def write(self, row):
+        raise RuntimeError('disk full')
+
+
+def test_failure_closes_opened_sinks(tmp_path):
+    raw = RawJSONSink(str(tmp_path / 'raw.json'))
+    with pytest.raises(RuntimeError):
+        ExportPipeline([raw, FailingSink()]).run(make_videos(2))
+    assert raw._file.closed
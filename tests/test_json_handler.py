@@ -0,0 +1,94 @@
+# test_json_handler.py
+"""JSONLWriter / JSONHandler: JSON과 같은 복원 결과, 이어 쓰기와 잘린 마지막 줄 복구, 유사 중복 제외"""
+from datetime import datetime
+
+from src.models.video_model import VideoData
+from src.storage.archive_index import ArchiveReader, index_path_for
+from src.storage.json_handler import JSONHandler, JSONLWriter
+
+
+def make_video(video_id: str, title: str = 'Biff and Chip') -> VideoData:
+    return VideoData(
+        video_id=video_id, title=title, description='Oxford Reading Tree', channel_id='UC1',
+        channel_title='Channel', published_at=datetime(2024, 1, 1), duration='PT4M13S', view_count=10,
+        like_count=1, comment_count=0, url='', thumbnail_url='', quality_score=70
+    )
+
+
+def loaded_ids(handler: JSONHandler, path: str):
+    return [video.video_id for video in handler.iter_videos_jsonl(path)]
+
+
+def test_jsonl_round_trip_matches_json_array(tmp_path):
+    handler = JSONHandler(str(tmp_path))
+    videos = [make_video(f"vid{index}", title=f"스토리 {index}") for index in range(20)]
+    with handler.open_jsonl_writer('videos.jsonl') as writer:
+        for video in videos[:10]:
+            writer.write(video)
+    # 다음 실행이 같은 파일에 이어서 추가
+    with handler.open_jsonl_writer('videos.jsonl') as writer:
+        for video in videos[10:]:
+            writer.write(video)
+
+    json_path = handler.save_videos(videos, 'videos.json')
+    assert list(handler.iter_videos_jsonl(str(tmp_path / 'videos.jsonl'))) == handler.load_videos(json_path) == videos
+
+
+def test_appends_after_truncated_line_without_losing_the_next_record(tmp_path):
+    handler = JSONHandler(str(tmp_path))
+    path = str(tmp_path / 'videos.jsonl')
+    with JSONLWriter(path) as writer:
+        writer.write(make_video('a'))
+        writer.write(make_video('b'))
+
+    # 세 번째 레코드를 쓰다가 중단된 실행 (레코드 일부만 기록, 인덱스 없음)
+    with open(path, 'ab') as f:
+        f.write(b'{"video_id": "c", "title": "Fl')
+
+    with JSONLWriter(path) as writer:
+        writer.write(make_video('d'))
+
+    assert loaded_ids(handler, path) == ['a', 'b', 'd']
+    with ArchiveReader(path) as reader:
+        assert len(reader) == 3
+        assert reader.get('d').title == 'Biff and Chip'
+        assert 'c' not in reader
+
+
+def test_rebuilds_index_cut_off_mid_line(tmp_path):
+    path = str(tmp_path / 'videos.jsonl')
+    with JSONLWriter(path) as writer:
+        writer.write(make_video('a'))
+        writer.write(make_video('b'))
+    index_path = index_path_for(path)
+    with open(index_path, 'rb') as f:
+        index = f.read()
+    with open(index_path, 'wb') as f:
+        f.write(index[:-3])
+
+    with JSONLWriter(path) as writer:
+        writer.write(make_video('c'))
+
+    with ArchiveReader(path) as reader:
+        assert [reader.get(video_id).video_id for video_id in 'abc'] == ['a', 'b', 'c']
+
+
+def test_discarded_videos_leave_archive_and_index_on_close(tmp_path):
+    handler = JSONHandler(str(tmp_path))
+    path = str(tmp_path / 'videos.jsonl')
+    with JSONLWriter(path) as writer:
+        writer.write(make_video('old'))
+
+    writer = JSONLWriter(path)
+    videos = [make_video(video_id) for video_id in ['a', 'b', 'c']]
+    for video in videos:
+        writer.write(video)
+    writer.discard(videos[1])
+    writer.close()
+
+    assert loaded_ids(handler, path) == ['old', 'a', 'c']
+    assert writer.count == 2
+    with ArchiveReader(path) as reader:
+        assert len(reader) == 3
+        assert reader.get('c').video_id == 'c'
+        assert 'b' not in reader
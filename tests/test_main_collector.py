@@ -0,0 +1,41 @@
+# test_main_collector.py
+"""MainCollector: 워커 수와 무관한 수집 결과, 키워드를 넘나드는 상세 조회 배치 (대역 API 클라이언트 사용)"""
+from config.keywords import SEARCH_KEYWORDS
+from src.collectors.main_collector import MainCollector
+
+
+def add_catalog(youtube_api):
+    """키워드마다 영상 몇 개씩, 일부는 여러 키워드에 겹치게 등록"""
+    for index in range(60):
+        keywords = (SEARCH_KEYWORDS[index % len(SEARCH_KEYWORDS)], SEARCH_KEYWORDS[(index * 7) % len(SEARCH_KEYWORDS)])
+        youtube_api.add_video(f"vid{index:03d}", f"Biff Chip and Kipper Oxford Reading Tree story {index}",
+                              f"Level 1 phonics reading for kids, episode {index}", channel_id=f"UC{index % 4}",
+                              views=1000 + index * 37, likes=40 + index, keywords=keywords)
+
+
+def collect(max_workers: int):
+    collector = MainCollector('test-key', min_quality_score=0, max_workers=max_workers,
+                              requests_per_second=1000, burst=100, near_duplicate_threshold=None)
+    return collector.collect_oxford_reading_tree_level1()
+
+
+def test_worker_pool_matches_sequential_collection(youtube_api):
+    add_catalog(youtube_api)
+    sequential = collect(max_workers=1)
+    youtube_api.calls.clear()
+    concurrent = collect(max_workers=4)
+
+    assert [(video.video_id, video.quality_score) for video in concurrent['videos']] == \
+        [(video.video_id, video.quality_score) for video in sequential['videos']]
+    assert concurrent['keyword_stats'] == sequential['keyword_stats']
+    assert len(concurrent['videos']) == 60
+
+
+def test_detail_lookups_fill_50_id_batches_across_keywords(youtube_api):
+    add_catalog(youtube_api)
+    collect(max_workers=4)
+
+    batches = [params['id'].split(',') for endpoint, params in youtube_api.calls if endpoint == 'videos']
+    # 키워드마다 몇 개씩이지만 60개를 50 + 10으로 조회
+    assert [len(batch) for batch in batches] == [50, 10]
+    assert len({video_id for batch in batches for video_id in batch}) == 60
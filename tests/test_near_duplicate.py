@@ -0,0 +1,66 @@
+# test_near_duplicate.py
+"""NearDuplicateDetector / MainCollector 3단계: 재업로드 제거, 기존 데이터셋과의 비교, 채널 통계 재집계"""
+from datetime import datetime
+
+from config.keywords import SEARCH_KEYWORDS
+from src.collectors.main_collector import MainCollector
+from src.models.video_model import VideoData
+from src.utils.near_duplicate import NearDuplicateDetector
+
+STORY = ("Biff Chip and Kipper The Big Trampoline Oxford Reading Tree Level 1 story read aloud",
+         "Floppy jumps on the trampoline with Biff and Chip. A first reading story for young children.")
+OTHER = ("Phonics song for kids letter sounds A to Z",
+         "Sing along with the alphabet and learn every letter sound with Kipper")
+
+
+def make_video(video_id: str, title: str, description: str, quality_score: int = 60,
+               channel_id: str = 'UC1', duration: str = 'PT5M') -> VideoData:
+    return VideoData(
+        video_id=video_id, title=title, description=description, channel_id=channel_id,
+        channel_title=f"Channel {channel_id}", published_at=datetime(2024, 1, 1), duration=duration,
+        view_count=100, like_count=5, comment_count=0, url='', thumbnail_url='', quality_score=quality_score
+    )
+
+
+def test_keeps_best_of_each_cluster_in_input_order():
+    videos = [make_video('a', *STORY, quality_score=60), make_video('b', *OTHER),
+              make_video('c', STORY[0] + ' (reupload)', STORY[1], quality_score=75)]
+    kept, removed = NearDuplicateDetector().deduplicate(videos)
+    assert [video.video_id for video in kept] == ['b', 'c']
+    assert [video.video_id for video in removed] == ['a']
+
+
+def test_new_reupload_of_existing_video_is_removed_even_with_higher_score():
+    existing = [make_video('old', *STORY, quality_score=60)]
+    videos = [make_video('new', STORY[0] + '!!', STORY[1], quality_score=90), make_video('other', *OTHER)]
+    kept, removed = NearDuplicateDetector().deduplicate(videos, existing)
+    assert [video.video_id for video in kept] == ['other']
+    assert [video.video_id for video in removed] == ['new']
+
+
+def test_duration_mismatch_is_not_a_duplicate():
+    videos = [make_video('a', *STORY), make_video('b', *STORY, duration='PT12M')]
+    assert NearDuplicateDetector().deduplicate(videos)[1] == []
+
+
+def test_incremental_run_drops_reuploads_of_existing_videos(youtube_api):
+    keyword = SEARCH_KEYWORDS[0]
+    youtube_api.add_video('new1', STORY[0] + ' #shorts', STORY[1], channel_id='UCnew', keywords=(keyword,))
+    youtube_api.add_video('new2', *OTHER, channel_id='UCnew', keywords=(keyword,))
+    existing = [make_video('old1', *STORY, quality_score=55, channel_id='UCold')]
+
+    discarded = []
+    collector = MainCollector('test-key', min_quality_score=0, requests_per_second=1000, burst=100,
+                              existing_videos=existing,
+                              on_video_discarded=discarded.append)
+    result = collector.collect_oxford_reading_tree_level1()
+
+    assert [video.video_id for video in result['videos']] == ['new2']
+    assert [video.video_id for video in discarded] == ['new1']
+    assert result['collection_stats']['near_duplicates_removed'] == 1
+
+    # 채널 통계는 빠진 영상을 제외하고 기존 데이터셋까지 포함해 다시 집계
+    channel_stats = result['channel_stats']
+    assert {channel_id: stats.video_count for channel_id, stats in channel_stats.items()} == {'UCold': 1, 'UCnew': 1}
+    assert channel_stats['UCnew'].sample_video_ids == ['new2']
+    assert channel_stats['UCnew'].avg_quality_score == result['videos'][0].quality_score
@@ -0,0 +1,263 @@
+# test_notification_fanout.py
+"""NotificationFanout / 싱크: 수신자별 병합, 재시도와 포기, 대기열 배압, SMTP 남은 전달만 재시도
+
+웹훅과 SMTP는 테스트 안에서 띄운 로컬 대역 서버로 보낸다.
+"""
+import asyncio
+import base64
+import email
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+from notification_fanout import NotificationFanout, NotificationSink, SmtpSink, WebhookSink
+from reminder_dispatcher import SenderUnavailable
+
+
+class RecordingSink(NotificationSink):
+    """받은 배치를 기록하고, release가 설정될 때까지 발송을 붙잡아 두는 싱크"""
+
+    def __init__(self, release: asyncio.Event = None):
+        self.batches: List[List[Dict[str, Any]]] = []
+        self.release = release
+
+    async def send_batch(self, deliveries):
+        self.batches.append([dict(delivery) for delivery in deliveries])
+        if self.release is not None:
+            await self.release.wait()
+        return []
+
+
+class StandInWebhook:
+    """statuses 순서대로 응답하고 (다 쓰면 마지막 값 반복) 받은 본문을 모으는 HTTP/1.1 서버"""
+
+    def __init__(self, statuses: List[int]):
+        self.statuses = statuses
+        self.bodies: List[Dict[str, Any]] = []
+        self.server = None
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self.handle, '127.0.0.1', 0)
+        return f"http://127.0.0.1:{self.server.sockets[0].getsockname()[1]}/notify"
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                length = 0
+                for line in head.split(b'\r\n')[1:]:
+                    name, _, value = line.partition(b':')
+                    if name.strip().lower() == b'content-length':
+                        length = int(value)
+                self.bodies.append(json.loads(await reader.readexactly(length)))
+                status = self.statuses[min(len(self.bodies), len(self.statuses)) - 1]
+                writer.write(f"HTTP/1.1 {status} X\r\ncontent-length: 0\r\n\r\n".encode())
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+class StandInSmtp:
+    """받은 메일의 수신자를 기록하는 최소 SMTP 서버 (disconnect_after통을 받으면 첫 연결을 끊음)"""
+
+    def __init__(self, disconnect_after: int = None):
+        self.disconnect_after = disconnect_after
+        self.recipients: List[str] = []
+        self.bodies: List[str] = []
+        self.connections = 0
+        self.server = None
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self.handle, '127.0.0.1', 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        first_connection = self.connections == 1
+        received = 0
+        recipient = None
+        writer.write(b'220 localhost stand-in\r\n')
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line[:4].upper()
+                if command == b'EHLO':
+                    writer.write(b'250-localhost\r\n250 8BITMIME\r\n')
+                elif command == b'RCPT':
+                    recipient = line.decode().split('<', 1)[1].split('>', 1)[0]
+                    writer.write(b'250 OK\r\n')
+                elif command == b'DATA':
+                    writer.write(b'354 end with .\r\n')
+                    await writer.drain()
+                    lines = []
+                    while (data := await reader.readline()) != b'.\r\n':
+                        lines.append(data)
+                    self.recipients.append(recipient)
+                    self.bodies.append(b''.join(lines).decode())
+                    received += 1
+                    writer.write(b'250 queued\r\n')
+                    await writer.drain()
+                    if first_connection and received == self.disconnect_after:
+                        break
+                elif command == b'QUIT':
+                    writer.write(b'221 bye\r\n')
+                    await writer.drain()
+                    break
+                else:
+                    writer.write(b'250 OK\r\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+def notification(notification_id: int, recipient: str, message: str, channel: str = 'test') -> Dict[str, Any]:
+    return {'id': notification_id, 'notification_type': channel, 'recipient': recipient, 'message': message}
+
+
+def test_merges_notifications_per_recipient():
+    async def scenario():
+        sink = RecordingSink()
+        results = []
+        fanout = NotificationFanout({'test': sink}, linger_seconds=0.2, on_result=results.extend)
+        await fanout.start()
+        for item in [notification(1, 'family-1', '파닉스'), notification(2, 'family-2', '파닉스'),
+                     notification(3, 'family-1', 'ORT'), notification(4, 'family-1', '파닉스'),
+                     notification(5, 'family-2', '퀴즈')]:
+            await fanout.submit(item)
+        await fanout.close()
+        return sink, fanout, results
+
+    sink, fanout, results = asyncio.run(scenario())
+    assert len(sink.batches) == 1
+    deliveries = {delivery['recipient']: delivery for delivery in sink.batches[0]}
+    assert deliveries['family-1']['messages'] == ['파닉스', 'ORT']
+    assert deliveries['family-1']['ids'] == [1, 3, 4]
+    assert deliveries['family-2']['messages'] == ['파닉스', '퀴즈']
+    assert fanout.stats['delivered'] == 5
+    assert fanout.stats['deliveries'] == 2
+    assert sorted(results) == [(i, 'sent', None) for i in range(1, 6)]
+
+
+@pytest.mark.parametrize('statuses', [[429, 200], [503, 500, 200]])
+def test_webhook_retries_rate_limit_and_server_errors(statuses):
+    async def scenario():
+        server = StandInWebhook(statuses)
+        url = await server.start()
+        results = []
+        fanout = NotificationFanout({'webhook': WebhookSink(url)}, linger_seconds=0.01, base_delay=0.01,
+                                    on_result=results.extend)
+        await fanout.start()
+        await fanout.submit(notification(7, 'family-1', '파닉스', 'webhook'))
+        await fanout.close()
+        await server.stop()
+        return server, fanout, results
+
+    server, fanout, results = asyncio.run(scenario())
+    assert len(server.bodies) == len(statuses)
+    assert all(body == server.bodies[0] for body in server.bodies)
+    assert fanout.stats['retries'] == len(statuses) - 1
+    assert fanout.stats['delivered'] == 1
+    assert results == [(7, 'sent', None)]
+
+
+@pytest.mark.parametrize('status, attempts', [(503, 3), (400, 1)])
+def test_webhook_drops_after_max_retries_or_permanent_error(status, attempts):
+    async def scenario():
+        server = StandInWebhook([status])
+        url = await server.start()
+        results = []
+        fanout = NotificationFanout({'webhook': WebhookSink(url)}, linger_seconds=0.01, base_delay=0.01,
+                                    max_retries=2, on_result=results.extend)
+        await fanout.start()
+        await fanout.submit(notification(7, 'family-1', '파닉스', 'webhook'))
+        await fanout.submit(notification(8, 'family-1', 'ORT', 'webhook'))
+        await fanout.close()
+        await server.stop()
+        return server, fanout, results
+
+    server, fanout, results = asyncio.run(scenario())
+    assert len(server.bodies) == attempts
+    assert fanout.stats['dropped'] == 2
+    assert fanout.stats['delivered'] == 0
+    assert sorted(results) == [(7, 'failed', f"HTTP {status}"), (8, 'failed', f"HTTP {status}")]
+
+
+def test_full_queue_applies_backpressure():
+    async def scenario():
+        release = asyncio.Event()
+        sink = RecordingSink(release)
+        fanout = NotificationFanout({'test': sink}, max_pending=2, batch_size=1, linger_seconds=0,
+                                    max_concurrent_batches=1)
+        await fanout.start()
+        await fanout.submit(notification(1, 'family-1', 'a'))
+        await asyncio.sleep(0.05)  # 첫 알림은 싱크에서 붙잡힘
+        await fanout.submit(notification(2, 'family-2', 'b'))
+        await fanout.submit(notification(3, 'family-3', 'c'))
+
+        # 대기열(2칸)이 가득 차서 다음 제출은 기다림
+        blocked = asyncio.create_task(fanout.submit(notification(4, 'family-4', 'd')))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+
+        # 다른 스레드의 제출은 timeout 안에 자리가 나지 않으면 대기열에 넣지 않고 SenderUnavailable
+        with pytest.raises(SenderUnavailable):
+            await asyncio.to_thread(fanout.submit_threadsafe, notification(5, 'family-5', 'e'), 0.05)
+
+        release.set()
+        await asyncio.wait_for(blocked, 1)
+        await fanout.close()
+        return sink, fanout
+
+    sink, fanout = asyncio.run(scenario())
+    assert [batch[0]['ids'] for batch in sink.batches] == [[1], [2], [3], [4]]
+    assert fanout.stats['submitted'] == 4
+
+
+def test_closed_fanout_rejects_threadsafe_submit():
+    async def scenario():
+        fanout = NotificationFanout({'test': RecordingSink()})
+        await fanout.start()
+        await fanout.close()
+        with pytest.raises(SenderUnavailable):
+            await asyncio.to_thread(fanout.submit_threadsafe, notification(1, 'family-1', 'a'))
+
+    asyncio.run(scenario())
+
+
+def test_smtp_retries_only_unsent_remainder_after_disconnect():
+    async def scenario():
+        server = StandInSmtp(disconnect_after=2)
+        port = await server.start()
+        results = []
+        fanout = NotificationFanout({'email': SmtpSink('127.0.0.1', port, timeout=5)}, linger_seconds=0.2,
+                                    base_delay=0.01, on_result=results.extend)
+        await fanout.start()
+        for index in range(4):
+            await fanout.submit(notification(index + 1, f"family-{index}@example.com", f"메시지 {index}", 'email'))
+        await fanout.close()
+        await server.stop()
+        return server, fanout, results
+
+    server, fanout, results = asyncio.run(scenario())
+    # 끊기기 전에 보낸 2통은 다시 보내지 않음
+    assert sorted(server.recipients) == [f"family-{index}@example.com" for index in range(4)]
+    assert server.connections == 2
+    assert fanout.stats['retries'] == 2
+    assert sorted(results) == [(index, 'sent', None) for index in range(1, 5)]
+    bodies = {base64.b64decode(email.message_from_string(body).get_payload()).decode() for body in server.bodies}
+    assert bodies == {f"메시지 {index}" for index in range(4)}
@@ -0,0 +1,61 @@
+# test_quota_ledger.py
+"""QuotaLedger: 엔드포인트별 비용, 단계 예산과 일일 한도, 실행 간 누적"""
+import pytest
+
+from config.keywords import SEARCH_KEYWORDS
+from src.collectors.main_collector import MainCollector
+from src.utils.quota_ledger import QuotaExceededError, QuotaLedger
+
+
+def test_charges_accumulate_across_runs(tmp_path):
+    path = str(tmp_path / 'quota.json')
+    ledger = QuotaLedger(path)
+    ledger.start_phase('search')
+    ledger.charge('search')
+    ledger.charge('videos')
+
+    summary = QuotaLedger(path).get_summary()
+    assert summary['spent'] == 101
+    assert summary['by_endpoint'] == {'search': 100, 'videos': 1}
+    assert summary['by_phase'] == {'search': 101}
+
+
+def test_phase_budget_and_daily_limit(tmp_path):
+    ledger = QuotaLedger(str(tmp_path / 'quota.json'), daily_limit=250)
+    ledger.start_phase('search', budget=150)
+    ledger.charge('search')
+    with pytest.raises(QuotaExceededError) as error:
+        ledger.charge('search')
+    assert error.value.scope == 'phase'
+
+    ledger.start_phase('channel_expansion')
+    ledger.charge('search')
+    with pytest.raises(QuotaExceededError) as error:
+        ledger.charge('search')
+    assert error.value.scope == 'daily'
+    # 거절된 호출은 기록하지 않음
+    assert ledger.remaining() == 50
+
+
+def test_exhausted_ledger_refuses_every_call(tmp_path):
+    ledger = QuotaLedger(str(tmp_path / 'quota.json'))
+    ledger.mark_exhausted()
+    with pytest.raises(QuotaExceededError):
+        ledger.charge('videos')
+    assert ledger.remaining() == 0
+
+
+def test_search_budget_stops_phase_and_keeps_partial_results(tmp_path, youtube_api):
+    for index, keyword in enumerate(SEARCH_KEYWORDS):
+        youtube_api.add_video(f"vid{index}", f"Biff Chip Kipper Oxford Reading Tree story {index}", keywords=(keyword,))
+    ledger = QuotaLedger(str(tmp_path / 'quota.json'))
+    collector = MainCollector('test-key', min_quality_score=0, requests_per_second=1000, burst=100,
+                              quota_ledger=ledger, phase_budgets={'search': 350},
+                              near_duplicate_threshold=None)
+    result = collector.collect_oxford_reading_tree_level1()
+
+    # 검색 3회(300) 뒤 네 번째 검색은 예산 초과, 남은 50 units로 상세 조회
+    assert youtube_api.count('search') == 3
+    assert result['collection_stats']['quota_exhausted'] == 'phase'
+    assert sorted(video.video_id for video in result['videos']) == ['vid0', 'vid1', 'vid2']
+    assert ledger.get_summary()['by_phase']['search'] == 301
@@ -0,0 +1,40 @@
+# test_rate_limiter.py
+"""TokenBucketRateLimiter: 버스트, 대기, 여러 스레드가 나눠 쓰는 전체 속도"""
+import threading
+import time
+
+import pytest
+
+from src.utils.rate_limiter import TokenBucketRateLimiter
+
+
+def test_burst_up_to_capacity_then_empty():
+    limiter = TokenBucketRateLimiter(rate=1, capacity=5)
+    assert [limiter.try_acquire() for _ in range(6)] == [True] * 5 + [False]
+
+
+def test_acquire_waits_for_refill():
+    limiter = TokenBucketRateLimiter(rate=20, capacity=1)
+    limiter.acquire()
+    started = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - started >= 0.04
+
+
+def test_shared_bucket_caps_total_rate_across_threads():
+    limiter = TokenBucketRateLimiter(rate=100, capacity=1)
+    threads = [threading.Thread(target=lambda: [limiter.acquire() for _ in range(5)]) for _ in range(4)]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # 첫 토큰은 버킷에 있으므로 나머지 19개에 최소 0.19초
+    assert time.monotonic() - started >= 0.18
+
+
+def test_rejects_invalid_rate_and_oversized_request():
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(rate=1, capacity=2).acquire(3)
@@ -0,0 +1,55 @@
+# test_reminder_dispatcher.py
+"""ReminderDispatcher: 나중에 받는 발송 결과, 쓸 수 없는 sender, 재시작 정리"""
+import pytest
+
+from reminder_dispatcher import ReminderDispatcher, SenderUnavailable
+
+NOW = 1_700_000_000.0
+
+
+def statuses(dispatcher: ReminderDispatcher) -> dict:
+    rows = dispatcher._conn.execute("SELECT CAST(id AS INTEGER), status, error FROM reminders").fetchall()
+    return {reminder_id: (status, error) for reminder_id, status, error in rows}
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'reminders.sqlite3')
+
+
+def test_deferred_results_are_recorded_per_reminder(db_path):
+    handed = []
+    dispatcher = ReminderDispatcher(db_path, sender=handed.append, deferred_results=True, clock=lambda: NOW)
+    ids = dispatcher.schedule_many([(NOW - 10, f"알림 {index}", 'webhook', None) for index in range(3)])
+
+    assert dispatcher.tick() == 3
+    assert {status for status, _ in statuses(dispatcher).values()} == {'queued'}
+
+    dispatcher.report([(ids[0], 'sent', None), (ids[1], 'failed', 'HTTP 400'), (None, 'sent', None)])
+    assert statuses(dispatcher) == {ids[0]: ('sent', None), ids[1]: ('failed', 'HTTP 400'), ids[2]: ('queued', None)}
+    dispatcher.close()
+
+    # 결과를 받기 전에 멈추면 재시작할 때 잃어버린 알림으로 기록
+    restarted = ReminderDispatcher(db_path, clock=lambda: NOW)
+    assert statuses(restarted)[ids[2]] == ('failed', 'interrupted')
+    restarted.close()
+
+
+def test_unavailable_sender_returns_reminders_to_pending(db_path):
+    handed = []
+
+    def sender(reminder):
+        if len(handed) == 1:
+            raise SenderUnavailable("stopped")
+        handed.append(reminder['id'])
+
+    dispatcher = ReminderDispatcher(db_path, sender=sender, clock=lambda: NOW)
+    ids = dispatcher.schedule_many([(NOW - 10 + index, f"알림 {index}", 'log', None) for index in range(3)])
+
+    assert dispatcher.tick() == 1
+    assert statuses(dispatcher) == {ids[0]: ('sent', None), ids[1]: ('pending', None), ids[2]: ('pending', None)}
+
+    dispatcher.sender = lambda reminder: handed.append(reminder['id'])
+    assert dispatcher.tick() == 2
+    assert handed == ids
+    dispatcher.close()
@@ -0,0 +1,92 @@
+# test_report_accumulator.py
+"""ReportAccumulator: 온라인 누적 통계와 최종 영상 목록으로 한 번에 계산한 리포트의 일치"""
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from src.models.video_model import VideoData
+from src.storage.export_pipeline import canonical_row, report_item
+from src.utils.report_accumulator import ReportAccumulator
+
+
+def make_videos(count: int, seed: int = 5) -> List[VideoData]:
+    rng = random.Random(seed)
+    return [
+        VideoData(
+            video_id=f"vid{index}", title=f"Biff and Chip {index}", description='', channel_id=f"UC{index % 9}",
+            channel_title=f"Channel {index % 9}", published_at=datetime(2024, 1, 1) + timedelta(hours=index),
+            duration='PT5M', view_count=index, like_count=0, comment_count=0, url='', thumbnail_url='',
+            quality_score=rng.randint(0, 100), is_level1_content=rng.random() < 0.6,
+            learning_objectives=rng.sample(['phonics', 'alphabet', 'vocabulary', 'first_words'], rng.randint(0, 3))
+        )
+        for index in range(count)
+    ]
+
+
+def batch_summary(videos: List[VideoData]) -> Dict[str, Any]:
+    """기존 generate_collection_report가 최종 영상 목록을 순회해 계산하던 값"""
+    ranked = sorted(videos, key=lambda video: video.quality_score, reverse=True)
+    distribution = {'excellent (90-100)': 0, 'good (70-89)': 0, 'fair (50-69)': 0, 'poor (0-49)': 0}
+    objectives: Dict[str, int] = {}
+    for video in videos:
+        score = video.quality_score
+        bucket = ('excellent (90-100)' if score >= 90 else 'good (70-89)' if score >= 70
+                  else 'fair (50-69)' if score >= 50 else 'poor (0-49)')
+        distribution[bucket] += 1
+        for objective in video.learning_objectives or []:
+            objectives[objective] = objectives.get(objective, 0) + 1
+    return {
+        'total_videos': len(videos),
+        'quality_score_sum': sum(video.quality_score for video in videos),
+        'avg_quality_score': sum(video.quality_score for video in videos) / len(videos) if videos else 0,
+        'level1_videos': sum(1 for video in videos if video.is_level1_content),
+        'quality_distribution': distribution,
+        'learning_objectives': objectives,
+        'channel_count': len({video.channel_id for video in videos}),
+        'top_videos': [report_item(canonical_row(video)) for video in ranked[:10]]
+    }
+
+
+def test_snapshot_matches_batch_report():
+    videos = make_videos(500)
+    accumulator = ReportAccumulator()
+    for video in videos:
+        accumulator.add(video)
+    assert accumulator.snapshot() == batch_summary(videos)
+
+    rows = ReportAccumulator()
+    for video in videos:
+        rows.add_row(canonical_row(video))
+    assert rows.snapshot() == batch_summary(videos)
+
+
+def test_discard_within_slack_keeps_top_list_exact():
+    videos = make_videos(300)
+    accumulator = ReportAccumulator()
+    for video in videos:
+        accumulator.add(video)
+    ranked = sorted(videos, key=lambda video: video.quality_score, reverse=True)
+    removed = ranked[:5] + ranked[50:55]
+    for video in removed:
+        accumulator.discard(video)
+
+    remaining = [video for video in videos if all(video is not other for other in removed)]
+    assert accumulator.top_complete
+    assert accumulator.snapshot() == batch_summary(remaining)
+
+
+def test_discard_beyond_slack_needs_rebuild():
+    videos = make_videos(100)
+    accumulator = ReportAccumulator(top_k=3, slack=1)
+    for video in videos:
+        accumulator.add(video)
+    ranked = sorted(videos, key=lambda video: video.quality_score, reverse=True)
+    for video in ranked[:3]:
+        accumulator.discard(video)
+
+    assert not accumulator.top_complete
+    remaining = ranked[3:]
+    accumulator.rebuild_top(remaining)
+    assert accumulator.top_complete
+    assert [item['video_id'] for item in accumulator.snapshot()['top_videos']] == \
+        [video.video_id for video in remaining[:3]]
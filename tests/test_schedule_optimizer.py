@@ -0,0 +1,116 @@
+# test_schedule_optimizer.py
+"""LearningScheduleOptimizer: 휴리스틱 경로 결과가 MIP 최적해와 같은지, 솔버 상태 처리"""
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from schedule_optimizer import LearningScheduleOptimizer
+
+# (연속 학습 일수 상한, 연속 휴식 일수 상한)
+SEQUENCE_RULES = [(None, None), (3, None), (3, 2), (2, 1), (1, 2)]
+ENERGY_PATTERNS = [
+    {'morning': 0.9, 'afternoon': 0.6, 'evening': 0.3},
+    {'hourly': {'7': 0.6, '16': 0.8, '18:30': 0.4}, 'default': 0.5},
+    {'afternoon': 0.4, 'evening': 0.9}
+]
+
+
+def make_constraints(rng: random.Random) -> dict:
+    """요일마다 에너지가 다르고 막힌 날짜가 섞인 임의의 제약"""
+    weeks = rng.choice([1, 2, 4])
+    start_date = date(2024, 3, 4)
+    busy_times = [{'day': 'weekdays', 'start': '08:30', 'end': f"{rng.randint(14, 17)}:00"}]
+    for _ in range(rng.randint(2, 8)):
+        hour = rng.randint(15, 19)
+        busy_times.append({'day': rng.randrange(7), 'start': f"{hour}:00", 'end': f"{hour + 1}:{rng.choice(['00', '30'])}"})
+    min_per_week = rng.randint(0, 4)
+    max_consecutive, max_rest = rng.choice(SEQUENCE_RULES)
+    return {
+        'family_schedule': {'busy_times': busy_times, 'buffer_minutes': rng.choice([0, 10])},
+        'child_energy_pattern': rng.choice(ENERGY_PATTERNS),
+        'session_minutes': rng.choice([15, 20, 30]),
+        'weeks': weeks,
+        'start_date': start_date.isoformat(),
+        'min_sessions_per_week': min_per_week,
+        'max_sessions_per_week': rng.randint(max(min_per_week, 1), 6),
+        'max_consecutive_days': max_consecutive,
+        'max_rest_days': max_rest,
+        'blocked_dates': [(start_date + timedelta(days=rng.randrange(weeks * 7))).isoformat()
+                          for _ in range(rng.randint(0, weeks * 2))],
+        'min_energy': rng.choice([0, 0.4])
+    }
+
+
+@pytest.mark.parametrize('seed', range(60))
+def test_matches_forced_mip(seed):
+    rng = random.Random(seed)
+    constraints = make_constraints(rng)
+    optimizer = LearningScheduleOptimizer()
+    result = optimizer.optimize_weekly_schedule(constraints)
+
+    weeks = constraints['weeks']
+    dates = [date.fromisoformat(constraints['start_date']) + timedelta(days=offset) for offset in range(weeks * 7)]
+    values = [slot['energy_score'] if slot else None for slot in optimizer._daily_slots(constraints, dates)]
+    status, selected = optimizer._solve_mip(
+        [False] * len(values), values, weeks, constraints['min_sessions_per_week'],
+        constraints['max_sessions_per_week'], constraints['max_consecutive_days'], constraints['max_rest_days']
+    )
+
+    assert status in ('optimal', 'infeasible')
+    if status == 'infeasible':
+        assert result['status'] == 'infeasible'
+        return
+    assert result['status'] == 'optimal'
+    assert result['objective'] == pytest.approx(round(optimizer._total(selected, values), 3), abs=1e-3)
+    chosen = [dates.index(date.fromisoformat(session['date'])) for session in result['sessions']]
+    assert all(values[day] is not None for day in chosen)
+    flags = [day in chosen for day in range(len(values))]
+    assert not optimizer._violations(flags, constraints['max_consecutive_days'], constraints['max_rest_days'])
+    assert result['weekly_sessions'] == [sum(flags[week:week + 7]) for week in range(0, len(flags), 7)]
+
+
+def _mip_instance(repair_valid: bool) -> dict:
+    """MIP까지 가는 제약 중 교환 보정한 해(MIP 힌트)가 제약을 만족하는지가 repair_valid인 첫 인스턴스"""
+    optimizer = LearningScheduleOptimizer()
+    hints = []
+    solve_mip = optimizer._solve_mip
+
+    def recording_solve_mip(hint, values, weeks, min_per_week, max_per_week, max_consecutive, max_rest):
+        hints.append(not optimizer._violations(hint, max_consecutive, max_rest))
+        return solve_mip(hint, values, weeks, min_per_week, max_per_week, max_consecutive, max_rest)
+
+    optimizer._solve_mip = recording_solve_mip
+    for seed in range(2000):
+        constraints = make_constraints(random.Random(seed))
+        hints.clear()
+        optimizer.optimize_weekly_schedule(constraints)
+        if hints == [repair_valid]:
+            return constraints
+    pytest.skip("조건에 맞는 인스턴스를 찾지 못함")
+
+
+@pytest.mark.parametrize('solver_status', ['timeout', 'error'])
+def test_unsolved_mip_falls_back_to_repaired_plan(monkeypatch, solver_status):
+    constraints = _mip_instance(repair_valid=True)
+    optimizer = LearningScheduleOptimizer()
+    monkeypatch.setattr(optimizer, '_solve_mip', lambda *args: (solver_status, None))
+
+    result = optimizer.optimize_weekly_schedule(constraints)
+    # 최적은 증명하지 못했지만 보정한 해가 제약을 만족하므로 feasible
+    assert result['status'] == 'feasible'
+    assert result['solved_by'] == 'heuristic'
+    assert result['sessions']
+    assert result['objective'] < result['upper_bound']
+    assert optimizer.stats[solver_status] == 1
+
+
+@pytest.mark.parametrize('solver_status', ['timeout', 'error'])
+def test_unsolved_mip_without_valid_repair(monkeypatch, solver_status):
+    constraints = _mip_instance(repair_valid=False)
+    optimizer = LearningScheduleOptimizer()
+    monkeypatch.setattr(optimizer, '_solve_mip', lambda *args: (solver_status, None))
+
+    result = optimizer.optimize_weekly_schedule(constraints)
+    assert result['status'] == solver_status
+    assert result['sessions'] == []
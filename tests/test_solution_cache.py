@@ -0,0 +1,65 @@
+# test_solution_cache.py
+"""SolutionCache: 캐시를 거친 추천이 직접 계산한 결과와 같음, 사본 반환, 종류별 통계"""
+import random
+
+from solution_cache import SolutionCache, canonical_family_schedule
+from time_slot_engine import TimeSlotEngine
+
+
+def random_time(rng: random.Random) -> str:
+    return f"{rng.randrange(6, 22):02d}:{rng.randrange(60):02d}"
+
+
+def random_request(rng: random.Random) -> dict:
+    schedule = {
+        'busy_times': [{'day': rng.choice(['daily', 'weekdays', 'saturday']), 'start': random_time(rng),
+                        'end': random_time(rng)} for _ in range(rng.randrange(3))],
+        'buffer_minutes': rng.choice([0, 5, 7, 10])
+    }
+    if rng.random() < 0.5:
+        start = random_time(rng)
+        schedule['parent_available'] = [{'day': 'daily', 'start': start, 'end': rng.choice([start, random_time(rng)])}]
+    return {
+        'family_schedule': schedule,
+        'child_energy_pattern': rng.choice([None, {'morning': 0.9, 'evening': 0.3}, {'hourly': {'8': 0.7}}]),
+        'learning_duration': rng.choice([15, 20, 23, 30])
+    }
+
+
+def test_cached_recommendations_match_uncached():
+    rng = random.Random(7)
+    requests = [random_request(rng) for _ in range(300)]
+    expected = TimeSlotEngine().recommend_batch(requests)
+    cached_engine = TimeSlotEngine(cache=SolutionCache())
+    for _ in range(2):
+        assert [cached_engine.recommend(**request) for request in requests] == expected
+
+
+def test_empty_parent_window_is_not_unrestricted():
+    unrestricted = canonical_family_schedule({})
+    for window in [('18:00', '18:00'), ('18:01', '18:04')]:
+        empty = {'parent_available': [{'day': 'daily', 'start': window[0], 'end': window[1]}]}
+        assert canonical_family_schedule(empty) != unrestricted
+
+
+def test_get_returns_independent_copies_and_counts_per_kind(tmp_path):
+    cache = SolutionCache(db_path=str(tmp_path / 'cache.sqlite3'))
+    key = cache.make_key('time_slots', ('a',))
+    assert cache.get(key) is None
+    cache.put(key, {'recommendations': [1, 2]})
+
+    first = cache.get(key)
+    first['recommendations'].append(3)
+    assert cache.get(key) == {'recommendations': [1, 2]}
+
+    restarted = SolutionCache(db_path=str(tmp_path / 'cache.sqlite3'))
+    assert restarted.get(key) == {'recommendations': [1, 2]}
+    assert restarted.get(restarted.make_key('weekly_schedule', ('b',))) is None
+
+    stats = cache.get_stats()['by_kind']['time_slots']
+    assert (stats['hits'], stats['misses']) == (2, 1)
+    restarted_stats = restarted.get_stats()['by_kind']
+    assert restarted_stats['time_slots']['disk_hits'] == 1
+    assert restarted_stats['weekly_schedule']['misses'] == 1
+    cache.close()
+    restarted.close()
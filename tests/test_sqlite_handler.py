@@ -0,0 +1,68 @@
+# test_sqlite_handler.py
+"""SQLiteHandler: 저장/복원 왕복, upsert, 인덱스 조건 조회와 파이썬 필터의 결과 일치"""
+import random
+from datetime import datetime, timedelta, timezone
+
+from src.models.channel_model import ChannelAggregate
+from src.models.video_model import VideoData
+from src.storage.sqlite_handler import SQLiteHandler
+
+
+def make_videos(count: int, seed: int = 3):
+    rng = random.Random(seed)
+    start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    return [
+        VideoData(
+            video_id=f"vid{index:04d}", title=f"Biff and Chip {index}", description='한국어 설명 포함',
+            channel_id=f"UC{index % 7}", channel_title=f"Channel {index % 7}",
+            published_at=start + timedelta(hours=rng.randint(0, 20000)), duration='PT5M30S',
+            view_count=rng.randint(0, 100000), like_count=rng.randint(0, 1000), comment_count=0,
+            url=f"https://www.youtube.com/watch?v=vid{index:04d}", thumbnail_url='',
+            quality_score=rng.randint(0, 100), is_level1_content=rng.random() < 0.5,
+            learning_objectives=rng.sample(['phonics', 'alphabet', 'vocabulary'], rng.randint(0, 2))
+        )
+        for index in range(count)
+    ]
+
+
+def test_round_trip_and_upsert(tmp_path):
+    catalog = SQLiteHandler(str(tmp_path / 'catalog.sqlite3'))
+    videos = make_videos(50)
+    catalog.save_videos(videos, batch_size=7)
+    catalog.save_videos([videos[0].model_copy(update={'quality_score': 99, 'view_count': 1})])
+
+    assert catalog.count_videos() == 50
+    stored = catalog.get_video('vid0000')
+    assert (stored.quality_score, stored.view_count) == (99, 1)
+    assert catalog.get_video('vid0001') == videos[1]
+    assert catalog.get_video('missing') is None
+    catalog.close()
+
+
+def test_query_matches_python_filter(tmp_path):
+    catalog = SQLiteHandler(str(tmp_path / 'catalog.sqlite3'))
+    videos = make_videos(500)
+    catalog.save_videos(videos)
+    cutoff = datetime(2024, 1, 1, 9, tzinfo=timezone(timedelta(hours=9)))
+
+    result = catalog.query_videos(channel_id='UC3', min_quality_score=40, level1_only=True, published_after=cutoff)
+    expected = [video for video in videos if video.channel_id == 'UC3' and video.quality_score >= 40
+                and video.is_level1_content and video.published_at > cutoff]
+    assert sorted(video.video_id for video in result) == sorted(video.video_id for video in expected)
+    scores = [video.quality_score for video in result]
+    assert scores == sorted(scores, reverse=True)
+    assert len(catalog.query_videos(limit=10)) == 10
+    catalog.close()
+
+
+def test_channels_upsert(tmp_path):
+    catalog = SQLiteHandler(str(tmp_path / 'catalog.sqlite3'))
+    stats = ChannelAggregate('UC1', 'Oxford Owl')
+    stats.add('a', 80)
+    catalog.save_channels({'UC1': stats})
+    stats.add('b', 60)
+    catalog.save_channels({'UC1': stats})
+
+    rows = catalog.conn.execute("SELECT channel_id, video_count, avg_quality_score FROM channels").fetchall()
+    assert [tuple(row) for row in rows] == [('UC1', 2, 70.0)]
+    catalog.close()
@@ -0,0 +1,129 @@
+# test_time_slot_engine.py
+"""TimeSlotEngine: 구간 경계 맞춤, 자정을 넘는 구간, 길이 0 구간, 분 단위 전수 탐색과의 결과 일치"""
+import random
+
+import numpy as np
+import pytest
+
+from time_slot_engine import (
+    DAYS, SLOT_MINUTES, SLOTS_PER_DAY, TimeSlotEngine, day_indexes, energy_profile, interval_segments,
+    time_to_minutes, time_to_slot
+)
+
+
+def test_zero_length_busy_interval_blocks_nothing():
+    engine = TimeSlotEngine()
+    assert interval_segments('daily', '09:00', '09:00') == ()
+
+    with_empty = engine.free_masks([{'busy_times': [{'day': 'daily', 'start': '09:00', 'end': '09:00'}]}])
+    without = engine.free_masks([{}])
+    assert np.array_equal(with_empty, without)
+
+    result = engine.recommend({'busy_times': [{'day': 'daily', 'start': '09:00', 'end': '09:00'}]}, None, 20)
+    assert result['best_slot'] is not None
+
+
+def test_zero_length_parent_window_leaves_no_time():
+    engine = TimeSlotEngine()
+    free = engine.free_masks([{'parent_available': [{'day': 'daily', 'start': '18:00', 'end': '18:00'}]}])
+    assert not free.any()
+
+
+def test_interval_crossing_midnight_splits_into_next_day():
+    assert interval_segments('sunday', '22:00', '01:00') == (
+        (6, time_to_slot('22:00'), SLOTS_PER_DAY), (0, 0, time_to_slot('01:00'))
+    )
+
+
+def test_off_grid_busy_end_rounds_up():
+    engine = TimeSlotEngine()
+    schedule = {'busy_times': [{'day': 'daily', 'start': '07:00', 'end': '15:02'}], 'latest_time': '15:25'}
+    result = engine.recommend(schedule, None, 20)
+    assert (result['best_slot']['start'], result['best_slot']['end']) == ('15:05', '15:25')
+
+
+def test_rejects_sessions_longer_than_a_day():
+    with pytest.raises(ValueError):
+        TimeSlotEngine().recommend({}, None, 24 * 60 + 5)
+
+
+def random_time(rng: random.Random) -> str:
+    return f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}"
+
+
+def random_request(rng: random.Random):
+    days = ['daily', 'weekdays', 'weekends'] + DAYS
+    schedule = {
+        'busy_times': [{'day': rng.choice(days), 'start': random_time(rng), 'end': random_time(rng)}
+                       for _ in range(rng.randint(0, 4))],
+        'buffer_minutes': rng.choice([0, 0, 5, 7, 15])
+    }
+    if rng.random() < 0.5:
+        schedule['parent_available'] = [{'day': rng.choice(days), 'start': random_time(rng), 'end': random_time(rng)}
+                                        for _ in range(rng.randint(1, 3))]
+    energy = {period: round(rng.random(), 2) for period in ['morning', 'afternoon', 'evening'] if rng.random() < 0.7}
+    return {'family_schedule': schedule, 'child_energy_pattern': energy,
+            'learning_duration': rng.choice([5, 12, 20, 30, 45, 90])}
+
+
+def minute_masks(schedule):
+    """분 단위 (7 x 1440) 바쁜 / 부모 가능 마스크 (자정을 넘는 구간은 다음 날로)"""
+    buffer = -(-schedule.get('buffer_minutes', 0) // SLOT_MINUTES) * SLOT_MINUTES
+    busy = np.zeros((7, 24 * 60), dtype=bool)
+    for interval in schedule['busy_times']:
+        start, end = time_to_minutes(interval['start']), time_to_minutes(interval['end'])
+        if start == end:
+            continue
+        if end < start:
+            end += 24 * 60
+        for day in day_indexes(interval['day']):
+            for minute in range(max(start - buffer, 0), end + buffer):
+                busy[(day + minute // (24 * 60)) % 7, minute % (24 * 60)] = True
+
+    available = np.ones((7, 24 * 60), dtype=bool)
+    if schedule.get('parent_available'):
+        available[:] = False
+        for interval in schedule['parent_available']:
+            start, end = time_to_minutes(interval['start']), time_to_minutes(interval['end'])
+            if start == end:
+                continue
+            if end < start:
+                end += 24 * 60
+            for day in day_indexes(interval['day']):
+                for minute in range(start, end):
+                    available[(day + minute // (24 * 60)) % 7, minute % (24 * 60)] = True
+    return busy, available
+
+
+def brute_force_daily_best(request, earliest='07:00', latest='20:00'):
+    """요일별로 모든 5분 시작 위치를 분 단위로 검사한 최고 평균 에너지 (없으면 None)"""
+    length = -(-request['learning_duration'] // SLOT_MINUTES)
+    busy, available = minute_masks(request['family_schedule'])
+    energy = energy_profile(request['child_energy_pattern']).astype(np.float64)
+    best = {}
+    for day in range(7):
+        scores = {}
+        for start in range(time_to_slot(earliest, round_up=True), time_to_slot(latest) - length + 1):
+            minutes = slice(start * SLOT_MINUTES, (start + length) * SLOT_MINUTES)
+            if not busy[day, minutes].any() and available[day, minutes].all():
+                scores[start] = energy[start:start + length].mean()
+        best[DAYS[day]] = scores
+    return best
+
+
+def test_matches_minute_level_brute_force():
+    rng = random.Random(17)
+    requests = [random_request(rng) for _ in range(300)]
+    results = TimeSlotEngine().recommend_batch(requests)
+
+    for request, result in zip(requests, results):
+        for day, scores in brute_force_daily_best(request).items():
+            slot = result['daily_best'][day]
+            if not scores:
+                assert slot is None, (request, day)
+                continue
+            start = time_to_slot(slot['start'])
+            # 선택한 창이 실제로 가능하고, 그 점수가 전수 탐색의 최고 점수와 같음 (동점이면 위치는 다를 수 있음)
+            assert start in scores, (request, day)
+            assert abs(scores[start] - max(scores.values())) < 1e-5
+            assert abs(slot['energy_score'] - max(scores.values())) < 1e-3
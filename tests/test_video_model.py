@@ -0,0 +1,33 @@
+# test_video_model.py
+"""VideoData: 길이 파싱과 파생 필드, API 응답/JSON에서 만든 객체의 일치, 검증 유지"""
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from src.collectors.youtube_collector import YouTubeCollector
+from src.models.video_model import VideoData, parse_duration
+from src.storage.json_handler import video_to_json_dict
+
+
+@pytest.mark.parametrize('duration, seconds', [
+    ('PT4M13S', 253), ('PT1H2M3S', 3723), ('PT45S', 45), ('PT2H', 7200), ('PT0S', 0), ('P1D', 0)
+])
+def test_parse_duration(duration, seconds):
+    assert parse_duration(duration) == seconds
+
+
+def test_api_response_builds_validated_video_with_derived_fields(youtube_api):
+    youtube_api.add_video('abc', 'Biff and Chip', 'Oxford Reading Tree', duration='PT4M13S', views=1234, likes=56)
+    video = YouTubeCollector('test-key').get_video_details('abc')
+
+    assert video.duration_seconds == 253
+    assert video.url == 'https://www.youtube.com/watch?v=abc'
+    assert video.published_at == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert (video.view_count, video.like_count, video.comment_count) == (1234, 56, 0)
+    assert VideoData.model_validate_json(VideoData(**video_to_json_dict(video)).model_dump_json()) == video
+
+
+def test_invalid_payload_is_still_rejected():
+    with pytest.raises(ValidationError):
+        VideoData.model_validate_json(b'{"video_id": "abc", "title": "Biff", "view_count": "many"}')
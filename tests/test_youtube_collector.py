@@ -0,0 +1,95 @@
+# test_youtube_collector.py
+"""YouTubeCollector: 상세 조회 배치, 페이지 순회, 증분 수집의 조기 종료 (대역 API 클라이언트 사용)"""
+from src.collectors.youtube_collector import VideoDetailsBuffer, YouTubeCollector
+
+
+def add_uploads(youtube_api, channel_id: str, count: int):
+    """최신순으로 count개 업로드 (uploads[channel_id][0]이 가장 최근)"""
+    for index in range(count):
+        youtube_api.add_video(f"{channel_id}-{index:03d}", f"Biff and Chip story {index}", channel_id=channel_id,
+                              published_at=f"2024-01-01T00:{index // 60:02d}:{index % 60:02d}Z")
+
+
+def test_buffer_releases_only_full_batches_until_flushed():
+    buffer = VideoDetailsBuffer(batch_size=3)
+    buffer.stage(['a', 'b'], 'k1')
+    assert buffer.take_full_batches() == []
+    buffer.stage(['c', 'd'], 'k2')
+    assert buffer.take_full_batches() == [[('a', 'k1'), ('b', 'k1'), ('c', 'k2')]]
+    assert buffer.take_all() == [[('d', 'k2')]]
+    assert len(buffer) == 0
+
+
+def test_staged_batch_returns_videos_grouped_by_source(youtube_api):
+    for video_id in ['a', 'b', 'c']:
+        youtube_api.add_video(video_id, f"Biff and Chip {video_id}")
+    videos = YouTubeCollector('test-key').fetch_staged_batch([('a', 'k1'), ('b', 'k2'), ('c', 'k1'), ('gone', 'k2')])
+
+    assert {source: [video.video_id for video in group] for source, group in videos.items()} == \
+        {'k1': ['a', 'c'], 'k2': ['b']}
+    assert youtube_api.calls == [('videos', {'part': 'snippet,statistics,contentDetails', 'id': 'a,b,c,gone'})]
+
+
+def test_known_upload_stops_paging_without_prefetching_the_next_page(youtube_api):
+    add_uploads(youtube_api, 'UCa', 200)
+    uploads = youtube_api.uploads['UCa']
+    collector = YouTubeCollector('test-key')
+    collector.known_video_ids = set(uploads[60:])
+
+    video_ids = collector.get_channel_video_ids('UCa', max_results=150)
+
+    assert video_ids == uploads[:60]
+    # 50개씩 2페이지에서 멈춤 (3페이지는 미리 조회하지도 않음)
+    assert youtube_api.count('playlistItems') == 2
+    assert ('channel', 'UCa') not in collector.incomplete_sources
+
+
+def test_published_after_watermark_stops_paging(youtube_api):
+    from datetime import datetime, timezone
+
+    add_uploads(youtube_api, 'UCb', 200)
+    uploads = youtube_api.uploads['UCb']
+    collector = YouTubeCollector('test-key')
+
+    # uploads[i]의 게시 시각은 199 - i초
+    watermark = datetime(2024, 1, 1, 0, 2, 19, tzinfo=timezone.utc)  # 139초 -> uploads[60]
+    video_ids = collector.get_channel_video_ids('UCb', max_results=150, published_after=watermark)
+
+    assert video_ids == uploads[:60]
+    assert youtube_api.count('playlistItems') == 2
+
+
+def test_reaching_the_cap_marks_the_channel_incomplete(youtube_api):
+    add_uploads(youtube_api, 'UCc', 120)
+    collector = YouTubeCollector('test-key')
+
+    video_ids = collector.get_channel_video_ids('UCc', max_results=70)
+
+    assert video_ids == youtube_api.uploads['UCc'][:70]
+    assert [params['maxResults'] for endpoint, params in youtube_api.calls if endpoint == 'playlistItems'] == [50, 20]
+    assert ('channel', 'UCc') in collector.incomplete_sources
+
+
+def test_search_follows_page_tokens_up_to_max_results(youtube_api):
+    for index in range(130):
+        youtube_api.add_video(f"vid{index:03d}", f"Biff and Chip {index}", keywords=('ort',))
+    collector = YouTubeCollector('test-key')
+
+    video_ids = collector.search_video_ids('ort', max_results=120)
+
+    assert video_ids == youtube_api.search_results['ort'][:120]
+    searches = [params for endpoint, params in youtube_api.calls if endpoint == 'search']
+    assert [(params['maxResults'], params.get('pageToken')) for params in searches] == \
+        [(50, None), (50, '50'), (20, '100')]
+    assert ('keyword', 'ort') in collector.incomplete_sources
+
+
+def test_search_pages_stop_at_quota_and_at_last_page(youtube_api):
+    for index in range(70):
+        youtube_api.add_video(f"vid{index:03d}", f"Biff and Chip {index}", keywords=('ort',))
+    collector = YouTubeCollector('test-key')
+
+    assert [len(page) for page in collector.iter_search_pages('ort', max_items=None, max_quota=100)] == [50]
+    assert [len(page) for page in collector.iter_search_pages('ort', max_items=None)] == [50, 20]
+    assert [item['id']['videoId'] for item in collector.iter_search_results('ort', max_items=None)] == \
+        youtube_api.search_results['ort']
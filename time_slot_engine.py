@@ -0,0 +1,336 @@
+# time_slot_engine.py
+"""5분 단위 시간 슬롯 엔진 (가족 일정 x 아이 컨디션 -> 최적 학습 시간)
+
+요일별 하루를 288개 슬롯으로 나눈 NumPy 배열로 표현한다.
+- 바쁜 구간/부모 가능 구간은 구간 경계 +1/-1 누적합으로 마스크를 만들고 비트 연산으로 교차
+- 학습 시간(L슬롯) 창의 가능 여부와 평균 에너지는 누적합 차이로 모든 시작 위치를 한 번에 계산
+- 여러 가족을 (가족 x 7 x 288) 배열로 묶어 한 번에 평가
+
+family_schedule 예:
+    {
+        "busy_times": [{"day": "weekdays", "start": "08:30", "end": "15:00"},
+                       {"day": "saturday", "start": "10:00", "end": "12:00"}],
+        "parent_available": [{"day": "daily", "start": "07:00", "end": "21:00"}],  # 없으면 제한 없음
+        "earliest_time": "07:00", "latest_time": "20:00",  # 기본값
+        "buffer_minutes": 10  # 바쁜 일정 앞뒤 여유 시간
+    }
+
+child_energy_pattern 예 (시각 키는 다음 키까지 적용, 지정하지 않은 시간은 default):
+    {"morning": 0.9, "afternoon": 0.6, "evening": 0.3}
+    {"hourly": {"7": 0.6, "9:30": 0.9, "12": 0.4}, "default": 0.5}
+"""
+import itertools
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from solution_cache import SolutionCache
+
+SLOT_MINUTES = 5
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+DAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+
+_DAY_GROUPS = {
+    'daily': tuple(range(7)), 'everyday': tuple(range(7)), '매일': tuple(range(7)),
+    'weekdays': tuple(range(5)), '평일': tuple(range(5)),
+    'weekends': (5, 6), '주말': (5, 6)
+}
+_KOREAN_DAYS = ['월', '화', '수', '목', '금', '토', '일']
+
+# 이름으로 지정하는 시간대 (시작, 끝 시각)
+ENERGY_PERIODS = {
+    'morning': ('06:00', '12:00'),
+    'afternoon': ('12:00', '18:00'),
+    'evening': ('18:00', '22:00')
+}
+DEFAULT_ENERGY = 0.5
+
+
+@lru_cache(maxsize=1024)
+def time_to_minutes(value: Any) -> int:
+    """'HH:MM' 또는 시(hour) 숫자 -> 자정부터의 분 (24:00 = 1440)"""
+    text = str(value).strip()
+    hour, _, minute = text.partition(':')
+    minutes = int(hour) * 60 + (int(minute) if minute else 0)
+    if not 0 <= minutes <= 24 * 60:
+        raise ValueError(f"잘못된 시각: {value}")
+    return minutes
+
+
+def time_to_slot(value: Any, round_up: bool = False) -> int:
+    """'HH:MM' 또는 시(hour) 숫자 -> 슬롯 번호 (24:00 = 288)
+
+    5분 단위가 아닌 시각은 기본적으로 내림, round_up이면 올림
+    (구간을 넓히는 쪽은 바깥으로, 좁히는 쪽은 안쪽으로 맞춰 일정과 겹치지 않게 함)
+    """
+    minutes = time_to_minutes(value)
+    return -(-minutes // SLOT_MINUTES) if round_up else minutes // SLOT_MINUTES
+
+
+@lru_cache(maxsize=SLOTS_PER_DAY + 1)
+def slot_to_time(slot: int) -> str:
+    minutes = slot * SLOT_MINUTES
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+@lru_cache(maxsize=256)
+def day_indexes(day: Any) -> Tuple[int, ...]:
+    """요일 이름(영문/한글), 0-6 숫자, daily/weekdays/weekends -> 요일 번호 (월요일 = 0)"""
+    if isinstance(day, int):
+        if not 0 <= day < 7:
+            raise ValueError(f"잘못된 요일: {day}")
+        return (day,)
+    text = str(day).strip().lower()
+    if text in _DAY_GROUPS:
+        return _DAY_GROUPS[text]
+    if text.isdigit():
+        return day_indexes(int(text))
+    for index, name in enumerate(DAYS):
+        if text == name or text == name[:3]:
+            return (index,)
+    if text.removesuffix('요일') in _KOREAN_DAYS:
+        return (_KOREAN_DAYS.index(text.removesuffix('요일')),)
+    raise ValueError(f"잘못된 요일: {day}")
+
+
+@lru_cache(maxsize=4096)
+def interval_segments(day: Any, start: Any, end: Any, buffer_slots: int = 0,
+                      inner: bool = False) -> Tuple[Tuple[int, int, int], ...]:
+    """일정 구간 -> (요일, 시작 슬롯, 끝 슬롯) 조각 (앞뒤 여유 시간 포함, 자정을 넘으면 다음 날로 분할)
+
+    5분 단위가 아닌 경계는 구간을 덮도록 바깥으로 맞춘다 (바쁜 구간).
+    inner이면 구간 안쪽으로 맞춘다 (부모 가능 구간처럼 그 안에서만 학습할 수 있는 구간).
+    시작과 끝이 같은 구간은 길이가 0이므로 조각을 만들지 않는다.
+    """
+    start_minutes, end_minutes = time_to_minutes(start), time_to_minutes(end)
+    if start_minutes == end_minutes:
+        return ()
+
+    start_slot = max(time_to_slot(start, round_up=inner) - buffer_slots, 0)
+    end_slot = time_to_slot(end, round_up=not inner) + buffer_slots
+    segments = []
+    for index in day_indexes(day):
+        if end_minutes < start_minutes:
+            segments.append((index, start_slot, SLOTS_PER_DAY))
+            segments.append(((index + 1) % 7, 0, end_slot))
+        else:
+            segments.append((index, start_slot, min(end_slot, SLOTS_PER_DAY)))
+            if end_slot > SLOTS_PER_DAY:
+                segments.append(((index + 1) % 7, 0, end_slot - SLOTS_PER_DAY))
+    # 안쪽으로 맞추면서 비어 버린 조각은 버림
+    return tuple(segment for segment in segments if segment[2] > segment[1])
+
+
+def _hashable(value: Any) -> Any:
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), _hashable(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=4096)
+def _energy_profile(pattern: Tuple) -> np.ndarray:
+    energy_pattern = {key: (dict(value) if isinstance(value, tuple) else value) for key, value in pattern}
+    profile = np.full(SLOTS_PER_DAY, float(energy_pattern.get('default', DEFAULT_ENERGY)), dtype=np.float32)
+
+    for period, (start, end) in ENERGY_PERIODS.items():
+        if period in energy_pattern:
+            profile[time_to_slot(start):time_to_slot(end)] = float(energy_pattern[period])
+
+    points = dict(energy_pattern.get('hourly') or {})
+    points.update({key: value for key, value in energy_pattern.items()
+                   if key not in ENERGY_PERIODS and key not in ('hourly', 'default')})
+    if points:
+        ordered = sorted((time_to_slot(key), float(value)) for key, value in points.items())
+        for (start, value), (end, _) in zip(ordered, ordered[1:] + [(SLOTS_PER_DAY, 0.0)]):
+            profile[start:end] = value
+
+    profile.setflags(write=False)
+    return profile
+
+
+def energy_profile(child_energy_pattern: Optional[Dict[str, Any]]) -> np.ndarray:
+    """아이 컨디션 패턴 -> 슬롯별 에너지 (288,) (같은 패턴은 캐시 재사용)"""
+    return _energy_profile(_hashable(child_energy_pattern or {}))
+
+
+class TimeSlotEngine:
+    """가족 일정과 아이 컨디션으로 요일별 최적 학습 시간대를 찾는 엔진
+
+    사용 예:
+        engine = TimeSlotEngine()
+        engine.recommend(family_schedule, child_energy_pattern, learning_duration=20)
+        engine.recommend_batch([{'family_schedule': ..., 'child_energy_pattern': ...}, ...])
+
+    cache(SolutionCache)를 주면 정규화한 요청이 같은 가족의 결과를 계산 없이 재사용
+    """
+
+    def __init__(self, earliest_time: str = '07:00', latest_time: str = '20:00', chunk_size: int = 2048,
+                 cache: Optional['SolutionCache'] = None):
+        self.earliest_time = earliest_time
+        self.latest_time = latest_time
+        self.chunk_size = chunk_size
+        self.cache = cache
+
+    def recommend(self, family_schedule: Dict[str, Any], child_energy_pattern: Optional[Dict[str, Any]] = None,
+                  learning_duration: int = 20, top_n: int = 3) -> Dict[str, Any]:
+        """가족 1곳의 추천 결과 (recommend_batch와 같은 형식)"""
+        return self.recommend_batch([{
+            'family_schedule': family_schedule,
+            'child_energy_pattern': child_energy_pattern,
+            'learning_duration': learning_duration
+        }], top_n=top_n)[0]
+
+    def recommend_batch(self, requests: Sequence[Dict[str, Any]], top_n: int = 3) -> List[Dict[str, Any]]:
+        """여러 가족을 한 번에 평가
+
+        requests: {'family_schedule', 'child_energy_pattern', 'learning_duration'} 목록
+        반환: 요청 순서대로 {'learning_duration', 'best_slot', 'recommendations', 'daily_best'}
+              recommendations는 요일별 최적 시간대를 점수 내림차순으로 top_n개
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        keys: List[Optional[Tuple]] = [None] * len(requests)
+
+        # 학습 시간(창 길이)이 같은 요청끼리 묶어 평가 (캐시에 있는 요청은 제외)
+        by_length: Dict[int, List[int]] = {}
+        for index, request in enumerate(requests):
+            if self.cache is not None:
+                keys[index] = self.cache.recommendation_key(request, top_n, self.earliest_time, self.latest_time)
+                results[index] = self.cache.get(keys[index])
+                if results[index] is not None:
+                    continue
+            duration = int(request.get('learning_duration') or 20)
+            if duration <= 0:
+                raise ValueError(f"학습 시간은 0보다 커야 합니다: {duration}")
+            if duration > 24 * 60:
+                raise ValueError(f"학습 시간은 하루(1440분)를 넘을 수 없습니다: {duration}")
+            by_length.setdefault(-(-duration // SLOT_MINUTES), []).append(index)
+
+        for length, indexes in by_length.items():
+            for start in range(0, len(indexes), self.chunk_size):
+                chunk = indexes[start:start + self.chunk_size]
+                best_starts, best_scores = self._evaluate([requests[i] for i in chunk], length)
+                for row, index in enumerate(chunk):
+                    results[index] = self._format(
+                        int(requests[index].get('learning_duration') or 20), length,
+                        best_starts[row], best_scores[row], top_n
+                    )
+                    if self.cache is not None:
+                        self.cache.put(keys[index], results[index])
+        return results
+
+    def free_masks(self, schedules: Sequence[Dict[str, Any]]) -> np.ndarray:
+        """학습 가능한 슬롯 마스크 (가족 수 x 7 x 288)"""
+        count = len(schedules)
+        earliest = np.empty(count, dtype=np.int16)
+        latest = np.empty(count, dtype=np.int16)
+        busy_families: List[int] = []
+        busy_segments: List[Tuple[Tuple[int, int, int], ...]] = []
+        available_families: List[int] = []
+        available_segments: List[Tuple[Tuple[int, int, int], ...]] = []
+
+        for family, schedule in enumerate(schedules):
+            buffer_slots = -(-int(schedule.get('buffer_minutes') or 0) // SLOT_MINUTES)
+            earliest[family] = time_to_slot(schedule.get('earliest_time') or self.earliest_time, round_up=True)
+            latest[family] = time_to_slot(schedule.get('latest_time') or self.latest_time)
+
+            for interval in schedule.get('busy_times') or []:
+                busy_families.append(family)
+                busy_segments.append(interval_segments(interval.get('day', 'daily'), interval['start'],
+                                                       interval['end'], buffer_slots))
+            for interval in schedule.get('parent_available') or []:
+                available_families.append(family)
+                available_segments.append(interval_segments(interval.get('day', 'daily'), interval['start'],
+                                                            interval['end'], inner=True))
+
+        slots = np.arange(SLOTS_PER_DAY, dtype=np.int16)
+        free = (slots >= earliest[:, None]) & (slots < latest[:, None])
+        free = np.repeat(free[:, None, :], 7, axis=1)
+        free &= ~self._interval_mask(busy_families, busy_segments, count)
+
+        if available_families:
+            # 부모 가능 구간을 지정한 가족만 그 구간과 교차
+            restricted, rows = np.unique(available_families, return_inverse=True)
+            free[restricted] &= self._interval_mask(rows.tolist(), available_segments, len(restricted))
+        return free
+
+    @staticmethod
+    def _interval_mask(families: List[int], segments: List[Tuple[Tuple[int, int, int], ...]],
+                       count: int) -> np.ndarray:
+        """(가족, 구간 조각) 목록 -> (count x 7 x 288) 마스크 (경계에 +1/-1을 더한 뒤 누적합 > 0)"""
+        boundaries = np.zeros((count * 7, SLOTS_PER_DAY + 1), dtype=np.int16)
+        if families:
+            lengths = np.fromiter(map(len, segments), dtype=np.int64, count=len(segments))
+            pieces = np.array(list(itertools.chain.from_iterable(segments)), dtype=np.int64).reshape(-1, 3)
+            rows = np.repeat(np.asarray(families, dtype=np.int64) * 7, lengths) + pieces[:, 0]
+            np.add.at(boundaries, (rows, pieces[:, 1]), 1)
+            np.add.at(boundaries, (rows, pieces[:, 2]), -1)
+        return (np.cumsum(boundaries[:, :SLOTS_PER_DAY], axis=1) > 0).reshape(count, 7, SLOTS_PER_DAY)
+
+    @staticmethod
+    def _window_free(free: np.ndarray, length: int) -> np.ndarray:
+        """시작 슬롯별로 [s, s + length) 창 전체가 비어 있는지 (..., 288 - length + 1)
+
+        길이 1, 2, 4, ...의 창 결과를 AND로 합쳐 O(log length)번의 비트 연산으로 계산
+        """
+        result, result_length = None, 0
+        power, power_length = free, 1
+        remaining = length
+        while True:
+            if remaining & 1:
+                if result is None:
+                    result, result_length = power, power_length
+                else:
+                    size = result.shape[-1] - power_length
+                    result = result[..., :size] & power[..., result_length:result_length + size]
+                    result_length += power_length
+            remaining >>= 1
+            if not remaining:
+                return result
+            power = power[..., :-power_length] & power[..., power_length:]
+            power_length *= 2
+
+    def _evaluate(self, requests: Sequence[Dict[str, Any]], length: int) -> Tuple[np.ndarray, np.ndarray]:
+        """요일별 최적 시작 슬롯과 평균 에너지 (가족 수 x 7), 가능한 창이 없으면 점수 -inf"""
+        free = self.free_masks([request.get('family_schedule') or {} for request in requests])
+        energy = np.stack([energy_profile(request.get('child_energy_pattern')) for request in requests])
+
+        # 창 [s, s + length)가 모두 비어 있어야 하고, 점수는 창의 평균 에너지
+        feasible = self._window_free(free, length)
+        energy_prefix = np.zeros((len(requests), SLOTS_PER_DAY + 1), dtype=np.float32)
+        np.cumsum(energy, axis=1, out=energy_prefix[:, 1:])
+        window_energy = (energy_prefix[:, length:] - energy_prefix[:, :-length]) / length
+
+        scores = np.where(feasible, window_energy[:, None, :], np.float32(-np.inf))
+        best_starts = scores.argmax(axis=2)
+        best_scores = np.take_along_axis(scores, best_starts[:, :, None], axis=2)[:, :, 0]
+        return best_starts, best_scores
+
+    @staticmethod
+    def _format(duration: int, length: int, best_starts: np.ndarray, best_scores: np.ndarray,
+                top_n: int) -> Dict[str, Any]:
+        daily_best: Dict[str, Optional[Dict[str, Any]]] = {}
+        slots = []
+        for day, (start, score) in enumerate(zip(best_starts.tolist(), best_scores.tolist())):
+            if score == float('-inf'):
+                daily_best[DAYS[day]] = None
+                continue
+            slot = {
+                'day': DAYS[day],
+                'start': slot_to_time(start),
+                'end': slot_to_time(start + length),
+                'energy_score': round(score, 3)
+            }
+            daily_best[DAYS[day]] = slot
+            slots.append(slot)
+
+        slots.sort(key=lambda slot: -slot['energy_score'])
+        return {
+            'learning_duration': duration,
+            'best_slot': slots[0] if slots else None,
+            'recommendations': slots[:top_n],
+            'daily_best': daily_best
+        }